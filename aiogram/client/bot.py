@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import pathlib
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from types import TracebackType
 from typing import (
@@ -275,7 +276,18 @@ from ..types import (
     UserProfilePhotos,
     WebhookInfo,
 )
+from .broadcast import (
+    DEFAULT_BROADCAST_RATE,
+    BaseBroadcastCheckpoint,
+    BlockedCallback,
+    Broadcast,
+    BroadcastStats,
+    FailedCallback,
+    MethodFactory,
+    ProgressCallback,
+)
 from .default import Default, DefaultBotProperties
+from .download import RangesNotSupported, copy_local_file, download_ranges, get_parts
 from .session.aiohttp import AiohttpSession
 from .session.base import BaseSession
 
@@ -422,6 +434,8 @@ class Bot:
         timeout: int = 30,
         chunk_size: int = 65536,
         seek: bool = True,
+        file_size: int | None = None,
+        connections: int = 1,
     ) -> BinaryIO | None:
         """
         Download file by file_path to destination.
@@ -429,15 +443,43 @@ class Bot:
         If you want to automatically create destination (:class:`io.BytesIO`) use default
         value of destination and handle result of this method.
 
+        Large files downloaded to the file system can be split into parts downloaded concurrently
+        by ranged requests, when the server doesn't support them the file is downloaded as usual.
+        In local mode the file is copied to the destination path by the operating system.
+
         :param file_path: File path on Telegram server (You can get it from :obj:`aiogram.types.File`)
         :param destination: Filename, file path or instance of :class:`io.IOBase`. For e.g. :class:`io.BytesIO`, defaults to None
         :param timeout: Total timeout in seconds, defaults to 30
         :param chunk_size: File chunks size, defaults to 64 kb
         :param seek: Go to start of file when downloading is finished. Used only for destination with :class:`typing.BinaryIO` type, defaults to True
+        :param file_size: File size in bytes, required to download the file in parts
+        :param connections: Maximum number of parts downloaded concurrently, defaults to 1
         """
         if destination is None:
             destination = io.BytesIO()
 
+        if isinstance(destination, (str, pathlib.Path)):
+            if self.session.api.is_local:
+                await copy_local_file(
+                    self.session.api.wrap_local_file.to_local(file_path), destination
+                )
+                return None
+            if connections > 1 and file_size and len(get_parts(file_size, connections)) > 1:
+                try:
+                    await download_ranges(
+                        session=self.session,
+                        url=self.session.api.file_url(self.__token, file_path),
+                        destination=destination,
+                        file_size=file_size,
+                        connections=connections,
+                        timeout=timeout,
+                        chunk_size=chunk_size,
+                    )
+                    return None
+                except RangesNotSupported:
+                    # The file is downloaded again by a single request
+                    pass
+
         close_stream = False
         if self.session.api.is_local:
             stream = self.__aiofiles_reader(
@@ -471,6 +513,7 @@ class Bot:
         timeout: int = 30,
         chunk_size: int = 65536,
         seek: bool = True,
+        connections: int = 1,
     ) -> BinaryIO | None:
         """
         Download file by file_id or Downloadable object to destination.
@@ -483,6 +526,7 @@ class Bot:
         :param timeout: Total timeout in seconds, defaults to 30
         :param chunk_size: File chunks size, defaults to 64 kb
         :param seek: Go to start of file when downloading is finished. Used only for destination with :class:`typing.BinaryIO` type, defaults to True
+        :param connections: Maximum number of parts of the file downloaded concurrently, defaults to 1
         """
         if isinstance(file, str):
             file_id = file
@@ -501,9 +545,109 @@ class Bot:
         file_path = cast(str, file_.file_path)
 
         return await self.download_file(
-            file_path, destination=destination, timeout=timeout, chunk_size=chunk_size, seek=seek
+            file_path,
+            destination=destination,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            seek=seek,
+            file_size=file_.file_size,
+            connections=connections,
         )
 
+    async def download_many(
+        self,
+        files: Iterable[tuple[str | Downloadable, BinaryIO | pathlib.Path | str | None]],
+        concurrency: int = 4,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        connections: int = 1,
+        return_exceptions: bool = False,
+    ) -> list[BinaryIO | BaseException | None]:
+        """
+        Download many files concurrently, at most :code:`concurrency` files at the same time.
+
+        :param files: Pairs of the file_id or Downloadable object and the destination
+            accepted by :meth:`download`
+        :param concurrency: Maximum number of files downloaded at the same time, defaults to 4
+        :param timeout: Total timeout of each file in seconds, defaults to 30
+        :param chunk_size: File chunks size, defaults to 64 kb
+        :param connections: Maximum number of parts of each file downloaded concurrently, defaults to 1
+        :param return_exceptions: Return errors in the results instead of raising the first one
+            like :func:`asyncio.gather` does, defaults to False
+        :return: Results of :meth:`download` in the order of the files
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(
+            file: str | Downloadable,
+            destination: BinaryIO | pathlib.Path | str | None,
+        ) -> BinaryIO | None:
+            async with semaphore:
+                return await self.download(
+                    file,
+                    destination=destination,
+                    timeout=timeout,
+                    chunk_size=chunk_size,
+                    connections=connections,
+                )
+
+        tasks = [asyncio.create_task(download(file, destination)) for file, destination in files]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # Don't leave the downloads running in background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def broadcast(
+        self,
+        method_factory: MethodFactory,
+        chat_ids: Iterable[ChatIdUnion] | AsyncIterable[ChatIdUnion],
+        rate: float = DEFAULT_BROADCAST_RATE,
+        concurrency: int = 50,
+        max_retries: int = 3,
+        checkpoint: BaseBroadcastCheckpoint | None = None,
+        interval: float = 10.0,
+        on_blocked: BlockedCallback | None = None,
+        on_failed: FailedCallback | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> BroadcastStats:
+        """
+        Send the request to many recipients under the global rate limit of the bot.
+
+        Flood control errors pause all requests for the requested time and are retried,
+        recipients who blocked the bot are reported to :code:`on_blocked`,
+        other Telegram errors are reported to :code:`on_failed` and don't stop the broadcast.
+
+        :param method_factory: Creates the request to the recipient,
+            for example :code:`lambda chat_id: SendMessage(chat_id=chat_id, text="Hello")`
+        :param chat_ids: Recipients, the order should be the same when the broadcast is resumed
+        :param rate: Maximum number of requests per second, defaults to 25
+        :param concurrency: Maximum number of requests sent at the same time, defaults to 50
+        :param max_retries: Maximum number of retries after the flood control error, defaults to 3
+        :param checkpoint: Storage of the progress, the broadcast is resumed from the saved position
+        :param interval: Interval in seconds between the progress reports and checkpoints
+        :param on_blocked: Called for the recipients who blocked the bot
+        :param on_failed: Called for the requests failed with other Telegram errors
+        :param on_progress: Called with the progress of the broadcast every :code:`interval`
+        :return: Final progress of the broadcast
+        """
+        return await Broadcast(
+            bot=self,
+            method_factory=method_factory,
+            chat_ids=chat_ids,
+            rate=rate,
+            concurrency=concurrency,
+            max_retries=max_retries,
+            checkpoint=checkpoint,
+            interval=interval,
+            on_blocked=on_blocked,
+            on_failed=on_failed,
+            on_progress=on_progress,
+        ).run()
+
     async def __call__(self, method: TelegramMethod[T], request_timeout: int | None = None) -> T:
         """
         Call API method
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiogram import loggers
+from aiogram.client.session.middlewares.flood_control import TokenBucket
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.types import ChatIdUnion
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+# Telegram allows about 30 messages per second for the broadcasts,
+# the rest is left for the regular requests of the bot
+DEFAULT_BROADCAST_RATE = 25.0
+
+MethodFactory = Callable[[ChatIdUnion], TelegramMethod[Any]]
+BlockedCallback = Callable[[ChatIdUnion], Awaitable[None]]
+FailedCallback = Callable[[ChatIdUnion, TelegramAPIError], Awaitable[None]]
+ProgressCallback = Callable[["BroadcastStats"], Awaitable[None]]
+
+
+class BaseBroadcastCheckpoint(ABC):
+    """
+    Base class for storages of the broadcast progress
+    """
+
+    @abstractmethod
+    async def load(self) -> int:
+        """
+        Get the number of recipients processed by the previous run
+
+        :return: Position of the first recipient that is not processed yet, 0 for the new broadcast
+        """
+
+    @abstractmethod
+    async def save(self, position: int) -> None:
+        """
+        Save the progress of the broadcast
+
+        :param position: All recipients before this position are processed
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """
+        Close storage (database connection, file or etc.)
+        """
+
+
+class MemoryBroadcastCheckpoint(BaseBroadcastCheckpoint):
+    """
+    Checkpoint that keeps the progress in memory,
+    allows to resume the broadcast failed with the exception within the same process
+    """
+
+    def __init__(self) -> None:
+        self.position = 0
+
+    async def load(self) -> int:
+        return self.position
+
+    async def save(self, position: int) -> None:
+        self.position = position
+
+
+class FileBroadcastCheckpoint(BaseBroadcastCheckpoint):
+    """
+    Checkpoint that keeps the progress in a JSON file.
+
+    The file is replaced atomically on each save, so it is never left
+    partially written when the process is killed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        :param path: path to the JSON file, is created on the first save
+        """
+        self.path = Path(path)
+
+    def _read(self) -> int:
+        try:
+            with self.path.open() as f:
+                return int(json.load(f)["position"])
+        except FileNotFoundError:
+            return 0
+
+    def _write(self, position: int) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({"position": position}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.path)
+
+    async def load(self) -> int:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, position: int) -> None:
+        await asyncio.to_thread(self._write, position)
+
+
+@dataclass(frozen=True)
+class BroadcastStats:
+    """
+    Snapshot of the broadcast progress
+    """
+
+    position: int
+    """All recipients before this position are processed (including the skipped ones)"""
+    skipped: int
+    """Number of the recipients processed by the previous runs and skipped by this run"""
+    sent: int
+    """Number of the successfully sent requests"""
+    blocked: int
+    """Number of the recipients who blocked the bot or can't be reached by the bot anymore"""
+    failed: int
+    """Number of the requests failed with other errors"""
+    retries: int
+    """Number of the requests repeated after the flood control error"""
+    in_flight: int
+    """Number of the requests that are being sent right now"""
+    elapsed: float
+    """Time since the start of this run in seconds"""
+
+    @property
+    def throughput(self) -> float:
+        """
+        Number of the sent requests per second
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.sent / self.elapsed
+
+
+async def _iterate(
+    chat_ids: Iterable[ChatIdUnion] | AsyncIterable[ChatIdUnion],
+) -> AsyncIterator[ChatIdUnion]:
+    if isinstance(chat_ids, AsyncIterable):
+        async for chat_id in chat_ids:
+            yield chat_id
+    else:
+        for chat_id in chat_ids:
+            yield chat_id
+
+
+class Broadcast:
+    """
+    Sends the request to many recipients under the global rate limit of the bot
+
+    Recipients are read from the iterator while the requests are sent,
+    so only :code:`concurrency` recipients are held in memory at the same time.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        method_factory: MethodFactory,
+        chat_ids: Iterable[ChatIdUnion] | AsyncIterable[ChatIdUnion],
+        rate: float = DEFAULT_BROADCAST_RATE,
+        concurrency: int = 50,
+        max_retries: int = 3,
+        checkpoint: BaseBroadcastCheckpoint | None = None,
+        interval: float = 10.0,
+        on_blocked: BlockedCallback | None = None,
+        on_failed: FailedCallback | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """
+        :param bot: Bot that sends the requests
+        :param method_factory: Creates the request to the recipient
+        :param chat_ids: Recipients, the order should be the same when the broadcast is resumed
+        :param rate: Maximum number of requests per second
+        :param concurrency: Maximum number of requests sent at the same time
+        :param max_retries: Maximum number of retries after the flood control error
+        :param checkpoint: Storage of the progress,
+            the broadcast is resumed from the saved position
+        :param interval: Interval in seconds between the progress reports and checkpoints
+        :param on_blocked: Called for the recipients who blocked the bot
+            (:class:`aiogram.exceptions.TelegramForbiddenError`)
+        :param on_failed: Called for the requests failed with other Telegram errors
+        :param on_progress: Called with the progress of the broadcast every :code:`interval`
+        """
+        self.bot = bot
+        self.method_factory = method_factory
+        self.chat_ids = chat_ids
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.checkpoint = checkpoint
+        self.interval = interval
+        self.on_blocked = on_blocked
+        self.on_failed = on_failed
+        self.on_progress = on_progress
+
+        self._bucket = TokenBucket(rate=rate, capacity=max(1.0, rate))
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._error: BaseException | None = None
+        # Recipients processed out of order wait here until the previous ones are processed
+        self._completed: set[int] = set()
+        self._position = 0
+        self._saved_position = 0
+        self._skipped = 0
+        self._sent = 0
+        self._blocked = 0
+        self._failed = 0
+        self._retries = 0
+        self._started_at = time.monotonic()
+
+    def get_stats(self) -> BroadcastStats:
+        """
+        Get the snapshot of the broadcast progress
+        """
+        return BroadcastStats(
+            position=self._position,
+            skipped=self._skipped,
+            sent=self._sent,
+            blocked=self._blocked,
+            failed=self._failed,
+            retries=self._retries,
+            in_flight=len(self._tasks),
+            elapsed=time.monotonic() - self._started_at,
+        )
+
+    def _complete(self, index: int) -> None:
+        self._completed.add(index)
+        while self._position in self._completed:
+            self._completed.remove(self._position)
+            self._position += 1
+
+    async def _save_checkpoint(self) -> None:
+        if self.checkpoint is None or self._position == self._saved_position:
+            return
+        position = self._position
+        await self.checkpoint.save(position)
+        self._saved_position = position
+
+    async def _report(self) -> BroadcastStats:
+        await self._save_checkpoint()
+        stats = self.get_stats()
+        loggers.client.info(
+            "Broadcast progress: position=%d sent=%d blocked=%d failed=%d (%.1f requests/s)",
+            stats.position,
+            stats.sent,
+            stats.blocked,
+            stats.failed,
+            stats.throughput,
+        )
+        if self.on_progress is not None:
+            await self.on_progress(stats)
+        return stats
+
+    async def _report_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._report()
+
+    async def _send(self, index: int, chat_id: ChatIdUnion) -> None:
+        try:
+            method = self.method_factory(chat_id)
+            retries = 0
+            while True:
+                try:
+                    await self.bot(method)
+                except TelegramRetryAfter as e:  # noqa: PERF203
+                    # Flood control is global for the bot, so all requests are paused
+                    self._bucket.pause(e.retry_after)
+                    if retries >= self.max_retries:
+                        raise
+                    retries += 1
+                    self._retries += 1
+                    await self._bucket.acquire()
+                else:
+                    self._sent += 1
+                    break
+        except TelegramForbiddenError:
+            self._blocked += 1
+            if self.on_blocked is not None:
+                await self.on_blocked(chat_id)
+        except TelegramAPIError as e:
+            self._failed += 1
+            loggers.client.warning("Broadcast to chat %r failed: %s", chat_id, e)
+            if self.on_failed is not None:
+                await self.on_failed(chat_id, e)
+        finally:
+            self._semaphore.release()
+        # Unexpected errors stop the broadcast, so the recipient is not marked as processed
+        self._complete(index)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None and self._error is None:
+            self._error = task.exception()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def run(self) -> BroadcastStats:
+        """
+        Send the requests to all recipients
+
+        Unexpected errors (not the Telegram API errors) stop the broadcast and are raised,
+        the progress is saved to the checkpoint, so the broadcast can be resumed.
+        Requests that were being sent when the process was killed
+        are sent again by the resumed broadcast.
+
+        :return: Final progress of the broadcast
+        """
+        self._started_at = time.monotonic()
+        skip = await self.checkpoint.load() if self.checkpoint is not None else 0
+        self._position = self._saved_position = skip
+        reporter = asyncio.create_task(self._report_periodically())
+        try:
+            index = 0
+            async for chat_id in _iterate(self.chat_ids):
+                if index < skip:
+                    index += 1
+                    self._skipped += 1
+                    continue
+                await self._semaphore.acquire()
+                self._raise_error()
+                await self._bucket.acquire()
+                task = asyncio.create_task(self._send(index, chat_id))
+                self._tasks.add(task)
+                task.add_done_callback(self._on_done)
+                index += 1
+            if self._tasks:
+                await asyncio.wait(self._tasks)
+            self._raise_error()
+        finally:
+            reporter.cancel()
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(reporter, *self._tasks, return_exceptions=True)
+            await self._save_checkpoint()
+        return await self._report()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import pathlib
+import shutil
+from typing import TYPE_CHECKING, BinaryIO
+
+from aiogram import loggers
+
+if TYPE_CHECKING:
+    from aiogram.client.session.base import BaseSession
+
+# Files are not split into parts smaller than this size in bytes
+MIN_PART_SIZE = 1024 * 1024  # 1 mb
+
+
+class RangesNotSupported(Exception):
+    """
+    Server responded to the ranged request with the unexpected content
+    """
+
+
+def get_parts(file_size: int, connections: int) -> list[tuple[int, int]]:
+    """
+    Split the file into the parts downloaded concurrently
+
+    :return: First and last byte positions of the parts, both inclusive
+    """
+    connections = max(1, min(connections, file_size // MIN_PART_SIZE))
+    part_size = max(1, math.ceil(file_size / connections))
+    return [
+        (start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)
+    ]
+
+
+def _create_file(destination: str | pathlib.Path, file_size: int) -> None:
+    with open(destination, "wb") as f:
+        f.truncate(file_size)
+
+
+def _open_part(destination: str | pathlib.Path, start: int) -> BinaryIO:
+    f = open(destination, "r+b")  # noqa: SIM115
+    f.seek(start)
+    return f
+
+
+async def _download_part(
+    session: BaseSession,
+    url: str,
+    destination: str | pathlib.Path,
+    start: int,
+    end: int,
+    timeout: int,
+    chunk_size: int,
+) -> None:
+    stream = session.stream_content(
+        url=url,
+        headers={"Range": f"bytes={start}-{end}"},
+        timeout=timeout,
+        chunk_size=chunk_size,
+        raise_for_status=True,
+    )
+    f = await asyncio.to_thread(_open_part, destination, start)
+    try:
+        position = start
+        async for chunk in stream:
+            position += len(chunk)
+            if position > end + 1:
+                # The whole file is sent instead of the requested part
+                msg = f"Server sent more than {end - start + 1} bytes of the requested part"
+                raise RangesNotSupported(msg)
+            # File is written in the thread pool to not block the event loop
+            await asyncio.to_thread(f.write, chunk)
+        if position != end + 1:
+            msg = f"Server sent {position - start} of {end - start + 1} bytes of the part"
+            raise RangesNotSupported(msg)
+    finally:
+        await stream.aclose()
+        await asyncio.to_thread(f.close)
+
+
+async def download_ranges(
+    session: BaseSession,
+    url: str,
+    destination: str | pathlib.Path,
+    file_size: int,
+    connections: int,
+    timeout: int = 30,
+    chunk_size: int = 65536,
+) -> None:
+    """
+    Download parts of the file concurrently by ranged requests
+    and write them straight to the destination file
+
+    :raises RangesNotSupported: when the server doesn't support ranged requests
+    """
+    await asyncio.to_thread(_create_file, destination, file_size)
+    tasks = [
+        asyncio.create_task(
+            _download_part(
+                session=session,
+                url=url,
+                destination=destination,
+                start=start,
+                end=end,
+                timeout=timeout,
+                chunk_size=chunk_size,
+            )
+        )
+        for start, end in get_parts(file_size, connections)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException as e:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(e, RangesNotSupported):
+            loggers.client.warning("Failed to download the file in parts: %s", e)
+        raise
+
+
+async def copy_local_file(source: str | pathlib.Path, destination: str | pathlib.Path) -> None:
+    """
+    Copy the file stored by the local Bot API server,
+    the copy is done by the kernel without reading the file into the process when it's possible
+    """
+    await asyncio.to_thread(shutil.copyfile, source, destination)
@@ -2,14 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import ssl
+import time
 from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 import certifi
-from aiohttp import BasicAuth, ClientError, ClientSession, FormData, TCPConnector
-from aiohttp.hdrs import USER_AGENT
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientSession,
+    FormData,
+    TCPConnector,
+    TraceConfig,
+)
+from aiohttp.hdrs import CONTENT_TYPE, USER_AGENT
 from aiohttp.http import SERVER_SOFTWARE
 from typing_extensions import Self
+from yarl import URL
 
 from aiogram.__meta__ import __version__
 from aiogram.exceptions import TelegramNetworkError
@@ -18,6 +28,18 @@ from aiogram.methods.base import TelegramType
 from .base import BaseSession
 
 if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        TraceConnectionCreateEndParams,
+        TraceConnectionQueuedEndParams,
+        TraceConnectionQueuedStartParams,
+        TraceConnectionReuseconnParams,
+        TraceRequestEndParams,
+        TraceRequestExceptionParams,
+        TraceRequestStartParams,
+    )
+
     from aiogram.client.bot import Bot
     from aiogram.methods import TelegramMethod
     from aiogram.types import InputFile
@@ -69,13 +91,143 @@ def _prepare_connector(chain_or_plain: _ProxyType) -> tuple[type[TCPConnector],
     return ChainProxyConnector, {"proxy_infos": infos}
 
 
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    Snapshot of the connection pool usage of the :class:`AiohttpSession`
+    """
+
+    limit: int
+    """The total number of simultaneous connections, 0 means no limit"""
+    limit_per_host: int
+    """The number of simultaneous connections to the same host, 0 means no limit"""
+    in_flight: int
+    """Number of requests that are currently being processed"""
+    active_connections: int
+    """Number of connections that are currently used by requests"""
+    idle_connections: int
+    """Number of keep-alive connections that are ready to be reused"""
+    queued: int
+    """Number of requests that are currently waiting for a free connection"""
+    created_connections: int
+    """Total number of opened connections"""
+    reused_connections: int
+    """Total number of requests that reused a keep-alive connection"""
+    wait_count: int
+    """Total number of requests that waited for a free connection"""
+    total_wait_time: float
+    """Total time spent by requests waiting for a free connection in seconds"""
+    max_wait_time: float
+    """Maximum time spent by a request waiting for a free connection in seconds"""
+
+    @property
+    def avg_wait_time(self) -> float:
+        """
+        Average time spent by a request waiting for a free connection in seconds
+        """
+        if not self.wait_count:
+            return 0.0
+        return self.total_wait_time / self.wait_count
+
+
+class _ConnectionPoolTracer:
+    """
+    Collects connection pool counters using aiohttp client tracing signals
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.queued = 0
+        self.created_connections = 0
+        self.reused_connections = 0
+        self.wait_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+        self.trace_config = TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_request_exception.append(self._on_request_end)
+        self.trace_config.on_connection_queued_start.append(self._on_queued_start)
+        self.trace_config.on_connection_queued_end.append(self._on_queued_end)
+        self.trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+    async def _on_request_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        self.in_flight += 1
+
+    async def _on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams | TraceRequestExceptionParams,
+    ) -> None:
+        self.in_flight -= 1
+
+    async def _on_queued_start(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedStartParams,
+    ) -> None:
+        self.queued += 1
+        context.queued_at = time.monotonic()
+
+    async def _on_queued_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedEndParams,
+    ) -> None:
+        wait_time = time.monotonic() - context.queued_at
+        self.queued -= 1
+        self.wait_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    async def _on_connection_create_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        self.created_connections += 1
+
+    async def _on_connection_reuseconn(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        self.reused_connections += 1
+
+
 class AiohttpSession(BaseSession):
-    def __init__(self, proxy: _ProxyType | None = None, limit: int = 100, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        proxy: _ProxyType | None = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        warmup_connections: int = 0,
+        **kwargs: Any,
+    ) -> None:
         """
         Client session based on aiohttp.
 
         :param proxy: The proxy to be used for requests. Default is None.
         :param limit: The total number of simultaneous connections. Default is 100.
+        :param limit_per_host: The number of simultaneous connections to the same host,
+            0 means no limit. Default is 0.
+        :param keepalive_timeout: Time in seconds to keep idle connections open for reuse.
+            Default is 15.0.
+        :param warmup_connections: Number of connections to the Bot API server
+            to be opened in advance when the session is created. Default is 0.
         :param kwargs: Additional keyword arguments.
         """
         super().__init__(**kwargs)
@@ -84,9 +236,17 @@ class AiohttpSession(BaseSession):
         self._connector_type: type[TCPConnector] = TCPConnector
         self._connector_init: dict[str, Any] = {
             "ssl": ssl.create_default_context(cafile=certifi.where()),
-            "limit": limit,
             "ttl_dns_cache": 3600,  # Workaround for https://github.com/aiogram/aiogram/issues/1500
         }
+        # Pool options are kept apart from the connector init,
+        # so they are applied to the proxy connectors too
+        self._connector_options: dict[str, Any] = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self.warmup_connections = warmup_connections
+        self._tracer = _ConnectionPoolTracer()
         self._should_reset_connector = True  # flag determines connector state
         self._proxy: _ProxyType | None = None
 
@@ -119,15 +279,81 @@ class AiohttpSession(BaseSession):
 
         if self._session is None or self._session.closed:
             self._session = ClientSession(
-                connector=self._connector_type(**self._connector_init),
+                connector=self._connector_type(
+                    **self._connector_init,
+                    **self._connector_options,
+                ),
                 headers={
                     USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{__version__}",
                 },
+                trace_configs=[self._tracer.trace_config],
             )
             self._should_reset_connector = False
+            if self.warmup_connections:
+                await self._warmup(self._session, self.warmup_connections)
 
         return self._session
 
+    async def warmup(self, connections: int) -> int:
+        """
+        Open connections to the Bot API server in advance,
+        so the first requests don't wait for the TCP and TLS handshakes.
+
+        Connections are opened by concurrent GET requests to the server root
+        and are kept in the pool for :code:`keepalive_timeout` seconds.
+
+        :param connections: Number of connections to be opened
+        :return: Number of successfully opened connections
+        """
+        session = await self.create_session()
+        return await self._warmup(session, connections)
+
+    async def _warmup(self, session: ClientSession, connections: int) -> int:
+        url = URL(self.api.api_url(token="", method="")).origin()
+
+        async def _open() -> bool:
+            try:
+                async with session.get(url, allow_redirects=False, timeout=self.timeout) as resp:
+                    # The body should be read to return the connection into the pool
+                    await resp.read()
+                    return True
+            except (asyncio.TimeoutError, ClientError):
+                # Warm-up is an optimization only, failed connections are opened on demand
+                return False
+
+        results = await asyncio.gather(*(_open() for _ in range(connections)))
+        return sum(results)
+
+    def get_pool_stats(self) -> ConnectionPoolStats:
+        """
+        Get the snapshot of the connection pool usage.
+
+        Can be used to size the pool: a growing wait time for a free connection
+        means that the :code:`limit` (or :code:`limit_per_host`) is too low
+        for the current load.
+        """
+        active_connections = idle_connections = 0
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            active_connections = len(getattr(connector, "_acquired", ()))
+            idle_connections = sum(
+                len(connections) for connections in getattr(connector, "_conns", {}).values()
+            )
+        tracer = self._tracer
+        return ConnectionPoolStats(
+            limit=self._connector_options["limit"],
+            limit_per_host=self._connector_options["limit_per_host"],
+            in_flight=tracer.in_flight,
+            active_connections=active_connections,
+            idle_connections=idle_connections,
+            queued=tracer.queued,
+            created_connections=tracer.created_connections,
+            reused_connections=tracer.reused_connections,
+            wait_count=tracer.wait_count,
+            total_wait_time=tracer.total_wait_time,
+            max_wait_time=tracer.max_wait_time,
+        )
+
     async def close(self) -> None:
         if self._session is not None and not self._session.closed:
             await self._session.close()
@@ -137,17 +363,23 @@ class AiohttpSession(BaseSession):
             await asyncio.sleep(0.25)
 
     def build_form_data(self, bot: Bot, method: TelegramMethod[TelegramType]) -> FormData:
+        payload, files = self.prepare_payload(bot=bot, method=method)
+        return self._build_form_data(bot=bot, payload=payload, files=files)
+
+    def _build_form_data(
+        self,
+        bot: Bot,
+        payload: dict[str, Any],
+        files: dict[str, InputFile],
+    ) -> FormData:
         form = FormData(quote_fields=False)
-        files: dict[str, InputFile] = {}
-        for key, value in method.model_dump(warnings=False).items():
-            value = self.prepare_value(value, bot=bot, files=files)
-            if not value:
-                continue
-            form.add_field(key, value)
+        for key, value in payload.items():
+            form.add_field(key, self.prepare_form_value(value))
         for key, value in files.items():
+            # Files are streamed to the connection chunk by chunk without buffering
             form.add_field(
                 key,
-                value.read(bot),
+                self.stream_file(bot, value),
                 filename=value.filename or key,
             )
         return form
@@ -161,15 +393,23 @@ class AiohttpSession(BaseSession):
         session = await self.create_session()
 
         url = self.api.api_url(token=bot.token, method=method.__api_method__)
-        form = self.build_form_data(bot=bot, method=method)
+        payload, files = self.prepare_payload(bot=bot, method=method)
+        if files:
+            data: FormData | str = self._build_form_data(bot=bot, payload=payload, files=files)
+            headers = None
+        else:
+            # Requests without files are sent as JSON encoded in a single pass
+            data = self.json_dumps(payload)
+            headers = {CONTENT_TYPE: "application/json"}
 
         try:
             async with session.post(
                 url,
-                data=form,
+                data=data,
+                headers=headers,
                 timeout=self.timeout if timeout is None else timeout,
             ) as resp:
-                raw_result = await resp.text()
+                raw_result = await resp.read()
         except asyncio.TimeoutError as e:
             raise TelegramNetworkError(method=method, message="Request timeout error") from e
         except ClientError as e:
@@ -4,7 +4,7 @@ import abc
 import datetime
 import json
 import secrets
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Iterable
 from enum import Enum
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -32,7 +32,10 @@ from aiogram.methods import Response, TelegramMethod
 from aiogram.methods.base import TelegramType
 from aiogram.types import InputFile, TelegramObject
 
+from .coalescing import RequestCoalescer
 from .middlewares.manager import RequestMiddlewareManager
+from .serializer import get_model_serializer
+from .upload import UploadMemoryLimiter, UploadProgressCallback, stream_file
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -58,6 +61,9 @@ class BaseSession(abc.ABC):
         json_loads: _JsonLoads = json.loads,
         json_dumps: _JsonDumps = json.dumps,
         timeout: float = DEFAULT_TIMEOUT,
+        upload_memory_limit: int | None = None,
+        upload_progress: UploadProgressCallback | None = None,
+        coalesce_methods: Iterable[type[TelegramMethod[Any]]] = (),
     ) -> None:
         """
 
@@ -65,39 +71,57 @@ class BaseSession(abc.ABC):
         :param json_loads: JSON loader
         :param json_dumps: JSON dumper
         :param timeout: Session scope request timeout
+        :param upload_memory_limit: Maximum number of bytes of the files
+            held in memory by the concurrent uploads, not limited by default
+        :param upload_progress: Callback called after each chunk of the uploaded file is sent
+        :param coalesce_methods: Read-only methods whose concurrent identical calls
+            share one in-flight request (for example
+            :code:`aiogram.client.session.coalescing.DEFAULT_COALESCED_METHODS`),
+            disabled by default
         """
         self.api = api
         self.json_loads = json_loads
         self.json_dumps = json_dumps
         self.timeout = timeout
+        self.upload_limiter = (
+            UploadMemoryLimiter(upload_memory_limit) if upload_memory_limit else None
+        )
+        self.upload_progress = upload_progress
+        self.coalescer = RequestCoalescer(coalesce_methods)
 
         self.middleware = RequestMiddlewareManager()
 
+    @property
+    def uses_default_json_loads(self) -> bool:
+        """
+        Is the default JSON loader used by this session.
+
+        In this case JSON responses and updates are parsed by pydantic-core
+        without decoding into Python objects first.
+        Model validators of the Telegram objects still run in Python for each nested object,
+        so the gain is small, see :code:`scripts/benchmarks/update_parsing.py`.
+        """
+        return self.json_loads is json.loads
+
     def check_response(
         self,
         bot: Bot,
         method: TelegramMethod[TelegramType],
         status_code: int,
-        content: str,
+        content: str | bytes,
     ) -> Response[TelegramType]:
         """
         Check response status
         """
-        try:
-            json_data = self.json_loads(content)
-        except Exception as e:  # noqa: BLE001
-            # Handled error type can't be classified as specific error
-            # in due to decoder can be customized and raise any exception
-
-            msg = "Failed to decode object"
-            raise ClientDecodeError(msg, e, content) from e
-
-        try:
-            response_type = Response[method.__returning__]  # type: ignore
-            response = response_type.model_validate(json_data, context={"bot": bot})
-        except ValidationError as e:
-            msg = "Failed to deserialize object"
-            raise ClientDecodeError(msg, e, json_data) from e
+        response_type = Response[method.__returning__]  # type: ignore
+        if self.uses_default_json_loads:
+            try:
+                response = response_type.model_validate_json(content, context={"bot": bot})
+            except ValidationError:
+                # Decode the response again in two steps to raise the detailed error
+                response = self._decode_response(bot, response_type, content)
+        else:
+            response = self._decode_response(bot, response_type, content)
 
         if HTTPStatus.OK <= status_code <= HTTPStatus.IM_USED and response.ok:
             return response
@@ -139,6 +163,27 @@ class BaseSession(abc.ABC):
             message=description,
         )
 
+    def _decode_response(
+        self,
+        bot: Bot,
+        response_type: type[Response[TelegramType]],
+        content: str | bytes,
+    ) -> Response[TelegramType]:
+        try:
+            json_data = self.json_loads(content)
+        except Exception as e:  # noqa: BLE001
+            # Handled error type can't be classified as specific error
+            # in due to decoder can be customized and raise any exception
+
+            msg = "Failed to decode object"
+            raise ClientDecodeError(msg, e, content) from e
+
+        try:
+            return response_type.model_validate(json_data, context={"bot": bot})
+        except ValidationError as e:
+            msg = "Failed to deserialize object"
+            raise ClientDecodeError(msg, e, json_data) from e
+
     @abc.abstractmethod
     async def close(self) -> None:  # pragma: no cover
         """
@@ -176,6 +221,54 @@ class BaseSession(abc.ABC):
         """
         yield b""
 
+    def prepare_payload(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> tuple[dict[str, Any], dict[str, InputFile]]:
+        """
+        Prepare parameters of the method in a single pass
+
+        Values are not JSON-encoded, so the payload can be sent as JSON body as is,
+        or converted into the form fields by :meth:`prepare_form_value` when files are attached.
+
+        :return: Payload and files to be uploaded
+        """
+        files: dict[str, InputFile] = {}
+        if type(self).prepare_value is BaseSession.prepare_value:
+            # Compiled serializer of the method class produces the same result
+            # without dumping the method and walking the dumped values again
+            prepared = get_model_serializer(type(method))(method, bot, files)
+        else:
+            prepared = {
+                key: self.prepare_value(value, bot=bot, files=files, _dumps_json=False)
+                for key, value in method.model_dump(warnings=False).items()
+            }
+        payload = {
+            key: value for key, value in prepared.items() if value is not None and value != ""
+        }
+        return payload, files
+
+    def stream_file(self, bot: Bot, file: InputFile) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the file to the request body chunk by chunk,
+        respecting the upload memory limit and reporting the upload progress
+        """
+        return stream_file(
+            file,
+            bot=bot,
+            limiter=self.upload_limiter,
+            progress=self.upload_progress,
+        )
+
+    def prepare_form_value(self, value: Any) -> str:
+        """
+        Convert the payload value prepared by :meth:`prepare_payload` into the form field
+        """
+        if isinstance(value, str):
+            return value
+        return self.json_dumps(value)
+
     def prepare_value(
         self,
         value: Any,
@@ -237,7 +330,7 @@ class BaseSession(abc.ABC):
         if isinstance(value, datetime.datetime):
             return str(round(value.timestamp()))
         if isinstance(value, Enum):
-            return self.prepare_value(value.value, bot=bot, files=files)
+            return self.prepare_value(value.value, bot=bot, files=files, _dumps_json=_dumps_json)
         if isinstance(value, TelegramObject):
             return self.prepare_value(
                 value.model_dump(warnings=False),
@@ -256,6 +349,11 @@ class BaseSession(abc.ABC):
         timeout: int | None = None,
     ) -> TelegramType:
         middleware = self.middleware.wrap_middlewares(self.make_request, timeout=timeout)
+        if self.coalescer.is_coalesced(method):
+            return cast(
+                TelegramType,
+                await self.coalescer(bot, method, lambda: middleware(bot, method)),
+            )
         return cast(TelegramType, await middleware(bot, method))
 
     async def __aenter__(self) -> Self:
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from aiogram.methods import (
+    GetAvailableGifts,
+    GetBusinessConnection,
+    GetChat,
+    GetChatAdministrators,
+    GetChatMember,
+    GetChatMemberCount,
+    GetChatMenuButton,
+    GetCustomEmojiStickers,
+    GetFile,
+    GetForumTopicIconStickers,
+    GetMe,
+    GetMyCommands,
+    GetMyDefaultAdministratorRights,
+    GetMyDescription,
+    GetMyName,
+    GetMyShortDescription,
+    GetStickerSet,
+    GetUserChatBoosts,
+    GetUserProfilePhotos,
+    GetWebhookInfo,
+    TelegramMethod,
+)
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+T = TypeVar("T")
+_Key = tuple[int, type[TelegramMethod[Any]], str]
+
+# Read-only methods that are safe to be coalesced, coalescing is disabled by default
+DEFAULT_COALESCED_METHODS: frozenset[type[TelegramMethod[Any]]] = frozenset(
+    {
+        GetAvailableGifts,
+        GetBusinessConnection,
+        GetChat,
+        GetChatAdministrators,
+        GetChatMember,
+        GetChatMemberCount,
+        GetChatMenuButton,
+        GetCustomEmojiStickers,
+        GetFile,
+        GetForumTopicIconStickers,
+        GetMe,
+        GetMyCommands,
+        GetMyDefaultAdministratorRights,
+        GetMyDescription,
+        GetMyName,
+        GetMyShortDescription,
+        GetStickerSet,
+        GetUserChatBoosts,
+        GetUserProfilePhotos,
+        GetWebhookInfo,
+    }
+)
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    Collapses concurrent identical calls of the read-only methods into one in-flight request
+
+    The first call sends the request, calls with the same bot, method and parameters
+    made before the response is received wait for it and get the same result or exception.
+    The request is cancelled only when all waiting calls are cancelled.
+
+    .. warning::
+
+        The request is sent with the timeout and through the request middlewares
+        of the first call, all waiting calls get the same result object
+        (so it should not be modified) and the same exception instance.
+    """
+
+    def __init__(self, methods: Iterable[type[TelegramMethod[Any]]]) -> None:
+        """
+        :param methods: Methods whose calls are coalesced
+        """
+        self.methods = frozenset(methods)
+        self._flights: dict[_Key, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of the requests shared by the concurrent calls right now
+        """
+        return len(self._flights)
+
+    def is_coalesced(self, method: TelegramMethod[Any]) -> bool:
+        return type(method) in self.methods
+
+    async def __call__(
+        self,
+        bot: Bot,
+        method: TelegramMethod[Any],
+        make_request: Callable[[], Awaitable[T]],
+    ) -> T:
+        key = (bot.id, type(method), method.model_dump_json(exclude_none=True))
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, make_request)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _start(self, key: _Key, make_request: Callable[[], Awaitable[Any]]) -> _Flight:
+        # Request is run in the separate task,
+        # so cancellation of the first call doesn't fail the other ones
+        flight = self._flights[key] = _Flight(asyncio.ensure_future(make_request()))
+        flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        return flight
+
+    def _forget(self, key: _Key, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
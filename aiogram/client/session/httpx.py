@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import secrets
+import ssl
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any, cast
+
+import certifi
+import httpx
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from typing_extensions import Self
+from yarl import URL
+
+from aiogram.__meta__ import __version__
+from aiogram.exceptions import TelegramNetworkError
+from aiogram.methods.base import TelegramType
+
+from .base import BaseSession
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+    from aiogram.methods import TelegramMethod
+    from aiogram.types import InputFile
+
+
+# Escaping of the form field names, see https://html.spec.whatwg.org/#multipart-form-data
+_FORM_ESCAPE = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+
+def _quote(value: str) -> bytes:
+    return value.translate(_FORM_ESCAPE).encode()
+
+
+class HttpxSession(BaseSession):
+    def __init__(
+        self,
+        http2: bool = True,
+        limit: int = 100,
+        keepalive_limit: int | None = None,
+        keepalive_timeout: float = 15.0,
+        proxy: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Client session based on httpx.
+
+        With HTTP/2 all requests to the Bot API server are multiplexed
+        over a small number of connections instead of a connection per in-flight request.
+
+        :param http2: Use HTTP/2 when it is supported by the server. Default is True.
+        :param limit: The total number of simultaneous connections. Default is 100.
+        :param keepalive_limit: The number of idle connections kept open for reuse,
+            equals to the :code:`limit` by default.
+        :param keepalive_timeout: Time in seconds to keep idle connections open for reuse.
+            Default is 15.0.
+        :param proxy: The proxy URL to be used for requests. Default is None.
+        :param kwargs: Additional keyword arguments.
+        """
+        super().__init__(**kwargs)
+
+        self._client: httpx.AsyncClient | None = None
+        self._client_init: dict[str, Any] = {
+            "http2": http2,
+            "verify": ssl.create_default_context(cafile=certifi.where()),
+            "limits": httpx.Limits(
+                max_connections=limit,
+                max_keepalive_connections=limit if keepalive_limit is None else keepalive_limit,
+                keepalive_expiry=keepalive_timeout,
+            ),
+            "proxy": proxy,
+            "headers": {"User-Agent": f"httpx/{httpx.__version__} aiogram/{__version__}"},
+        }
+
+    async def create_session(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(**self._client_init)
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    def build_multipart(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> tuple[str, AsyncGenerator[bytes, None]]:
+        payload, files = self.prepare_payload(bot=bot, method=method)
+        return self._build_multipart(bot=bot, payload=payload, files=files)
+
+    def _build_multipart(
+        self,
+        bot: Bot,
+        payload: dict[str, Any],
+        files: dict[str, InputFile],
+    ) -> tuple[str, AsyncGenerator[bytes, None]]:
+        """
+        Build the multipart body streamed from the files chunk by chunk,
+        httpx can encode only files opened synchronously and reads them into memory
+
+        :return: Content type and the body
+        """
+        boundary = secrets.token_hex(16)
+        body = self._iter_multipart(
+            bot=bot,
+            boundary=boundary.encode(),
+            payload=payload,
+            files=files,
+        )
+        return f"multipart/form-data; boundary={boundary}", body
+
+    async def _iter_multipart(
+        self,
+        bot: Bot,
+        boundary: bytes,
+        payload: dict[str, Any],
+        files: dict[str, InputFile],
+    ) -> AsyncGenerator[bytes, None]:
+        for key, value in payload.items():
+            yield (
+                b'--%b\r\nContent-Disposition: form-data; name="%b"\r\n\r\n%b\r\n'
+                % (boundary, _quote(key), self.prepare_form_value(value).encode())
+            )
+        for key, file in files.items():
+            yield (
+                b'--%b\r\nContent-Disposition: form-data; name="%b"; filename="%b"\r\n'
+                b"Content-Type: application/octet-stream\r\n\r\n"
+                % (boundary, _quote(key), _quote(file.filename or key))
+            )
+            async for chunk in self.stream_file(bot, file):
+                yield chunk
+            yield b"\r\n"
+        yield b"--%b--\r\n" % boundary
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        timeout: int | None = None,
+    ) -> TelegramType:
+        client = await self.create_session()
+
+        url = self.api.api_url(token=bot.token, method=method.__api_method__)
+        payload, files = self.prepare_payload(bot=bot, method=method)
+        if files:
+            content_type, body = self._build_multipart(bot=bot, payload=payload, files=files)
+            request_kwargs: dict[str, Any] = {
+                "content": body,
+                "headers": {"Content-Type": content_type},
+            }
+        else:
+            # Requests without files are sent as JSON encoded in a single pass
+            request_kwargs = {
+                "content": self.json_dumps(payload),
+                "headers": {"Content-Type": "application/json"},
+            }
+
+        try:
+            resp = await client.post(
+                url,
+                timeout=self.timeout if timeout is None else timeout,
+                **request_kwargs,
+            )
+        except httpx.TimeoutException as e:
+            raise TelegramNetworkError(method=method, message="Request timeout error") from e
+        except httpx.HTTPError as e:
+            raise TelegramNetworkError(method=method, message=f"{type(e).__name__}: {e}") from e
+        response = self.check_response(
+            bot=bot,
+            method=method,
+            status_code=resp.status_code,
+            content=resp.content,
+        )
+        return cast(TelegramType, response.result)
+
+    async def stream_content(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True,
+    ) -> AsyncGenerator[bytes, None]:
+        client = await self.create_session()
+
+        async with client.stream("GET", url, headers=headers, timeout=timeout) as resp:
+            if raise_for_status and resp.is_error:
+                # The same error is raised by the AiohttpSession,
+                # so the error handling doesn't depend on the session
+                raise ClientResponseError(
+                    RequestInfo(
+                        url=URL(url),
+                        method="GET",
+                        headers=CIMultiDictProxy(CIMultiDict(resp.request.headers.items())),
+                        real_url=URL(str(resp.url)),
+                    ),
+                    (),
+                    status=resp.status_code,
+                    message=resp.reason_phrase,
+                    headers=CIMultiDictProxy(CIMultiDict(resp.headers.items())),
+                )
+            async for chunk in resp.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def __aenter__(self) -> Self:
+        await self.create_session()
+        return self
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, cast
+from weakref import WeakKeyDictionary
+
+from aiogram import loggers
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import SendMediaGroup, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.types import BufferedInputFile, File, FSInputFile, InputFile, Message
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+    from aiogram.client.bot import Bot
+
+# Fields of the methods that contain media reusable by file_id,
+# the same names are used by the attributes of the sent message
+MEDIA_FIELDS = (
+    "photo",
+    "animation",
+    "audio",
+    "document",
+    "sticker",
+    "video",
+    "video_note",
+    "voice",
+)
+# Contents of the bigger files are hashed in the thread, so the event loop is not blocked
+HASH_IN_THREAD_THRESHOLD = 1024 * 1024
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BaseFileIdStorage(ABC):
+    """
+    Base class for storages of the uploaded files identifiers
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """
+        Get file_id of the uploaded file
+
+        :param key: cache key of the file
+        :return: file_id or :code:`None` if the file was not uploaded
+        """
+
+    @abstractmethod
+    async def set(self, key: str, file_id: str) -> None:
+        """
+        Save file_id of the uploaded file
+
+        :param key: cache key of the file
+        :param file_id: file_id returned by Telegram
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Forget the uploaded file
+
+        :param key: cache key of the file
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """
+        Close storage (database connection, file or etc.)
+        """
+
+
+class MemoryFileIdStorage(BaseFileIdStorage):
+    """
+    In-memory storage that keeps the most recently used files
+
+    .. warning::
+
+        Is not recommended when the bot is run in several processes,
+        each process uploads the same files again
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """
+        :param max_size: Maximum number of the stored files,
+            the least recently used files are evicted first
+        """
+        self.max_size = max_size
+        self._data: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str) -> str | None:
+        file_id = self._data.get(key)
+        if file_id is not None:
+            self._data.move_to_end(key)
+        return file_id
+
+    async def set(self, key: str, file_id: str) -> None:
+        self._data[key] = file_id
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RedisFileIdStorage(BaseFileIdStorage):
+    """
+    Redis storage requires the :code:`redis` package (:code:`pip install redis`)
+
+    Eviction of the least recently used files is done by Redis itself
+    when the :code:`maxmemory-policy` is :code:`allkeys-lru`,
+    otherwise use :code:`ttl` to expire the records.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        key_prefix: str = "file_id",
+        ttl: int | datetime.timedelta | None = None,
+    ) -> None:
+        """
+        :param redis: instance of Redis connection
+        :param key_prefix: prefix of the Redis keys
+        :param ttl: TTL of the records
+        """
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+    def build_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        value = await self.redis.get(self.build_key(key))
+        if isinstance(value, bytes):
+            return value.decode()
+        return cast(str | None, value)
+
+    async def set(self, key: str, file_id: str) -> None:
+        await self.redis.set(self.build_key(key), file_id, ex=self.ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.redis.delete(self.build_key(key))
+
+    async def close(self) -> None:
+        await self.redis.aclose(close_connection_pool=True)
+
+
+class FileIdCache(BaseRequestMiddleware):
+    def __init__(self, storage: BaseFileIdStorage | None = None) -> None:
+        """
+        Middleware that uploads the same file only once and then sends it by file_id
+
+        After the first successful upload the file_id from the sent message is saved,
+        next requests with the same file send this file_id instead of the file contents.
+        Files are identified by the contents for :class:`aiogram.types.BufferedInputFile`
+        and by the path, size and modification time for :class:`aiogram.types.FSInputFile`,
+        other input files are always uploaded.
+
+        Concurrent requests with the same file wait for the first upload to finish.
+        Only media of the :code:`send*` methods and media groups are cached,
+        thumbnails can't be sent by file_id and are always uploaded.
+
+        :param storage: Storage of the uploaded files, in-memory LRU storage by default
+        """
+        self.storage = storage if storage is not None else MemoryFileIdStorage()
+
+        self.hits = 0
+        """Number of the files sent by file_id instead of uploading"""
+        self.misses = 0
+        """Number of the cacheable files that were uploaded"""
+        self._digests: WeakKeyDictionary[BufferedInputFile, str] = WeakKeyDictionary()
+        self._uploads: dict[str, asyncio.Event] = {}
+
+    def get_file_key(self, file: InputFile) -> str | None:
+        """
+        Get the key identifying the contents of the file
+
+        :return: Key or :code:`None` if the file can't be cached
+        """
+        if isinstance(file, BufferedInputFile):
+            # Hash is calculated once when the same object is sent many times
+            digest = self._digests.get(file)
+            if digest is None:
+                digest = self._digests[file] = _sha256(file.data)
+            return f"sha256:{digest}:{file.filename}"
+        if isinstance(file, FSInputFile):
+            try:
+                stat = os.stat(file.path)
+            except OSError:
+                # Let the request fail as usual
+                return None
+            path = os.path.abspath(file.path)
+            return f"path:{path}:{stat.st_size}:{stat.st_mtime_ns}:{file.filename}"
+        return None
+
+    async def _get_file_key(self, file: InputFile) -> str | None:
+        if (
+            isinstance(file, BufferedInputFile)
+            and len(file.data) >= HASH_IN_THREAD_THRESHOLD
+            and file not in self._digests
+        ):
+            self._digests[file] = await asyncio.to_thread(_sha256, file.data)
+        return self.get_file_key(file)
+
+    def _find_files(self, method: TelegramMethod[Any]) -> dict[tuple[str, int], InputFile]:
+        """
+        Find files that can be sent by file_id
+
+        :return: Files by the field name and index in the media group
+        """
+        files: dict[tuple[str, int], InputFile] = {}
+        if isinstance(method, SendMediaGroup):
+            for index, media in enumerate(method.media):
+                if isinstance(media.media, InputFile):
+                    files[media.type, index] = media.media
+            return files
+        for field in MEDIA_FIELDS:
+            value = getattr(method, field, None)
+            if isinstance(value, InputFile):
+                files[field, 0] = value
+        return files
+
+    def _replace_files(
+        self,
+        method: TelegramMethod[TelegramType],
+        file_ids: dict[tuple[str, int], str],
+    ) -> TelegramMethod[TelegramType]:
+        if isinstance(method, SendMediaGroup):
+            media = list(method.media)
+            for (_, index), file_id in file_ids.items():
+                media[index] = media[index].model_copy(update={"media": file_id})
+            return cast(TelegramMethod[TelegramType], method.model_copy(update={"media": media}))
+        return method.model_copy(
+            update={field: file_id for (field, _), file_id in file_ids.items()}
+        )
+
+    def _extract_file_id(self, result: Any, field: str, index: int) -> str | None:
+        if isinstance(result, list):
+            result = result[index] if index < len(result) else None
+        if isinstance(result, File):
+            return result.file_id
+        if not isinstance(result, Message):
+            return None
+        media = getattr(result, field, None)
+        if isinstance(media, list):
+            # The biggest size of the photo
+            media = media[-1] if media else None
+        return getattr(media, "file_id", None)
+
+    async def _get_file_id(self, key: str, uploads: dict[str, asyncio.Event]) -> str | None:
+        """
+        Get the cached file_id or take the upload of the file,
+        requests with the file that is being uploaded wait for the upload to finish
+        """
+        while True:
+            file_id = await self.storage.get(key)
+            if file_id is not None:
+                return file_id
+            event = self._uploads.get(key)
+            if event is None:
+                self._uploads[key] = uploads[key] = asyncio.Event()
+                return None
+            await event.wait()
+
+    async def _make_request(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        keys: dict[tuple[str, int], str],
+        cached: dict[tuple[str, int], str],
+    ) -> Response[TelegramType]:
+        if not cached:
+            return await make_request(bot, method)
+        try:
+            return await make_request(bot, self._replace_files(method, cached))
+        except TelegramBadRequest as e:
+            if "file" not in e.message.lower():
+                raise
+            # file_id may become invalid, so the files are uploaded again
+            for position in cached:
+                await self.storage.delete(keys[position])
+            loggers.middlewares.warning(
+                "Request with method=%r by bot id=%d failed with the cached file_id, "
+                "retry with the files upload",
+                type(method).__name__,
+                bot.id,
+            )
+            cached.clear()
+            return await make_request(bot, method)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        files = self._find_files(method)
+        if not files:
+            return await make_request(bot, method)
+
+        # file_id is unique for each bot
+        keys = {
+            position: f"{bot.id}:{position[0]}:{file_key}"
+            for position, file in files.items()
+            if (file_key := await self._get_file_key(file)) is not None
+        }
+        uploads: dict[str, asyncio.Event] = {}
+        try:
+            # Uploads are taken in the same order by all requests,
+            # so media groups with the same files don't wait for each other forever
+            file_ids = {
+                key: await self._get_file_id(key, uploads) for key in sorted(set(keys.values()))
+            }
+            cached = {
+                position: file_id
+                for position, key in keys.items()
+                if (file_id := file_ids[key]) is not None
+            }
+            self.hits += len(cached)
+            self.misses += len(keys) - len(cached)
+
+            response = await self._make_request(make_request, bot, method, keys, cached)
+
+            for position, key in keys.items():
+                if position in cached:
+                    continue
+                # Middlewares chain returns the result of the method itself
+                file_id = self._extract_file_id(response, *position)
+                if file_id is not None:
+                    await self.storage.set(key, file_id)
+        finally:
+            for key, event in uploads.items():
+                del self._uploads[key]
+                event.set()
+        return response
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aiogram import loggers
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    CopyMessage,
+    CopyMessages,
+    ForwardMessage,
+    ForwardMessages,
+    SendAnimation,
+    SendAudio,
+    SendChecklist,
+    SendContact,
+    SendDice,
+    SendDocument,
+    SendGame,
+    SendInvoice,
+    SendLivePhoto,
+    SendLocation,
+    SendMediaGroup,
+    SendMessage,
+    SendPaidMedia,
+    SendPhoto,
+    SendPoll,
+    SendRichMessage,
+    SendSticker,
+    SendVenue,
+    SendVideo,
+    SendVideoNote,
+    SendVoice,
+    TelegramMethod,
+)
+from aiogram.methods.base import Response, TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+# Telegram limits, see https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this
+DEFAULT_GLOBAL_RATE = 30.0
+DEFAULT_PRIVATE_CHAT_RATE = 1.0
+DEFAULT_GROUP_CHAT_RATE = 20 / 60
+# Short bursts over the rate are allowed, the group chat limit is counted per minute
+DEFAULT_PRIVATE_CHAT_BURST = 3.0
+DEFAULT_GROUP_CHAT_BURST = 20.0
+# Methods that send messages to the chat and are subject to the flood limits
+DEFAULT_PACED_METHODS: frozenset[type[TelegramMethod[Any]]] = frozenset(
+    {
+        CopyMessage,
+        CopyMessages,
+        ForwardMessage,
+        ForwardMessages,
+        SendAnimation,
+        SendAudio,
+        SendChecklist,
+        SendContact,
+        SendDice,
+        SendDocument,
+        SendGame,
+        SendInvoice,
+        SendLivePhoto,
+        SendLocation,
+        SendMediaGroup,
+        SendMessage,
+        SendPaidMedia,
+        SendPhoto,
+        SendPoll,
+        SendRichMessage,
+        SendSticker,
+        SendVenue,
+        SendVideo,
+        SendVideoNote,
+        SendVoice,
+    },
+)
+# Idle buckets are dropped not more often than once per this interval in seconds
+CLEANUP_INTERVAL = 60.0
+
+
+class TokenBucket:
+    """
+    Token bucket that paces acquirers in FIFO order
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        :param rate: Number of tokens added per second
+        :param capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.waiters = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def get_delay(self) -> float:
+        """
+        Get time in seconds until the next token is available
+        """
+        now = time.monotonic()
+        self._refill(now)
+        delay = max(self.paused_until - now, 0.0)
+        if self.tokens < 1:
+            delay = max(delay, (1 - self.tokens) / self.rate)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Don't give out tokens for the specified time
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def is_idle(self) -> bool:
+        """
+        Is the bucket in the initial state, so it can be dropped
+        """
+        return not self.waiters and not self.get_delay() and self.tokens >= self.capacity
+
+    async def acquire(self) -> float:
+        """
+        Wait for the token
+
+        :return: Time spent in the queue in seconds, 0 if the token was available immediately
+        """
+        started_at = time.monotonic()
+        throttled = False
+        self.waiters += 1
+        try:
+            async with self._lock:
+                while (delay := self.get_delay()) > 0:
+                    throttled = True
+                    await asyncio.sleep(delay)
+                self.tokens -= 1
+        finally:
+            self.waiters -= 1
+        if not throttled:
+            return 0.0
+        return time.monotonic() - started_at
+
+
+@dataclass(frozen=True)
+class FloodControlStats:
+    """
+    Snapshot of the :class:`FloodControl` queues
+    """
+
+    queued: int
+    """Number of requests that are currently waiting in the queues"""
+    chats: int
+    """Number of chats that are tracked right now"""
+    throttled: int
+    """Total number of requests that were delayed"""
+    total_delay: float
+    """Total time spent by requests in the queues in seconds"""
+    retry_after: int
+    """Total number of received flood control errors"""
+
+
+class FloodControl(BaseRequestMiddleware):
+    def __init__(
+        self,
+        global_rate: float = DEFAULT_GLOBAL_RATE,
+        private_chat_rate: float = DEFAULT_PRIVATE_CHAT_RATE,
+        group_chat_rate: float = DEFAULT_GROUP_CHAT_RATE,
+        private_chat_burst: float = DEFAULT_PRIVATE_CHAT_BURST,
+        group_chat_burst: float = DEFAULT_GROUP_CHAT_BURST,
+        max_retries: int = 3,
+        methods: Iterable[type[TelegramMethod[Any]]] = DEFAULT_PACED_METHODS,
+    ) -> None:
+        """
+        Middleware that paces outgoing requests to fit the Telegram flood limits
+        instead of failing with :class:`aiogram.exceptions.TelegramRetryAfter`.
+
+        Only the message sending methods are paced (other requests like
+        :code:`sendChatAction` or :code:`getChat` are not counted by the flood limits),
+        each bot has its own global limit and limit per chat.
+        Chats with positive identifiers are treated as private chats,
+        other chats (groups, supergroups and channels) use the group chat limit.
+
+        When the flood control error is received anyway, only the queue of the affected chat
+        (or the global queue if the chat is not specified) is paused for the requested time
+        and the request is repeated.
+
+        :param global_rate: Maximum number of requests per second for the bot
+        :param private_chat_rate: Maximum number of requests per second to the same private chat
+        :param group_chat_rate: Maximum number of requests per second to the same group chat
+        :param private_chat_burst: Number of requests that can be sent to the same private chat
+            at once before they are paced by the rate
+        :param group_chat_burst: Number of requests that can be sent to the same group chat
+            at once before they are paced by the rate
+        :param max_retries: Maximum number of retries after the flood control error
+        :param methods: Methods that are paced
+        """
+        self.global_rate = global_rate
+        self.private_chat_rate = private_chat_rate
+        self.group_chat_rate = group_chat_rate
+        self.private_chat_burst = private_chat_burst
+        self.group_chat_burst = group_chat_burst
+        self.max_retries = max_retries
+        self.methods = frozenset(methods)
+
+        self._global_buckets: dict[int, TokenBucket] = {}
+        self._chat_buckets: dict[tuple[int, int | str], TokenBucket] = {}
+        self._cleaned_up_at = time.monotonic()
+        self._throttled = 0
+        self._total_delay = 0.0
+        self._retry_after = 0
+
+    def _get_global_bucket(self, bot_id: int) -> TokenBucket:
+        bucket = self._global_buckets.get(bot_id)
+        if bucket is None:
+            bucket = self._global_buckets[bot_id] = TokenBucket(
+                rate=self.global_rate,
+                capacity=max(1.0, self.global_rate),
+            )
+        return bucket
+
+    def _get_chat_bucket(self, bot_id: int, chat_id: int | str) -> TokenBucket:
+        bucket = self._chat_buckets.get((bot_id, chat_id))
+        if bucket is None:
+            self._cleanup()
+            if isinstance(chat_id, int) and chat_id > 0:
+                rate, burst = self.private_chat_rate, self.private_chat_burst
+            else:
+                rate, burst = self.group_chat_rate, self.group_chat_burst
+            bucket = self._chat_buckets[bot_id, chat_id] = TokenBucket(
+                rate=rate,
+                capacity=max(1.0, burst),
+            )
+        return bucket
+
+    def _cleanup(self) -> None:
+        now = time.monotonic()
+        if now - self._cleaned_up_at < CLEANUP_INTERVAL:
+            return
+        self._cleaned_up_at = now
+        for key, bucket in list(self._chat_buckets.items()):
+            if bucket.is_idle():
+                del self._chat_buckets[key]
+
+    def get_queue_depth(self, bot_id: int, chat_id: int | str | None = None) -> int:
+        """
+        Get the number of requests waiting in the queue of the chat
+        or in the global queue of the bot if chat is not specified
+        """
+        if chat_id is None:
+            bucket = self._global_buckets.get(bot_id)
+        else:
+            bucket = self._chat_buckets.get((bot_id, chat_id))
+        return bucket.waiters if bucket else 0
+
+    def get_stats(self) -> FloodControlStats:
+        """
+        Get the snapshot of the queues
+        """
+        queued = sum(bucket.waiters for bucket in self._chat_buckets.values())
+        # Requests in the global queue have already passed the chat queue
+        queued += sum(bucket.waiters for bucket in self._global_buckets.values())
+        return FloodControlStats(
+            queued=queued,
+            chats=len(self._chat_buckets),
+            throttled=self._throttled,
+            total_delay=self._total_delay,
+            retry_after=self._retry_after,
+        )
+
+    async def _acquire(self, bucket: TokenBucket) -> None:
+        delay = await bucket.acquire()
+        if delay > 0:
+            self._throttled += 1
+            self._total_delay += delay
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if type(method) not in self.methods:
+            return await make_request(bot, method)
+
+        chat_id = getattr(method, "chat_id", None)
+        global_bucket = self._get_global_bucket(bot.id)
+        chat_bucket = None if chat_id is None else self._get_chat_bucket(bot.id, chat_id)
+
+        retries = 0
+        while True:
+            if chat_bucket is not None:
+                await self._acquire(chat_bucket)
+            await self._acquire(global_bucket)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                self._retry_after += 1
+                (chat_bucket or global_bucket).pause(e.retry_after)
+                if retries >= self.max_retries:
+                    raise
+                retries += 1
+                loggers.middlewares.warning(
+                    "Flood control exceeded on method=%r in chat %r by bot id=%d, "
+                    "retry in %d seconds",
+                    type(method).__name__,
+                    chat_id,
+                    bot.id,
+                    e.retry_after,
+                )
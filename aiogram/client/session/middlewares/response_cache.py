@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramNotFound
+from aiogram.methods import (
+    GetChat,
+    GetChatAdministrators,
+    GetChatMember,
+    GetChatMemberCount,
+    GetCustomEmojiStickers,
+    GetFile,
+    GetMe,
+    GetStickerSet,
+    TelegramMethod,
+)
+from aiogram.methods.base import Response, TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+# Time to live of the cached responses in seconds
+DEFAULT_TTLS: dict[type[TelegramMethod[Any]], float] = {
+    GetMe: 3600.0,
+    GetChat: 60.0,
+    GetChatAdministrators: 60.0,
+    GetChatMember: 30.0,
+    GetChatMemberCount: 30.0,
+    # Download link of the file is valid for at least an hour
+    GetFile: 1800.0,
+    GetStickerSet: 300.0,
+    GetCustomEmojiStickers: 300.0,
+}
+# Methods that change the chat or its members drop the cached responses of this chat
+INVALIDATING_PREFIXES = (
+    "ban",
+    "unban",
+    "restrict",
+    "promote",
+    "setChat",
+    "deleteChat",
+    "leaveChat",
+    "approveChatJoinRequest",
+    "declineChatJoinRequest",
+)
+
+_Key = tuple[int, type[TelegramMethod[Any]], str]
+# Expiration time, result, cached error and chat of the response
+_Entry = tuple[float, Any, TelegramAPIError | None, int | str | None]
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """
+    Snapshot of the :class:`ResponseCache` counters
+    """
+
+    size: int
+    """Number of the cached responses"""
+    hits: int
+    """Number of the requests answered from the cache"""
+    negative_hits: int
+    """Number of the requests failed with the cached error"""
+    misses: int
+    """Number of the cacheable requests sent to the server"""
+    evictions: int
+    """Number of the responses evicted to fit the size limit"""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the cacheable requests answered from the cache
+        """
+        total = self.hits + self.negative_hits + self.misses
+        if not total:
+            return 0.0
+        return (self.hits + self.negative_hits) / total
+
+
+class ResponseCache(BaseRequestMiddleware):
+    def __init__(
+        self,
+        ttls: dict[type[TelegramMethod[Any]], float] | None = None,
+        negative_ttl: float = 10.0,
+        max_size: int = 10_000,
+    ) -> None:
+        """
+        Middleware that caches responses of the read-only methods
+
+        Responses are cached per bot, method and its parameters for the time to live
+        of the method, the least recently used responses are evicted when the cache is full.
+        Not found errors (:class:`aiogram.exceptions.TelegramNotFound`
+        and :class:`aiogram.exceptions.TelegramBadRequest` like "chat not found")
+        are cached for the :code:`negative_ttl`.
+
+        Methods that change the chat or its members (bans, restrictions, promotions,
+        chat settings) drop the cached responses of this chat.
+
+        :param ttls: Time to live of the responses by method in seconds,
+            only these methods are cached, :code:`DEFAULT_TTLS` by default
+        :param negative_ttl: Time to live of the not found errors in seconds, 0 disables caching
+        :param max_size: Maximum number of the cached responses
+        """
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+
+        self._cache: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._chats: dict[tuple[int, int | str], set[_Key]] = {}
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_stats(self) -> ResponseCacheStats:
+        """
+        Get the snapshot of the cache counters
+        """
+        return ResponseCacheStats(
+            size=len(self._cache),
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def invalidate(self, bot_id: int, chat_id: int | str | None = None) -> None:
+        """
+        Drop the cached responses of the bot or only of the chat
+        """
+        if chat_id is not None:
+            for key in self._chats.pop((bot_id, chat_id), ()):
+                self._cache.pop(key, None)
+            return
+        for key in [key for key in self._cache if key[0] == bot_id]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses
+        """
+        self._cache.clear()
+        self._chats.clear()
+
+    def _drop(self, key: _Key) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None and entry[3] is not None:
+            self._forget_chat_key(key, entry[3])
+
+    def _forget_chat_key(self, key: _Key, chat_id: int | str) -> None:
+        keys = self._chats.get((key[0], chat_id))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._chats[key[0], chat_id]
+
+    def _store(
+        self,
+        key: _Key,
+        chat_id: int | str | None,
+        ttl: float,
+        result: Any,
+        error: TelegramAPIError | None = None,
+    ) -> None:
+        self._cache[key] = (time.monotonic() + ttl, result, error, chat_id)
+        self._cache.move_to_end(key)
+        if chat_id is not None:
+            self._chats.setdefault((key[0], chat_id), set()).add(key)
+        while len(self._cache) > self.max_size:
+            evicted, entry = self._cache.popitem(last=False)
+            self._evictions += 1
+            if entry[3] is not None:
+                self._forget_chat_key(evicted, entry[3])
+
+    def _is_not_found(self, error: TelegramAPIError) -> bool:
+        if isinstance(error, TelegramNotFound):
+            return True
+        return isinstance(error, TelegramBadRequest) and "not found" in error.message.lower()
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        method_type = type(method)
+        chat_id = getattr(method, "chat_id", None)
+        ttl = self.ttls.get(method_type)
+        if ttl is None:
+            if chat_id is not None and method.__api_method__.startswith(INVALIDATING_PREFIXES):
+                self.invalidate(bot.id, chat_id)
+            return await make_request(bot, method)
+
+        key = (bot.id, method_type, method.model_dump_json(exclude_none=True))
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, result, error, _ = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                if error is not None:
+                    self._negative_hits += 1
+                    # Traceback of the shared error instance should not grow
+                    raise error.with_traceback(None)
+                self._hits += 1
+                return result  # type: ignore[no-any-return]
+            self._drop(key)
+
+        self._misses += 1
+        try:
+            result = await make_request(bot, method)
+        except TelegramAPIError as e:
+            if self.negative_ttl > 0 and self._is_not_found(e):
+                self._store(key, chat_id, self.negative_ttl, None, e)
+            raise
+        self._store(key, chat_id, ttl, result)
+        return result
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aiogram import loggers
+from aiogram.exceptions import (
+    RestartingTelegram,
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+DEFAULT_RETRY_BACKOFF_CONFIG = BackoffConfig(min_delay=0.5, max_delay=10.0, factor=2.0, jitter=0.2)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy of the method
+    """
+
+    retry_on: tuple[type[Exception], ...]
+    """Errors that should be retried"""
+    max_retries: int = 3
+    """Maximum number of retries of the request"""
+    backoff_config: BackoffConfig = DEFAULT_RETRY_BACKOFF_CONFIG
+    """Delays between retries, for the flood control errors the requested delay is used"""
+    max_retry_after: float = 60.0
+    """Flood control errors with the longer delay are not retried"""
+
+
+# When the request is failed with the flood control error or Telegram is restarting
+# the request is not processed by the server, so it is safe to retry any method
+DEFAULT_POLICY = RetryPolicy(retry_on=(TelegramRetryAfter, RestartingTelegram))
+# Server and network errors can occur after the request is processed,
+# so by default they are retried only for the methods that don't change anything
+SAFE_POLICY = RetryPolicy(
+    retry_on=(TelegramRetryAfter, TelegramServerError, TelegramNetworkError),
+)
+
+
+class RetryBudget:
+    """
+    Limits the share of retries in the total number of requests to avoid retry storms
+    when the Bot API server is down
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 100.0) -> None:
+        """
+        :param ratio: Number of retries allowed per request
+        :param max_tokens: Maximum number of retries that can be accumulated
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RetryMiddleware(BaseRequestMiddleware):
+    def __init__(
+        self,
+        default_policy: RetryPolicy = DEFAULT_POLICY,
+        safe_policy: RetryPolicy = SAFE_POLICY,
+        policies: dict[type[TelegramMethod[Any]], RetryPolicy | None] | None = None,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """
+        Middleware that retries requests failed with the transient errors
+
+        Methods which names start with :code:`get` use the :code:`safe_policy`,
+        other methods use the :code:`default_policy`.
+
+        :param default_policy: Retry policy of the methods that change something
+        :param safe_policy: Retry policy of the methods that only read something
+        :param policies: Retry policies of the specific methods, :code:`None` disables retries
+        :param budget: Retry budget shared by all requests
+        """
+        self.default_policy = default_policy
+        self.safe_policy = safe_policy
+        self.policies = policies or {}
+        self.budget = budget or RetryBudget()
+
+        self.retries: Counter[tuple[str, str]] = Counter()
+        """Number of retries by method and error type names"""
+        self.failures: Counter[tuple[str, str]] = Counter()
+        """Number of failed requests that were not retried by method and error type names"""
+
+    def get_policy(self, method: TelegramMethod[Any]) -> RetryPolicy | None:
+        method_type = type(method)
+        if method_type in self.policies:
+            return self.policies[method_type]
+        if method.__api_method__.startswith("get"):
+            return self.safe_policy
+        return self.default_policy
+
+    def _get_delay(self, policy: RetryPolicy, backoff: Backoff, error: Exception) -> float:
+        delay = max(next(backoff), 0.0)
+        if isinstance(error, TelegramRetryAfter):
+            # Jitter prevents all delayed requests from being sent at the same time
+            delay = max(delay, error.retry_after + random.uniform(0, policy.backoff_config.jitter))
+        return delay
+
+    def _should_retry(
+        self,
+        policy: RetryPolicy,
+        error: Exception,
+        retries: int,
+    ) -> bool:
+        if not isinstance(error, policy.retry_on) or isinstance(error, TelegramEntityTooLarge):
+            return False
+        if retries >= policy.max_retries:
+            return False
+        if isinstance(error, TelegramRetryAfter) and error.retry_after > policy.max_retry_after:
+            return False
+        return self.budget.withdraw()
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        policy = self.get_policy(method)
+        if policy is None:
+            return await make_request(bot, method)
+
+        self.budget.deposit()
+        backoff = Backoff(config=policy.backoff_config)
+        retries = 0
+        while True:
+            try:
+                return await make_request(bot, method)
+            except Exception as e:  # noqa: PERF203
+                key = (type(method).__name__, type(e).__name__)
+                if not self._should_retry(policy, e, retries):
+                    if isinstance(e, policy.retry_on):
+                        self.failures[key] += 1
+                    raise
+
+                retries += 1
+                self.retries[key] += 1
+                delay = self._get_delay(policy, backoff, e)
+                loggers.middlewares.warning(
+                    "Request with method=%r by bot id=%d failed with %s, retry %d/%d in %.2fs",
+                    type(method).__name__,
+                    bot.id,
+                    type(e).__name__,
+                    retries,
+                    policy.max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
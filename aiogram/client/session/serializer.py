@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import datetime
+import secrets
+from collections.abc import Callable
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin
+
+from pydantic import BaseModel, PlainSerializer
+
+from aiogram.client.default import Default
+from aiogram.types import InputFile
+from aiogram.types.base import DEFERRED_FIELDS_KEY
+from aiogram.types.custom import _datetime_serializer
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+
+_ModelSerializer = Callable[[BaseModel, "Bot", dict[str, InputFile]], dict[str, Any]]
+
+# Values of these types are sent as is, exact types are checked to not skip subclasses like enums
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
+def prepare_value(value: Any, bot: Bot, files: dict[str, InputFile]) -> Any:
+    """
+    Prepare value to be sent, the result is equal to
+    :code:`BaseSession.prepare_value(value, _dumps_json=False)` applied
+    to the value dumped by pydantic, but without intermediate copies of the nested objects.
+
+    :return: Prepared value or :code:`None` if the value should be skipped
+    """
+    if value is None or type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, BaseModel):
+        return get_model_serializer(type(value))(value, bot, files)
+    if isinstance(value, dict):
+        return {
+            key: prepared_item
+            for key, item in value.items()
+            if (prepared_item := prepare_value(item, bot, files)) is not None
+        }
+    if isinstance(value, list):
+        return [
+            prepared_item
+            for item in value
+            if (prepared_item := prepare_value(item, bot, files)) is not None
+        ]
+    if isinstance(value, str):
+        return value
+    if isinstance(value, Default):
+        return prepare_value(bot.default[value.name], bot, files)
+    if isinstance(value, InputFile):
+        key = secrets.token_urlsafe(10)
+        files[key] = value
+        return f"attach://{key}"
+    if isinstance(value, datetime.timedelta):
+        now = datetime.datetime.now()  # noqa: DTZ005
+        return str(round((now + value).timestamp()))
+    if isinstance(value, datetime.datetime):
+        return str(round(value.timestamp()))
+    if isinstance(value, Enum):
+        return prepare_value(value.value, bot, files)
+    return value
+
+
+def _find_serializers(annotation: Any) -> list[PlainSerializer]:
+    if get_origin(annotation) is Annotated:
+        origin, *metadata = get_args(annotation)
+        return [
+            item for item in metadata if isinstance(item, PlainSerializer)
+        ] + _find_serializers(origin)
+    return [serializer for arg in get_args(annotation) for serializer in _find_serializers(arg)]
+
+
+def _dump_model(model: BaseModel, bot: Bot, files: dict[str, InputFile]) -> dict[str, Any]:
+    return {
+        key: prepared_value
+        for key, value in model.model_dump(warnings=False).items()
+        if (prepared_value := prepare_value(value, bot, files)) is not None
+    }
+
+
+def _compile(model_type: type[BaseModel]) -> _ModelSerializer:
+    decorators = model_type.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        # Custom serialization can't be reproduced, so the object is dumped by pydantic
+        return _dump_model
+
+    # (field name, serializer of the DateTime values)
+    fields: list[tuple[str, Callable[[Any], Any] | None]] = []
+    for name, field in model_type.model_fields.items():
+        if field.exclude:
+            continue
+        serializers = [
+            item for item in field.metadata if isinstance(item, PlainSerializer)
+        ] + _find_serializers(field.annotation)
+        if not serializers:
+            fields.append((name, None))
+        elif len(serializers) == 1 and serializers[0].func is _datetime_serializer:
+            fields.append((name, _datetime_serializer))
+        else:
+            return _dump_model
+    compiled_fields = tuple(fields)
+
+    def serialize(model: BaseModel, bot: Bot, files: dict[str, InputFile]) -> dict[str, Any]:
+        private = model.__pydantic_private__
+        if private and DEFERRED_FIELDS_KEY in private:
+            model.resolve_deferred_fields()  # type: ignore[attr-defined]
+
+        data = model.__dict__
+        result: dict[str, Any] = {}
+        for name, serializer in compiled_fields:
+            value = data.get(name)
+            if value is None:
+                continue
+            if type(value) not in _SCALAR_TYPES:
+                if serializer is not None and isinstance(value, datetime.datetime):
+                    value = serializer(value)
+                value = prepare_value(value, bot, files)
+                if value is None:
+                    continue
+            result[name] = value
+        if model.__pydantic_extra__:
+            for name, value in model.__pydantic_extra__.items():
+                if (prepared_value := prepare_value(value, bot, files)) is not None:
+                    result[name] = prepared_value
+        return result
+
+    return serialize
+
+
+_serializers: dict[type[BaseModel], _ModelSerializer] = {}
+
+
+def get_model_serializer(model_type: type[BaseModel]) -> _ModelSerializer:
+    """
+    Get serializer of the model class, compiled once on the first usage
+
+    Serializer emits fields ready to be sent in a single traversal of the object:
+    empty values are skipped, bot defaults are resolved and files are collected.
+    """
+    serializer = _serializers.get(model_type)
+    if serializer is None:
+        serializer = _serializers[model_type] = _compile(model_type)
+    return serializer
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiogram.client.bot import Bot
+    from aiogram.types import InputFile
+
+UploadProgressCallback = Callable[["InputFile", int, int | None], Awaitable[None]]
+"""
+Callback called after each chunk of the file is sent with the file,
+number of bytes sent so far and the total size of the file if it is known
+"""
+
+
+class UploadMemoryLimiter:
+    """
+    Limits the total size of the chunks held in memory by the concurrent uploads
+
+    Each upload reserves the chunk size of the file before reading the next chunk
+    and releases it after the chunk is written to the connection,
+    so uploads over the limit wait for the memory instead of reading ahead.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        :param limit: Maximum number of bytes held by the uploads at the same time
+        """
+        if limit <= 0:
+            msg = "Upload memory limit should be positive"
+            raise ValueError(msg)
+        self.limit = limit
+        self.used = 0
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of uploads waiting for the memory
+        """
+        return len(self._waiters)
+
+    async def acquire(self, size: int) -> int:
+        """
+        Wait until the requested number of bytes is available and reserve it,
+        uploads get the memory in the order they requested it
+
+        Chunks bigger than the limit are allowed when no other chunk is held.
+
+        :return: Number of reserved bytes, should be passed to :meth:`release`
+        """
+        size = min(size, self.limit)
+        if not self._waiters and self.used + size <= self.limit:
+            self.used += size
+            return size
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((size, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The memory is reserved right before the cancellation
+                self.release(size)
+            else:
+                self._waiters.remove((size, waiter))
+                # Uploads queued after the cancelled one may fit now
+                self.release(0)
+            raise
+        return size
+
+    def release(self, size: int) -> None:
+        self.used -= size
+        while self._waiters:
+            waiter_size, waiter = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.used + waiter_size > self.limit:
+                break
+            self._waiters.popleft()
+            self.used += waiter_size
+            waiter.set_result(None)
+
+
+async def stream_file(
+    file: InputFile,
+    bot: Bot,
+    limiter: UploadMemoryLimiter | None = None,
+    progress: UploadProgressCallback | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Read the file chunk by chunk to be written to the request body,
+    the next chunk is read only after the previous one is sent
+
+    :param file: File to be uploaded
+    :param bot: Bot instance
+    :param limiter: Memory limiter shared by the concurrent uploads
+    :param progress: Upload progress callback
+    """
+    total = file.size if progress is not None else None
+    uploaded = 0
+    reader = file.read(bot)
+    try:
+        while True:
+            reserved = await limiter.acquire(file.chunk_size) if limiter is not None else 0
+            try:
+                try:
+                    chunk = await anext(reader)
+                except StopAsyncIteration:
+                    return
+                # The generator is resumed after the consumer has written the chunk
+                yield chunk
+            finally:
+                if limiter is not None:
+                    limiter.release(reserved)
+            uploaded += len(chunk)
+            if progress is not None:
+                await progress(file, uploaded, total)
+    finally:
+        await reader.aclose()
@@ -4,11 +4,12 @@ import asyncio
 import contextvars
 import signal
 import sys
+import time
 import warnings
 from asyncio import CancelledError, Event, Future, Lock
-from collections.abc import AsyncGenerator, Awaitable
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from aiogram import loggers
 from aiogram.exceptions import TelegramAPIError
@@ -18,7 +19,7 @@ from aiogram.fsm.storage.memory import DisabledEventIsolation, MemoryStorage
 from aiogram.fsm.strategy import FSMStrategy
 from aiogram.methods import GetUpdates, TelegramMethod
 from aiogram.types import Update, User
-from aiogram.types.base import UNSET, UNSET_TYPE
+from aiogram.types.base import LAZY_CONTEXT_KEY, UNSET, UNSET_TYPE
 from aiogram.types.update import UpdateTypeLookupError
 from aiogram.utils.backoff import Backoff, BackoffConfig
 
@@ -26,7 +27,11 @@ from .event.bases import UNHANDLED, SkipHandler
 from .event.telegram import TelegramEventObserver
 from .middlewares.error import ErrorsMiddleware
 from .middlewares.user_context import UserContextMiddleware
+from .offset.base import BaseOffsetStorage, OffsetTracker
+from .prefetch import PollingMetrics, UpdatesPrefetcher
+from .raw import GetRawUpdates, RawUpdate
 from .router import Router
+from .worker_pool import ShardedWorkerPool
 
 if TYPE_CHECKING:
     from aiogram.client.bot import Bot
@@ -47,7 +52,9 @@ class Dispatcher(Router):
         fsm_strategy: FSMStrategy = FSMStrategy.USER_IN_CHAT,
         events_isolation: BaseEventIsolation | None = None,
         disable_fsm: bool = False,
+        fsm_transactional: bool = False,
         name: str | None = None,
+        lazy_updates: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -58,6 +65,12 @@ class Dispatcher(Router):
         :param events_isolation: Events isolation
         :param disable_fsm: Disable FSM, note that if you disable FSM
             then you should not use storage and events isolation
+        :param fsm_transactional: Load FSM state and data of the update once and write
+            the changes once when the handlers return instead of accessing the storage
+            on each call of the :class:`aiogram.fsm.context.FSMContext` methods
+        :param lazy_updates: Validate optional nested objects of incoming events
+            (like :code:`reply_to_message`, :code:`entities` or :code:`from_user`)
+            only on the first access to them
         :param kwargs: Other arguments, will be passed as keyword arguments to handlers
         """
         super().__init__(name=name)
@@ -89,6 +102,7 @@ class Dispatcher(Router):
             storage=storage or MemoryStorage(),
             strategy=fsm_strategy,
             events_isolation=events_isolation or DisabledEventIsolation(),
+            transactional=fsm_transactional,
         )
         if not disable_fsm:
             # Note that when FSM middleware is disabled, the event isolation is also disabled
@@ -96,11 +110,13 @@ class Dispatcher(Router):
             self.update.outer_middleware(self.fsm)
         self.shutdown.register(self.fsm.close)
 
+        self.lazy_updates = lazy_updates
         self.workflow_data: dict[str, Any] = kwargs
         self._running_lock = Lock()
         self._stop_signal: Event | None = None
         self._stopped_signal: Event | None = None
         self._handle_update_tasks: set[asyncio.Task[Any]] = set()
+        self.polling_metrics: dict[int, PollingMetrics] = {}
 
     def __getitem__(self, item: str) -> Any:
         return self.workflow_data[item]
@@ -161,8 +177,7 @@ class Dispatcher(Router):
             update = Update.model_validate(update.model_dump(), context={"bot": bot})
 
         try:
-            response = await self.update.wrap_outer_middleware(
-                self.update.trigger,
+            response = await self.update._resolve_trigger_chain()(
                 update,
                 {
                     **self.workflow_data,
@@ -183,16 +198,37 @@ class Dispatcher(Router):
                 bot.id,
             )
 
-    async def feed_raw_update(self, bot: Bot, update: dict[str, Any], **kwargs: Any) -> Any:
+    def _validate_raw_update(self, bot: Bot, update: dict[str, Any] | bytes | str) -> Update:
+        """
+        Deserialize raw update, JSON is parsed by pydantic-core without building Python objects
+        first, in the lazy mode nested objects of the event are validated on the first access
+        """
+        if self.lazy_updates:
+            if not isinstance(update, dict):
+                update = bot.session.json_loads(update)
+            return Update.model_validate(update, context={"bot": bot, LAZY_CONTEXT_KEY: True})
+        if isinstance(update, dict):
+            return Update.model_validate(update, context={"bot": bot})
+        if bot.session.uses_default_json_loads:
+            return Update.model_validate_json(update, context={"bot": bot})
+        return Update.model_validate(bot.session.json_loads(update), context={"bot": bot})
+
+    async def feed_raw_update(
+        self,
+        bot: Bot,
+        update: Update | dict[str, Any] | bytes | str,
+        **kwargs: Any,
+    ) -> Any:
         """
         Main entry point for incoming updates with automatic Dict->Update serializer
 
         :param bot:
-        :param update:
+        :param update: raw update as dictionary or JSON string (bytes), or validated update
         :param kwargs:
         """
-        parsed_update = Update.model_validate(update, context={"bot": bot})
-        return await self._feed_webhook_update(bot=bot, update=parsed_update, **kwargs)
+        if not isinstance(update, Update):
+            update = self._validate_raw_update(bot, update)
+        return await self._feed_webhook_update(bot=bot, update=update, **kwargs)
 
     @classmethod
     async def _listen_updates(
@@ -201,22 +237,45 @@ class Dispatcher(Router):
         polling_timeout: int = 30,
         backoff_config: BackoffConfig = DEFAULT_BACKOFF_CONFIG,
         allowed_updates: list[str] | None = None,
+        get_updates_type: type[GetUpdates] = GetUpdates,
+        limit: int | None = None,
+        metrics: PollingMetrics | None = None,
+        offset_tracker: OffsetTracker | None = None,
     ) -> AsyncGenerator[Update, None]:
         """
         Endless updates reader with correctly handling any server-side or connection errors.
 
         So you may not worry that the polling will stop working.
+
+        :param get_updates_type: GetUpdates method class, can be replaced to change
+            the way how updates are deserialized
+        :param limit: Maximum number of updates to be retrieved by one request
+        :param metrics: Polling metrics to be updated
+        :param offset_tracker: Offset tracker, when specified the polling is started
+            from the stored offset and the next updates are requested only after
+            all previous ones are processed
         """
         backoff = Backoff(config=backoff_config)
-        get_updates = GetUpdates(timeout=polling_timeout, allowed_updates=allowed_updates)
+        get_updates = get_updates_type(
+            timeout=polling_timeout,
+            allowed_updates=allowed_updates,
+            limit=limit,
+        )
         kwargs = {}
         if bot.session.timeout:
             # Request timeout can be lower than session timeout and that's OK.
             # To prevent false-positive TimeoutError we should wait longer than polling timeout
             kwargs["request_timeout"] = int(bot.session.timeout + polling_timeout)
+        if offset_tracker is not None:
+            get_updates.offset = await offset_tracker.load()
         failed = False
         while True:
+            if offset_tracker is not None:
+                # The next request confirms all previous updates on the server,
+                # so it is sent only when they are processed and the offset is committed
+                await offset_tracker.wait_and_commit()
             try:
+                started_at = time.monotonic()
                 updates = await bot(get_updates, **kwargs)
             except Exception as e:  # noqa: BLE001
                 failed = True
@@ -244,7 +303,12 @@ class Dispatcher(Router):
                 backoff.reset()
                 failed = False
 
+            if metrics is not None:
+                metrics.observe_fetch(time.monotonic() - started_at, len(updates))
+
             for update in updates:
+                if offset_tracker is not None:
+                    offset_tracker.begin(update.update_id)
                 yield update
                 # The getUpdates method returns the earliest 100 unconfirmed updates.
                 # To confirm an update, use the offset parameter when calling getUpdates
@@ -359,6 +423,11 @@ class Dispatcher(Router):
         backoff_config: BackoffConfig = DEFAULT_BACKOFF_CONFIG,
         allowed_updates: list[str] | None = None,
         tasks_concurrency_limit: int | None = None,
+        workers: int | None = None,
+        workers_queue_size: int = 100,
+        polling_limit: int | None = None,
+        prefetch_size: int | None = None,
+        offset_storage: BaseOffsetStorage | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -371,6 +440,19 @@ class Dispatcher(Router):
         :param allowed_updates: List of the update types you want your bot to receive
         :param tasks_concurrency_limit: Maximum number of concurrent updates to process
             (None = no limit), used only if handle_as_tasks is True
+        :param workers: Number of workers processing updates in order per chat
+            (None = run task for each update), used only if handle_as_tasks is True
+        :param workers_queue_size: Maximum number of pending updates per worker,
+            polling is paused while the queue is full
+        :param polling_limit: Maximum number of updates to be retrieved by one request
+            (None = server default, 100)
+        :param prefetch_size: Maximum number of prefetched updates, when specified the next
+            updates are requested while the current ones are being dispatched
+            (None = request next updates only after all previous ones are dispatched)
+        :param offset_storage: Storage of the polling offset, when specified the polling
+            is resumed from the stored offset and the offset is committed only after
+            all fetched updates are processed, so the next updates are not requested
+            meanwhile and it can't be combined with prefetch_size
         :param kwargs:
         :return:
         """
@@ -382,34 +464,104 @@ class Dispatcher(Router):
             user.full_name,
         )
 
+        offset_tracker = None
+        if offset_storage is not None:
+            offset_tracker = OffsetTracker(offset_storage, bot_id=bot.id)
+
+        # Create workers pool if workers count is specified,
+        # it takes precedence over tasks concurrency limit
+        worker_pool = None
+        if workers is not None and handle_as_tasks:
+
+            async def process_update(update: Update) -> bool:
+                handle_update = self._process_update(bot=bot, update=update, **kwargs)
+                if offset_tracker is not None:
+                    return await offset_tracker.track(handle_update)
+                return await handle_update
+
+            worker_pool = ShardedWorkerPool(
+                process_update,
+                workers=workers,
+                queue_size=workers_queue_size,
+            )
+            worker_pool.start()
+
+        get_updates_type: type[GetUpdates] = GetUpdates
+        if self.lazy_updates:
+            # Updates are fetched without deserialization to be validated lazily
+            get_updates_type = GetRawUpdates
+
         # Create semaphore if tasks_concurrency_limit is specified
         semaphore = None
-        if tasks_concurrency_limit is not None and handle_as_tasks:
+        if tasks_concurrency_limit is not None and handle_as_tasks and worker_pool is None:
             semaphore = asyncio.Semaphore(tasks_concurrency_limit)
 
-        try:
-            async for update in self._listen_updates(
-                bot,
-                polling_timeout=polling_timeout,
-                backoff_config=backoff_config,
-                allowed_updates=allowed_updates,
-            ):
-                handle_update = self._process_update(bot=bot, update=update, **kwargs)
-                if handle_as_tasks:
-                    if semaphore:
-                        # Use semaphore to limit concurrent tasks
-                        await semaphore.acquire()
-                        handle_update_task = asyncio.create_task(
-                            self._process_with_semaphore(handle_update, semaphore),
-                        )
-                    else:
-                        handle_update_task = asyncio.create_task(handle_update)
-
-                    self._handle_update_tasks.add(handle_update_task)
-                    handle_update_task.add_done_callback(self._handle_update_tasks.discard)
+        metrics = self.polling_metrics[bot.id] = PollingMetrics()
+        listen_updates = self._listen_updates(
+            bot,
+            polling_timeout=polling_timeout,
+            backoff_config=backoff_config,
+            allowed_updates=allowed_updates,
+            get_updates_type=get_updates_type,
+            limit=polling_limit,
+            metrics=metrics,
+            offset_tracker=offset_tracker,
+        )
+        updates: AsyncIterable[Update] = listen_updates
+        prefetcher = None
+        if prefetch_size is not None:
+            # Next updates are fetched in the background while the current ones are dispatched
+            prefetcher = UpdatesPrefetcher(
+                listen_updates,
+                queue_size=prefetch_size,
+                metrics=metrics,
+            )
+            updates = prefetcher
+
+        async def dispatch(update: Update, wait: bool = False) -> None:
+            if self.lazy_updates:
+                update = self._validate_raw_update(bot, cast(RawUpdate, update).to_dict())
+
+            if worker_pool:
+                # Waits when the worker queue is full, so the next updates
+                # will not be fetched until workers are saturated
+                await worker_pool.put(update)
+                return
+
+            handle_update = self._process_update(bot=bot, update=update, **kwargs)
+            if offset_tracker is not None:
+                handle_update = offset_tracker.track(handle_update)
+            if handle_as_tasks and not wait:
+                if semaphore:
+                    # Use semaphore to limit concurrent tasks
+                    await semaphore.acquire()
+                    handle_update_task = asyncio.create_task(
+                        self._process_with_semaphore(handle_update, semaphore),
+                    )
                 else:
-                    await handle_update
+                    handle_update_task = asyncio.create_task(handle_update)
+
+                self._handle_update_tasks.add(handle_update_task)
+                handle_update_task.add_done_callback(self._handle_update_tasks.discard)
+            else:
+                await handle_update
+
+        try:
+            async for update in updates:
+                await dispatch(update)
         finally:
+            if prefetcher:
+                await prefetcher.close()
+                # Prefetched updates are already confirmed on the server
+                # by the next getUpdates request, so they are dispatched before the stop
+                for update in prefetcher.drain():
+                    await dispatch(update, wait=True)
+            if worker_pool:
+                await worker_pool.close()
+            if offset_tracker is not None:
+                # Offset is committed only when there are no updates in progress,
+                # otherwise they will be received again after restart
+                await offset_tracker.commit()
             loggers.dispatcher.info(
                 "Polling stopped for bot @%s id=%d - %r",
                 user.username,
@@ -436,12 +588,12 @@ class Dispatcher(Router):
     async def feed_webhook_update(
         self,
         bot: Bot,
-        update: Update | dict[str, Any],
+        update: Update | dict[str, Any] | bytes | str,
         _timeout: float = 55,
         **kwargs: Any,
     ) -> TelegramMethod[TelegramType] | None:
         if not isinstance(update, Update):  # Allow to use raw updates
-            update = Update.model_validate(update, context={"bot": bot})
+            update = self._validate_raw_update(bot, update)
 
         ctx = contextvars.copy_context()
         loop = asyncio.get_running_loop()
@@ -527,6 +679,11 @@ class Dispatcher(Router):
         handle_signals: bool = True,
         close_bot_session: bool = True,
         tasks_concurrency_limit: int | None = None,
+        workers: int | None = None,
+        workers_queue_size: int = 100,
+        polling_limit: int | None = None,
+        prefetch_size: int | None = None,
+        offset_storage: BaseOffsetStorage | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -542,6 +699,19 @@ class Dispatcher(Router):
         :param close_bot_session: close bot sessions on shutdown
         :param tasks_concurrency_limit: Maximum number of concurrent updates to process
             (None = no limit), used only if handle_as_tasks is True
+        :param workers: Number of workers processing updates in order per chat
+            (None = run task for each update), requires handle_as_tasks to be True
+        :param workers_queue_size: Maximum number of pending updates per worker,
+            polling is paused while the queue is full
+        :param polling_limit: Maximum number of updates to be retrieved by one request
+            (None = server default, 100)
+        :param prefetch_size: Maximum number of prefetched updates, when specified the next
+            updates are requested while the current ones are being dispatched
+            (None = request next updates only after all previous ones are dispatched)
+        :param offset_storage: Storage of the polling offset, when specified the polling
+            is resumed from the stored offset and the offset is committed only after
+            all fetched updates are processed, so the next updates are not requested
+            meanwhile and it can't be combined with prefetch_size
         :param kwargs: contextual data
         :return:
         """
@@ -554,6 +724,14 @@ class Dispatcher(Router):
                 "the bot instance should be passed as positional argument"
             )
             raise ValueError(msg)
+        if workers is not None and not handle_as_tasks:
+            msg = "Workers can be used only when handle_as_tasks is True"
+            raise ValueError(msg)
+        if prefetch_size is not None and offset_storage is not None:
+            # The next updates are requested only after the offset is committed,
+            # so there is nothing to prefetch
+            msg = "prefetch_size can't be combined with offset_storage"
+            raise ValueError(msg)
 
         async with self._running_lock:  # Prevent to run this method twice at a once
             if self._stop_signal is None:
@@ -593,6 +771,9 @@ class Dispatcher(Router):
                 workflow_data.pop("bot")
 
             await self.emit_startup(bot=bots[-1], **workflow_data)
+            # Startup callbacks can register handlers or middlewares,
+            # so the dispatch plan should be compiled right after them
+            self.compile_dispatch_plan()
             loggers.dispatcher.info("Start polling")
             try:
                 tasks: list[asyncio.Task[Any]] = [
@@ -604,6 +785,11 @@ class Dispatcher(Router):
                             backoff_config=backoff_config,
                             allowed_updates=allowed_updates,
                             tasks_concurrency_limit=tasks_concurrency_limit,
+                            workers=workers,
+                            workers_queue_size=workers_queue_size,
+                            polling_limit=polling_limit,
+                            prefetch_size=prefetch_size,
+                            offset_storage=offset_storage,
                             **workflow_data,
                         ),
                     )
@@ -627,6 +813,8 @@ class Dispatcher(Router):
                 finally:
                     if close_bot_session:
                         await asyncio.gather(*(bot.session.close() for bot in bots))
+                    if offset_storage is not None:
+                        await offset_storage.close()
                 self._stopped_signal.set()
 
     def run_polling(
@@ -639,6 +827,12 @@ class Dispatcher(Router):
         handle_signals: bool = True,
         close_bot_session: bool = True,
         tasks_concurrency_limit: int | None = None,
+        workers: int | None = None,
+        workers_queue_size: int = 100,
+        polling_limit: int | None = None,
+        prefetch_size: int | None = None,
+        offset_storage: BaseOffsetStorage | None = None,
+        processes: int | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -653,9 +847,60 @@ class Dispatcher(Router):
         :param close_bot_session: close bot sessions on shutdown
         :param tasks_concurrency_limit: Maximum number of concurrent updates to process
             (None = no limit), used only if handle_as_tasks is True
+        :param workers: Number of workers processing updates in order per chat
+            (None = run task for each update), requires handle_as_tasks to be True
+        :param workers_queue_size: Maximum number of pending updates per worker,
+            polling is paused while the queue is full
+        :param polling_limit: Maximum number of updates to be retrieved by one request
+            (None = server default, 100)
+        :param prefetch_size: Maximum number of prefetched updates, when specified the next
+            updates are requested while the current ones are being dispatched
+            (None = request next updates only after all previous ones are dispatched)
+        :param offset_storage: Storage of the polling offset, when specified the polling
+            is resumed from the stored offset and the offset is committed only after
+            all fetched updates are processed, so the next updates are not requested
+            meanwhile and it can't be combined with prefetch_size
+        :param processes: Number of worker processes (None = process updates in the
+            current process), see :class:`aiogram.dispatcher.multiprocess.MultiProcessPolling`,
+            can't be combined with handle_as_tasks=False, handle_signals=False,
+            close_bot_session=False, tasks_concurrency_limit, polling_limit,
+            prefetch_size and offset_storage
         :param kwargs: contextual data
         :return:
         """
+        if processes is not None:
+            from .multiprocess import MultiProcessPolling
+
+            # Worker processes always handle updates by the workers in order per chat,
+            # handle signals and close bot sessions by themselves
+            unsupported = {
+                "handle_as_tasks": not handle_as_tasks,
+                "handle_signals": not handle_signals,
+                "close_bot_session": not close_bot_session,
+                "tasks_concurrency_limit": tasks_concurrency_limit is not None,
+                "polling_limit": polling_limit is not None,
+                "prefetch_size": prefetch_size is not None,
+                "offset_storage": offset_storage is not None,
+            }
+            if any(unsupported.values()):
+                names = ", ".join(name for name, value in unsupported.items() if value)
+                msg = f"Arguments {names} are not supported with processes"
+                raise ValueError(msg)
+            if allowed_updates is UNSET:
+                allowed_updates = self.resolve_used_update_types()
+            if workers is not None:
+                kwargs["workers"] = workers
+            return MultiProcessPolling(
+                self,
+                *bots,
+                processes=processes,
+                queue_size=workers_queue_size,
+                polling_timeout=polling_timeout,
+                backoff_config=backoff_config,
+                allowed_updates=allowed_updates,
+                **kwargs,
+            ).run()
+
         with suppress(KeyboardInterrupt):
             coro = self.start_polling(
                 *bots,
@@ -667,6 +912,11 @@ class Dispatcher(Router):
                 handle_signals=handle_signals,
                 close_bot_session=close_bot_session,
                 tasks_concurrency_limit=tasks_concurrency_limit,
+                workers=workers,
+                workers_queue_size=workers_queue_size,
+                polling_limit=polling_limit,
+                prefetch_size=prefetch_size,
+                offset_storage=offset_storage,
             )
 
             try:
@@ -7,7 +7,7 @@ from aiogram.dispatcher.middlewares.manager import MiddlewareManager
 from aiogram.exceptions import UnsupportedKeywordArgument
 from aiogram.filters.base import Filter
 
-from .bases import UNHANDLED, MiddlewareType, SkipHandler
+from .bases import UNHANDLED, MiddlewareType, NextMiddlewareType, SkipHandler
 from .handler import CallbackType, FilterObject, HandlerObject
 
 if TYPE_CHECKING:
@@ -29,13 +29,32 @@ class TelegramEventObserver:
 
         self.handlers: list[HandlerObject] = []
 
-        self.middleware = MiddlewareManager()
-        self.outer_middleware = MiddlewareManager()
+        self.middleware = MiddlewareManager(on_change=self._on_middlewares_changed)
+        self.outer_middleware = MiddlewareManager(on_change=self._on_middlewares_changed)
 
         # Re-used filters check method from already implemented handler object
         # with dummy callback which never will be used
         self._handler = HandlerObject(callback=lambda: True, filters=[])
 
+        # Pre-built middleware chains, filled lazily on first use and dropped
+        # each time when the routers tree, handlers or middlewares are changed
+        self._middleware_chains: dict[
+            int,
+            tuple[HandlerObject, NextMiddlewareType[TelegramObject]],
+        ] = {}
+        self._trigger_chain: NextMiddlewareType[TelegramObject] | None = None
+
+    def _on_middlewares_changed(self) -> None:
+        # Middlewares of this observer are also used by observers of all nested routers
+        self.router.invalidate_dispatch_plan()
+
+    def invalidate_dispatch_plan(self) -> None:
+        """
+        Drop pre-built middleware chains of this observer
+        """
+        self._middleware_chains.clear()
+        self._trigger_chain = None
+
     def filter(self, *filters: CallbackType) -> None:
         """
         Register filter for all handlers of this event observer
@@ -90,6 +109,7 @@ class TelegramEventObserver:
                 flags=flags,
             ),
         )
+        self.router.invalidate_dispatch_plan()
 
         return callback
 
@@ -105,9 +125,38 @@ class TelegramEventObserver:
         )
         return wrapped_outer(event, data)
 
+    def _resolve_trigger_chain(self) -> NextMiddlewareType[TelegramObject]:
+        """
+        Get :meth:`trigger` wrapped with outer middlewares of this observer
+        """
+        if self._trigger_chain is None:
+            self._trigger_chain = self.middleware.wrap_middlewares(
+                self.outer_middleware,
+                self.trigger,
+            )
+        return self._trigger_chain
+
     def check_root_filters(self, event: TelegramObject, **kwargs: Any) -> Any:
         return self._handler.check(event, **kwargs)
 
+    def _resolve_middleware_chain(
+        self,
+        handler: HandlerObject,
+    ) -> NextMiddlewareType[TelegramObject]:
+        """
+        Get inner middlewares chain wrapped around the handler,
+        the chain is built only once and then re-used for all next events
+        """
+        cached = self._middleware_chains.get(id(handler))
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+        chain = self.outer_middleware.wrap_middlewares(
+            self._resolve_middlewares(),
+            handler.call,
+        )
+        self._middleware_chains[id(handler)] = handler, chain
+        return chain
+
     async def trigger(self, event: TelegramObject, **kwargs: Any) -> Any:
         """
         Propagate event to handlers and stops propagation on first match.
@@ -119,10 +168,7 @@ class TelegramEventObserver:
             if result:
                 kwargs.update(data)
                 try:
-                    wrapped_inner = self.outer_middleware.wrap_middlewares(
-                        self._resolve_middlewares(),
-                        handler.call,
-                    )
+                    wrapped_inner = self._resolve_middleware_chain(handler)
                     return await wrapped_inner(event, kwargs)
                 except SkipHandler:
                     continue
@@ -12,18 +12,29 @@ from aiogram.types import TelegramObject
 
 
 class MiddlewareManager(Sequence[MiddlewareType[TelegramObject]]):
-    def __init__(self) -> None:
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        """
+        :param on_change: Optional callback that is called each time the list of middlewares
+            is changed, used by observers to invalidate pre-built middleware chains
+        """
         self._middlewares: list[MiddlewareType[TelegramObject]] = []
+        self._on_change = on_change
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
 
     def register(
         self,
         middleware: MiddlewareType[TelegramObject],
     ) -> MiddlewareType[TelegramObject]:
         self._middlewares.append(middleware)
+        self._changed()
         return middleware
 
     def unregister(self, middleware: MiddlewareType[TelegramObject]) -> None:
         self._middlewares.remove(middleware)
+        self._changed()
 
     def __call__(
         self,
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from aiogram import loggers
+from aiogram.types import Update
+from aiogram.utils.backoff import BackoffConfig
+
+from .dispatcher import DEFAULT_BACKOFF_CONFIG
+from .raw import GetRawUpdates, RawUpdate
+from .worker_pool import ShardedWorkerPool
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue
+
+    from aiogram.client.bot import Bot
+
+    from .dispatcher import Dispatcher
+
+_HASH_MASK = (1 << 64) - 1
+
+# Nested objects of the event which can contain the chat or the user of the event
+# in order of priority, the same as used by UserContextMiddleware
+_RAW_CONTEXT_PATHS: tuple[tuple[str, ...], ...] = (
+    ("chat",),
+    ("message", "chat"),
+    ("voter_chat",),
+    ("from",),
+    ("user",),
+)
+
+
+def resolve_raw_update_key(update: dict[str, Any]) -> int:
+    """
+    Resolve the sharding key of the raw update without its deserialization.
+
+    Updates from the same chat (or from the same user when the chat is not available)
+    share the same key, updates without any context are distributed by update id.
+
+    :param update: raw update
+    :return: sharding key
+    """
+    for event_type, event in update.items():
+        if event_type == "update_id" or not isinstance(event, dict):
+            continue
+        for path in _RAW_CONTEXT_PATHS:
+            value: Any = event
+            for part in path:
+                value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, dict) and isinstance(value.get("id"), int):
+                return int(value["id"])
+    return int(update["update_id"])
+
+
+def _mix_hash(value: int) -> int:
+    # SplitMix64 finalizer, spreads the close chat ids over the whole 64-bit range
+    value = (value + 0x9E3779B97F4A7C15) & _HASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _HASH_MASK
+    return value ^ (value >> 31)
+
+
+def resolve_process_index(key: int, processes: int) -> int:
+    """
+    Resolve the worker process of the sharding key by the rendezvous
+    (highest random weight) hashing,
+    so when the number of processes is changed only the keys of the added
+    or removed processes are moved to the other processes.
+
+    :param key: sharding key
+    :param processes: number of worker processes
+    :return: index of the worker process
+    """
+    key_hash = _mix_hash(key)
+    return max(range(processes), key=lambda index: _mix_hash(key_hash ^ index))
+
+
+@dataclass(frozen=True)
+class WorkerHealth:
+    """
+    Health report of the worker process
+    """
+
+    index: int
+    pid: int
+    processed: int
+    pending: int
+    timestamp: float
+
+
+class MultiProcessPolling:
+    """
+    Multi-process long-polling runner.
+
+    The main process only fetches updates (without deserialization) and distributes raw
+    updates between worker processes by the chat, each worker process has its own event loop
+    and deserializes and processes updates via its own copy of the Dispatcher,
+    so the updates processing is scaled across CPU cores.
+
+    Updates from the same chat are always processed by the same worker process in order
+    they were received. Chats are distributed by the rendezvous hashing,
+    so when the number of processes is changed only the chats of the added
+    or removed processes are moved to the other processes.
+
+    .. note::
+
+        Each worker process has its own copy of the Dispatcher with its own FSM storage
+        and workflow data, so :class:`aiogram.fsm.storage.memory.MemoryStorage`
+        can be used only with FSM strategies that are bound to the chat.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        *bots: Bot,
+        processes: int,
+        workers: int = 10,
+        queue_size: int = 100,
+        polling_timeout: int = 10,
+        backoff_config: BackoffConfig | None = None,
+        allowed_updates: list[str] | None = None,
+        health_interval: float = 5.0,
+        shutdown_timeout: float = 30.0,
+        start_method: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param dispatcher: Dispatcher instance, copied into each worker process
+        :param bots: Bot instances (one or more)
+        :param processes: Number of worker processes
+        :param workers: Number of concurrent workers inside each worker process
+        :param queue_size: Maximum number of pending updates per worker process
+        :param polling_timeout: Long-polling wait time
+        :param backoff_config: backoff-retry config
+        :param allowed_updates: List of the update types you want your bot to receive
+        :param health_interval: Interval of health reports from worker processes in seconds
+        :param shutdown_timeout: Time to wait for worker processes to finish on shutdown
+        :param start_method: Multiprocessing start method, by default :code:`fork`
+            is used where it is available. Note that with other methods the dispatcher
+            and bots should be picklable
+        :param kwargs: contextual data
+        """
+        if processes < 1:
+            msg = "Processes count should be greater than 0"
+            raise ValueError(msg)
+        if not bots:
+            msg = "At least one bot instance is required to start polling"
+            raise ValueError(msg)
+
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+        self.dispatcher = dispatcher
+        self.bots = bots
+        self.processes = processes
+        self.workers = workers
+        self.queue_size = queue_size
+        self.polling_timeout = polling_timeout
+        self.backoff_config = backoff_config
+        self.allowed_updates = allowed_updates
+        self.health_interval = health_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.workflow_data = kwargs
+
+        self._context = multiprocessing.get_context(start_method)
+        self._queues: list[Queue[tuple[int, dict[str, Any]] | None]] = []
+        self._health_queue: Queue[WorkerHealth] | None = None
+        self._processes: list[BaseProcess] = []
+        self._health: dict[int, WorkerHealth] = {}
+
+    @property
+    def health(self) -> dict[int, WorkerHealth]:
+        """
+        Latest health reports of the worker processes by worker index
+        """
+        return dict(self._health)
+
+    def _start_processes(self) -> None:
+        self._queues = [
+            self._context.Queue(maxsize=self.queue_size) for _ in range(self.processes)
+        ]
+        self._health_queue = self._context.Queue()
+        self._processes = [
+            self._context.Process(  # type: ignore[attr-defined]
+                target=_run_worker_process,
+                name=f"aiogram-worker-{index}",
+                kwargs={
+                    "index": index,
+                    "dispatcher": self.dispatcher,
+                    "bots": self.bots,
+                    "updates_queue": updates_queue,
+                    "health_queue": self._health_queue,
+                    "workers": self.workers,
+                    "health_interval": self.health_interval,
+                    "workflow_data": self.workflow_data,
+                },
+                daemon=True,
+            )
+            for index, updates_queue in enumerate(self._queues)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def _stop_processes(self) -> None:
+        for updates_queue in self._queues:
+            with suppress(ValueError, OSError):
+                updates_queue.put(None, timeout=self.shutdown_timeout)
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in self._processes:
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                loggers.dispatcher.warning(
+                    "Worker process %s is not stopped in time, terminating",
+                    process.name,
+                )
+                process.terminate()
+                process.join()
+        self._processes = []
+        self._queues = []
+
+    async def _fetch(self, bot_index: int, bot: Bot) -> None:
+        loop = asyncio.get_running_loop()
+        async for update in self.dispatcher._listen_updates(
+            bot,
+            polling_timeout=self.polling_timeout,
+            backoff_config=self.backoff_config or DEFAULT_BACKOFF_CONFIG,
+            allowed_updates=self.allowed_updates,
+            get_updates_type=GetRawUpdates,
+        ):
+            raw_update = cast(RawUpdate, update).to_dict()
+            key = resolve_raw_update_key(raw_update)
+            updates_queue = self._queues[resolve_process_index(key, self.processes)]
+            # Waits in the thread when the worker process queue is full,
+            # so the next updates will not be fetched until the worker is saturated
+            await loop.run_in_executor(None, updates_queue.put, (bot_index, raw_update))
+
+    async def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            for process in self._processes:
+                if not process.is_alive():
+                    msg = f"Worker process {process.name} is unexpectedly stopped"
+                    raise RuntimeError(msg)
+            with suppress(queue.Empty):
+                while True:
+                    report = await loop.run_in_executor(
+                        None,
+                        self._health_queue.get,  # type: ignore[union-attr]
+                        True,
+                        self.health_interval,
+                    )
+                    self._health[report.index] = report
+
+    async def start(self) -> None:
+        """
+        Start polling and wait until it is stopped (or cancelled)
+        """
+        tasks = [
+            asyncio.create_task(self._fetch(bot_index=index, bot=bot))
+            for index, bot in enumerate(self.bots)
+        ]
+        tasks.append(asyncio.create_task(self._watch()))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            await asyncio.gather(*done)
+        finally:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with suppress(asyncio.CancelledError):
+                    await task
+            await asyncio.gather(*(bot.session.close() for bot in self.bots))
+
+    def run(self) -> None:
+        """
+        Run worker processes and fetch updates in the current process
+        until it is interrupted by a signal
+        """
+        self._start_processes()
+        loggers.dispatcher.info("Start polling with %d worker processes", self.processes)
+        try:
+            with suppress(KeyboardInterrupt):
+                asyncio.run(self._run())
+        finally:
+            self._stop_processes()
+            loggers.dispatcher.info("Polling stopped")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        main_task = asyncio.create_task(self.start())
+        with suppress(NotImplementedError):  # pragma: no cover
+            # Signals handling is not supported on Windows
+            loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+        with suppress(asyncio.CancelledError):
+            await main_task
+
+
+def _run_worker_process(**kwargs: Any) -> None:  # pragma: no cover
+    # Shutdown is controlled by the main process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    asyncio.run(run_worker(**kwargs))
+
+
+async def run_worker(
+    index: int,
+    dispatcher: Dispatcher,
+    bots: tuple[Bot, ...],
+    updates_queue: Queue[tuple[int, dict[str, Any]] | None],
+    health_queue: Queue[WorkerHealth],
+    workers: int,
+    health_interval: float,
+    workflow_data: dict[str, Any],
+) -> None:
+    """
+    Worker process main loop: receive raw updates from the main process
+    and process them until the stop signal (:code:`None`) is received
+    """
+    loop = asyncio.get_running_loop()
+    processed = 0
+
+    workflow_data = {
+        "dispatcher": dispatcher,
+        "bots": bots,
+        **dispatcher.workflow_data,
+        **workflow_data,
+    }
+    workflow_data.pop("bot", None)
+
+    def make_processor(bot: Bot) -> Any:
+        async def process_update(update: Update) -> bool:
+            nonlocal processed
+            try:
+                return await dispatcher._process_update(bot=bot, update=update, **workflow_data)
+            finally:
+                processed += 1
+
+        return process_update
+
+    pools = [ShardedWorkerPool(make_processor(bot), workers=workers) for bot in bots]
+
+    def report() -> None:
+        health_queue.put(
+            WorkerHealth(
+                index=index,
+                pid=os.getpid(),
+                processed=processed,
+                pending=sum(pool.pending for pool in pools),
+                timestamp=time.time(),
+            ),
+        )
+
+    await dispatcher.emit_startup(bot=bots[-1], **workflow_data)
+    dispatcher.compile_dispatch_plan()
+    for pool in pools:
+        pool.start()
+    loggers.dispatcher.info("Worker process %d (pid=%d) is started", index, os.getpid())
+
+    next_report = loop.time()
+    try:
+        while True:
+            if loop.time() >= next_report:
+                report()
+                next_report = loop.time() + health_interval
+            try:
+                item = await loop.run_in_executor(None, updates_queue.get, True, health_interval)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            bot_index, raw_update = item
+            bot = bots[bot_index]
+            update = dispatcher._validate_raw_update(bot, raw_update)
+            await pools[bot_index].put(update)
+    finally:
+        for pool in pools:
+            await pool.close()
+        report()
+        try:
+            await dispatcher.emit_shutdown(bot=bots[-1], **workflow_data)
+        finally:
+            await asyncio.gather(*(bot.session.close() for bot in bots))
+        loggers.dispatcher.info("Worker process %d (pid=%d) is stopped", index, os.getpid())
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class BaseOffsetStorage(ABC):
+    """
+    Base class for all polling offset storages
+    """
+
+    @abstractmethod
+    async def get_offset(self, bot_id: int) -> int | None:
+        """
+        Get the offset of the next update to be received
+
+        :param bot_id: bot id
+        :return: offset or None when the offset is not stored yet
+        """
+
+    @abstractmethod
+    async def set_offset(self, bot_id: int, offset: int) -> None:
+        """
+        Store the offset of the next update to be received
+
+        :param bot_id: bot id
+        :param offset: offset (identifier of the last processed update + 1)
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """
+        Close storage (database connection, file or etc.)
+        """
+
+
+class OffsetTracker:
+    """
+    Tracks processing of the updates fetched by the polling
+    and commits the offset to the storage only when all fetched updates are processed.
+
+    The next batch of updates is not requested (and therefore the previous batch
+    is not confirmed on the Telegram server) until the offset is committed,
+    so in case of a crash only the batch which is being processed
+    is received again after restart.
+    The price is that the updates are not prefetched
+    and the next batch waits for the slowest update of the previous one.
+    """
+
+    def __init__(self, storage: BaseOffsetStorage, bot_id: int) -> None:
+        """
+        :param storage: Offset storage
+        :param bot_id: bot id
+        """
+        self.storage = storage
+        self.bot_id = bot_id
+
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._offset: int | None = None
+        self._committed_offset: int | None = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of fetched updates which are not processed yet
+        """
+        return self._pending
+
+    @property
+    def committed_offset(self) -> int | None:
+        return self._committed_offset
+
+    async def load(self) -> int | None:
+        """
+        Load the stored offset
+        """
+        self._committed_offset = self._offset = await self.storage.get_offset(self.bot_id)
+        return self._offset
+
+    def begin(self, update_id: int) -> None:
+        """
+        Register the fetched update
+        """
+        self._pending += 1
+        self._idle.clear()
+        self._offset = update_id + 1
+
+    def complete(self) -> None:
+        """
+        Mark one of the fetched updates as processed
+        """
+        self._pending -= 1
+        if not self._pending:
+            self._idle.set()
+
+    async def track(self, processing: Awaitable[T]) -> T:
+        """
+        Mark the update as processed when the processing is finished (even unsuccessfully)
+
+        :param processing: processing of the update
+        """
+        try:
+            return await processing
+        finally:
+            self.complete()
+
+    async def commit(self) -> None:
+        """
+        Commit the offset when there are no pending updates
+        """
+        if self._pending or self._offset == self._committed_offset or self._offset is None:
+            return
+        await self.storage.set_offset(self.bot_id, self._offset)
+        self._committed_offset = self._offset
+
+    async def wait_and_commit(self) -> None:
+        """
+        Wait until all fetched updates are processed and commit the offset
+        """
+        await self._idle.wait()
+        await self.commit()
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+from aiogram.dispatcher.offset.base import BaseOffsetStorage
+
+
+class FileOffsetStorage(BaseOffsetStorage):
+    """
+    Offset storage that keeps offsets of all bots in a JSON file.
+
+    The file is replaced atomically on each commit, so it is never left
+    partially written when the process is killed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        :param path: path to the JSON file, is created on the first commit
+        """
+        self.path = Path(path)
+        self._offsets: dict[str, int] | None = None
+        self._lock = asyncio.Lock()
+
+    def _read(self) -> dict[str, int]:
+        try:
+            with self.path.open() as f:
+                return {str(key): int(value) for key, value in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, offsets: dict[str, int]) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(offsets, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.path)
+
+    async def _load(self) -> dict[str, int]:
+        if self._offsets is None:
+            loop = asyncio.get_running_loop()
+            self._offsets = await loop.run_in_executor(None, self._read)
+        return self._offsets
+
+    async def get_offset(self, bot_id: int) -> int | None:
+        async with self._lock:
+            offsets = await self._load()
+        return offsets.get(str(bot_id))
+
+    async def set_offset(self, bot_id: int, offset: int) -> None:
+        async with self._lock:
+            offsets = await self._load()
+            offsets[str(bot_id)] = offset
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write, dict(offsets))
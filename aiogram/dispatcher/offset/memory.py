@@ -0,0 +1,22 @@
+from aiogram.dispatcher.offset.base import BaseOffsetStorage
+
+
+class MemoryOffsetStorage(BaseOffsetStorage):
+    """
+    Offset storage; uses a regular :class:`dict` to store offsets and
+    does not persist them across restarts.
+
+    .. warning::
+
+        This storage is useful only when the polling is restarted within the same process,
+        use persistent storage in production
+    """
+
+    def __init__(self) -> None:
+        self.offsets: dict[int, int] = {}
+
+    async def get_offset(self, bot_id: int) -> int | None:
+        return self.offsets.get(bot_id)
+
+    async def set_offset(self, bot_id: int, offset: int) -> None:
+        self.offsets[bot_id] = offset
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class PollingMetrics:
+    """
+    Metrics of the polling process of the bot
+
+    Note that the fetch latency includes the long-polling wait time
+    when there are no updates on the server.
+    """
+
+    fetches: int = 0
+    """Number of successful getUpdates requests"""
+    fetched_updates: int = 0
+    """Total number of fetched updates"""
+    last_fetch_latency: float = 0.0
+    """Duration of the last getUpdates request in seconds"""
+    total_fetch_latency: float = 0.0
+    """Total duration of getUpdates requests in seconds"""
+    pending: int = 0
+    """Number of prefetched updates waiting for the dispatching"""
+    last_processing_lag: float = 0.0
+    """Time between fetching of the last dispatched update and its dispatching in seconds"""
+    max_processing_lag: float = 0.0
+    """Maximum time between fetching of an update and its dispatching in seconds"""
+
+    @property
+    def avg_fetch_latency(self) -> float:
+        """
+        Average duration of getUpdates requests in seconds
+        """
+        if not self.fetches:
+            return 0.0
+        return self.total_fetch_latency / self.fetches
+
+    def observe_fetch(self, latency: float, updates: int) -> None:
+        self.fetches += 1
+        self.fetched_updates += updates
+        self.last_fetch_latency = latency
+        self.total_fetch_latency += latency
+
+    def observe_processing_lag(self, lag: float) -> None:
+        self.last_processing_lag = lag
+        self.max_processing_lag = max(self.max_processing_lag, lag)
+
+
+class UpdatesPrefetcher(Generic[T]):
+    """
+    Reads updates from the source in the background task into bounded queue,
+    so the next getUpdates request is sent while the current batch is being dispatched.
+
+    When the queue is full the source is not read (and the next request is not sent)
+    until the consumer takes the next update.
+    """
+
+    def __init__(
+        self,
+        source: AsyncGenerator[T, None],
+        queue_size: int,
+        metrics: PollingMetrics | None = None,
+    ) -> None:
+        """
+        :param source: Updates source, usually :code:`Dispatcher._listen_updates`
+        :param queue_size: Maximum number of prefetched updates
+        :param metrics: Metrics to be updated
+        """
+        if queue_size < 1:
+            msg = "Queue size should be greater than 0"
+            raise ValueError(msg)
+
+        self.source = source
+        self.queue_size = queue_size
+        self.metrics = metrics or PollingMetrics()
+
+        # None is put into the queue when the source is exhausted or failed
+        self._queue: asyncio.Queue[tuple[float, T] | None] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+
+    async def _fetch(self) -> None:
+        try:
+            async for update in self.source:
+                await self._queue.put((time.monotonic(), update))
+                self.metrics.pending = self._queue.qsize()
+        except Exception as e:  # noqa: BLE001
+            # The error is propagated to the consumer after all prefetched updates
+            self._error = e
+        await self._queue.put(None)
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        if self._task is not None:
+            msg = "Prefetcher is already started"
+            raise RuntimeError(msg)
+        self._task = asyncio.create_task(self._fetch())
+        try:
+            while (item := await self._queue.get()) is not None:
+                fetched_at, update = item
+                self.metrics.pending = self._queue.qsize()
+                self.metrics.observe_processing_lag(time.monotonic() - fetched_at)
+                yield update
+            self.metrics.pending = 0
+            if self._error is not None:
+                raise self._error
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        Stop reading of the source.
+
+        Prefetched but not dispatched updates are kept in the queue,
+        use :meth:`drain` to take them after the source is closed.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        await self.source.aclose()
+
+    def drain(self) -> list[T]:
+        """
+        Take all prefetched but not dispatched updates
+
+        The offset of the prefetched updates can be already sent to the server
+        by the next getUpdates request, so they will not be received again
+        and should be dispatched before the polling is stopped.
+        """
+        updates = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                updates.append(item[1])
+        self.metrics.pending = 0
+        return updates
@@ -0,0 +1,28 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from aiogram.methods import GetUpdates
+
+
+class RawUpdate(BaseModel):
+    """
+    Update envelope with only :code:`update_id` parsed,
+    the event itself is kept as a raw dictionary
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    update_id: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"update_id": self.update_id, **(self.model_extra or {})}
+
+
+class GetRawUpdates(GetUpdates):
+    """
+    The same as :class:`aiogram.methods.get_updates.GetUpdates`
+    but updates are not deserialized into :class:`aiogram.types.update.Update` objects
+    """
+
+    __returning__ = list[RawUpdate]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Final
 
-from .event.bases import REJECTED, UNHANDLED
+from .event.bases import REJECTED, UNHANDLED, NextMiddlewareType
 from .event.event import EventObserver
 from .event.telegram import TelegramEventObserver
+from .middlewares.manager import MiddlewareManager
 
 if TYPE_CHECKING:
     from aiogram.types import TelegramObject
@@ -34,6 +36,15 @@ class Router:
         self._parent_router: Router | None = None
         self.sub_routers: list[Router] = []
 
+        # Pre-built propagation callbacks (with outer middlewares) per update type,
+        # see :meth:`compile_dispatch_plan`
+        self._dispatch_plan: dict[str, NextMiddlewareType[TelegramObject]] = {}
+        # Index of update types handled by this router or any of nested routers
+        # and nested routers filtered by this index, used to skip routers tree branches
+        # without handlers for the event
+        self._update_types_index: frozenset[str] | None = None
+        self._sub_routers_index: dict[str, tuple[Router, ...]] = {}
+
         # Observers
         self.message = TelegramEventObserver(router=self, event_name="message")
         self.edited_message = TelegramEventObserver(router=self, event_name="edited_message")
@@ -151,21 +162,98 @@ class Router:
 
         return sorted(handlers_in_use)
 
-    async def propagate_event(self, update_type: str, event: TelegramObject, **kwargs: Any) -> Any:
-        kwargs.update(event_router=self)
-        observer = self.observers.get(update_type)
+    def invalidate_dispatch_plan(self) -> None:
+        """
+        Drop pre-built dispatch plan of this router and all nested routers
+        and handlers index of all parent routers.
 
-        async def _wrapped(telegram_event: TelegramObject, **data: Any) -> Any:
-            return await self._propagate_event(
-                observer=observer,
-                update_type=update_type,
-                event=telegram_event,
-                **data,
-            )
+        Is called automatically when handlers, middlewares or nested routers are changed,
+        so usually there is no need to call this method manually.
+        """
+        for router in self.chain_head:
+            router._update_types_index = None
+            router._sub_routers_index.clear()
+        for router in self.chain_tail:
+            router._dispatch_plan.clear()
+            router._update_types_index = None
+            router._sub_routers_index.clear()
+            for observer in router.observers.values():
+                observer.invalidate_dispatch_plan()
 
+    def compile_dispatch_plan(self, update_types: Iterable[str] | None = None) -> None:
+        """
+        Eagerly build dispatch plan for this router and all nested routers.
+
+        Dispatch plan contains pre-wrapped outer middlewares chains of each router
+        and inner middlewares chains of each handler, so propagating an event
+        does not need to resolve and wrap middlewares over and over again.
+
+        The plan is built lazily on first event anyway, this method only allows to
+        move this work to the startup. It is invalidated automatically when
+        handlers, middlewares or nested routers are changed.
+
+        :param update_types: update types to be compiled, by default all observed types
+        """
+        for router in self.chain_tail:
+            for update_type, observer in router.observers.items():
+                if update_types is not None and update_type not in update_types:
+                    continue
+                router._resolve_dispatch_plan(update_type)
+                router._resolve_sub_routers(update_type)
+                for handler in observer.handlers:
+                    observer._resolve_middleware_chain(handler)
+
+    def _resolve_update_types_index(self) -> frozenset[str]:
+        """
+        Get update types which has at least one handler in this router or nested routers
+        """
+        if self._update_types_index is None:
+            update_types = {
+                update_type
+                for update_type, observer in self.observers.items()
+                if observer.handlers
+            }
+            for router in self.sub_routers:
+                update_types.update(router._resolve_update_types_index())
+            self._update_types_index = frozenset(update_types)
+        return self._update_types_index
+
+    def _resolve_sub_routers(self, update_type: str) -> tuple[Router, ...]:
+        """
+        Get nested routers that can handle the event,
+        branches without handlers for this update type are skipped
+        """
+        try:
+            return self._sub_routers_index[update_type]
+        except KeyError:
+            pass
+
+        sub_routers = tuple(
+            router
+            for router in self.sub_routers
+            if update_type in router._resolve_update_types_index()
+        )
+        self._sub_routers_index[update_type] = sub_routers
+        return sub_routers
+
+    def _resolve_dispatch_plan(self, update_type: str) -> NextMiddlewareType[TelegramObject]:
+        try:
+            return self._dispatch_plan[update_type]
+        except KeyError:
+            pass
+
+        observer = self.observers.get(update_type)
+        callback = partial(self._propagate_event, observer, update_type)
         if observer:
-            return await observer.wrap_outer_middleware(_wrapped, event=event, data=kwargs)
-        return await _wrapped(event, **kwargs)
+            plan = observer.middleware.wrap_middlewares(observer.outer_middleware, callback)
+        else:
+            plan = MiddlewareManager.wrap_middlewares((), callback)
+        self._dispatch_plan[update_type] = plan
+        return plan
+
+    async def propagate_event(self, update_type: str, event: TelegramObject, **kwargs: Any) -> Any:
+        kwargs.update(event_router=self)
+        return await self._resolve_dispatch_plan(update_type)(event, kwargs)
 
     async def _propagate_event(
         self,
@@ -191,7 +279,7 @@ class Router:
             if response is not UNHANDLED:
                 return response
 
-        for router in self.sub_routers:
+        for router in self._resolve_sub_routers(update_type):
             response = await router.propagate_event(update_type=update_type, event=event, **kwargs)
             if response is not UNHANDLED:
                 break
@@ -246,6 +334,8 @@ class Router:
 
         self._parent_router = router
         router.sub_routers.append(self)
+        # Middlewares of the parent routers are now applied to this routers tree
+        self.invalidate_dispatch_plan()
 
     def include_routers(self, *routers: Router) -> None:
         """
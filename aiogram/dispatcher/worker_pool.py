@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+from aiogram import loggers
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.types import Update
+
+UpdateProcessorType = Callable[[Update], Awaitable[Any]]
+
+
+class ShardedWorkerPool:
+    """
+    Fixed pool of workers with bounded queue per worker.
+
+    Each update is routed to the worker by the key resolved from the update
+    (chat, or user when chat is not available), so all updates from the same chat
+    are always processed by the same worker one by one in the order they were received,
+    while updates from different chats are processed in parallel.
+
+    When the queue of the worker is full, :meth:`put` waits for a free slot,
+    so the updates producer (polling loop) is slowed down instead of
+    accumulating an unbounded number of pending updates in memory.
+    """
+
+    def __init__(
+        self,
+        processor: UpdateProcessorType,
+        workers: int,
+        queue_size: int = 100,
+    ) -> None:
+        """
+        :param processor: Coroutine function that processes an update
+        :param workers: Number of workers
+        :param queue_size: Maximum number of pending updates per worker
+        """
+        if workers < 1:
+            msg = "Workers count should be greater than 0"
+            raise ValueError(msg)
+        if queue_size < 1:
+            msg = "Queue size should be greater than 0"
+            raise ValueError(msg)
+
+        self.processor = processor
+        self.workers = workers
+        self.queue_size = queue_size
+
+        self._queues: list[asyncio.Queue[Update]] = []
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of updates waiting for processing in all queues
+        """
+        return sum(queue.qsize() for queue in self._queues)
+
+    @classmethod
+    def resolve_key(cls, update: Update) -> int:
+        """
+        Resolve the ordering key of the update.
+
+        Updates from the same chat (or from the same user when the chat is not available)
+        share the same key, updates without any context are distributed by update id.
+        """
+        event_context = UserContextMiddleware.resolve_event_context(event=update)
+        if event_context.chat_id is not None:
+            return event_context.chat_id
+        if event_context.user_id is not None:
+            return event_context.user_id
+        return update.update_id
+
+    def start(self) -> None:
+        if self.is_running:
+            msg = "Worker pool is already started"
+            raise RuntimeError(msg)
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.workers)]
+        self._tasks = [asyncio.create_task(self._worker(queue)) for queue in self._queues]
+
+    async def put(self, update: Update) -> None:
+        """
+        Put the update into the queue of the worker,
+        waits when the queue is full
+
+        :param update: Update to be processed
+        """
+        if not self.is_running:
+            msg = "Worker pool is not started"
+            raise RuntimeError(msg)
+        queue = self._queues[self.resolve_key(update) % self.workers]
+        await queue.put(update)
+
+    async def _worker(self, queue: asyncio.Queue[Update]) -> None:
+        while True:
+            update = await queue.get()
+            try:
+                await self.processor(update)
+            except Exception:  # noqa: BLE001
+                # Worker should never die, otherwise all the chats of this shard will be stuck
+                loggers.dispatcher.exception(
+                    "Failed to process update id=%d in the worker",
+                    update.update_id,
+                )
+            finally:
+                queue.task_done()
+
+    async def close(self) -> None:
+        """
+        Wait for all pending updates to be processed and stop workers
+        """
+        try:
+            await asyncio.gather(*(queue.join() for queue in self._queues))
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            for task in self._tasks:
+                with suppress(asyncio.CancelledError):
+                    await task
+            self._tasks = []
+            self._queues = []
@@ -1,6 +1,9 @@
 from collections.abc import Mapping
+from copy import copy
 from typing import Any, overload
 
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
 from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
 
 
@@ -42,3 +45,98 @@ class FSMContext:
     async def clear(self) -> None:
         await self.set_state(state=None)
         await self.set_data({})
+
+
+class TransactionalFSMContext(FSMContext):
+    """
+    FSM context that works as a unit of work:
+    state and data are loaded together on the first access,
+    changes are kept in memory and written to the storage by one :meth:`commit`.
+
+    Used by the :class:`aiogram.fsm.middleware.FSMContextMiddleware` in the transactional mode,
+    where changes are committed when the handlers chain returns,
+    while the events isolation lock is still held.
+    Changes made after the commit (for example by the tasks started in the handler)
+    are not written to the storage.
+    """
+
+    def __init__(self, storage: BaseStorage, key: StorageKey) -> None:
+        super().__init__(storage=storage, key=key)
+        self._loaded = False
+        self._state: str | None = None
+        self._data: dict[str, Any] = {}
+        self._state_changed = False
+        self._data_changed = False
+
+    @property
+    def has_changes(self) -> bool:
+        """
+        Are there changes that are not committed yet
+        """
+        return self._state_changed or self._data_changed
+
+    async def _load(self) -> None:
+        if self._loaded:
+            return
+        state, data = await self.storage.get_state_and_data(key=self.key)
+        # Values changed before loading are kept
+        if not self._state_changed:
+            self._state = state
+        if not self._data_changed:
+            self._data = data
+        self._loaded = True
+
+    async def set_state(self, state: StateType = None) -> None:
+        # State is not loaded, it is replaced anyway
+        self._state = state.state if isinstance(state, State) else state
+        self._state_changed = True
+
+    async def get_state(self) -> str | None:
+        if not self._state_changed:
+            await self._load()
+        return self._state
+
+    async def set_data(self, data: Mapping[str, Any]) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+        self._data = data.copy()
+        self._data_changed = True
+
+    async def get_data(self) -> dict[str, Any]:
+        if not self._data_changed:
+            await self._load()
+        return self._data.copy()
+
+    async def get_value(self, key: str, default: Any | None = None) -> Any | None:
+        if not self._data_changed:
+            await self._load()
+        return copy(self._data.get(key, default))
+
+    async def update_data(
+        self,
+        data: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        if data:
+            kwargs.update(data)
+        if not self._data_changed:
+            await self._load()
+        self._data.update(kwargs)
+        self._data_changed = True
+        return self._data.copy()
+
+    async def commit(self) -> None:
+        """
+        Write the changes to the storage, does nothing when there are no changes
+        """
+        if self._state_changed and self._data_changed:
+            await self.storage.set_state_and_data(key=self.key, state=self._state, data=self._data)
+        elif self._state_changed:
+            await self.storage.set_state(key=self.key, state=self._state)
+        elif self._data_changed:
+            await self.storage.set_data(key=self.key, data=self._data)
+        if self._state_changed and self._data_changed:
+            # Both written values are the actual ones now
+            self._loaded = True
+        self._state_changed = self._data_changed = False
@@ -1,10 +1,10 @@
 from collections.abc import Awaitable, Callable
 from typing import Any, cast
 
-from aiogram import Bot
+from aiogram import Bot, loggers
 from aiogram.dispatcher.middlewares.base import BaseMiddleware
 from aiogram.dispatcher.middlewares.user_context import EVENT_CONTEXT_KEY, EventContext
-from aiogram.fsm.context import FSMContext
+from aiogram.fsm.context import FSMContext, TransactionalFSMContext
 from aiogram.fsm.storage.base import (
     DEFAULT_DESTINY,
     BaseEventIsolation,
@@ -21,10 +21,20 @@ class FSMContextMiddleware(BaseMiddleware):
         storage: BaseStorage,
         events_isolation: BaseEventIsolation,
         strategy: FSMStrategy = FSMStrategy.USER_IN_CHAT,
+        transactional: bool = False,
     ) -> None:
+        """
+        :param storage: Storage for FSM
+        :param events_isolation: Events isolation
+        :param strategy: FSM strategy
+        :param transactional: Load state and data of the event once
+            and write the changes once when the handlers chain returns,
+            see :class:`aiogram.fsm.context.TransactionalFSMContext`
+        """
         self.storage = storage
         self.strategy = strategy
         self.events_isolation = events_isolation
+        self.transactional = transactional
 
     async def __call__(
         self,
@@ -36,13 +46,33 @@ class FSMContextMiddleware(BaseMiddleware):
         context = self.resolve_event_context(bot, data)
         data["fsm_storage"] = self.storage
         if context:
+            if self.transactional:
+                context = TransactionalFSMContext(storage=context.storage, key=context.key)
             # Bugfix: https://github.com/aiogram/aiogram/issues/1317
             # State should be loaded after lock is acquired
             async with self.events_isolation.lock(key=context.key):
                 data.update({"state": context, "raw_state": await context.get_state()})
-                return await handler(event, data)
+                if not isinstance(context, TransactionalFSMContext):
+                    return await handler(event, data)
+                try:
+                    result = await handler(event, data)
+                except Exception:
+                    # Changes made before the error are kept, as without the transactional mode
+                    await self._commit_on_error(context)
+                    raise
+                await context.commit()
+                return result
         return await handler(event, data)
 
+    @staticmethod
+    async def _commit_on_error(context: TransactionalFSMContext) -> None:
+        # The error of the handler is more important than the error of the storage,
+        # so the failed commit is only logged
+        try:
+            await context.commit()
+        except Exception:
+            loggers.fsm.exception("Failed to commit the FSM changes of %s", context.key)
+
     def resolve_event_context(
         self,
         bot: Bot,
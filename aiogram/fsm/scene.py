@@ -46,7 +46,9 @@ class HistoryManager:
             history = history[-self._size :]
         loggers.scene.debug("Push state=%s data=%s to history", state, data)
 
-        await self._history_state.update_data(history=history)
+        # History is the only key of the record, so it's replaced
+        # without reading and merging the data again by the storage
+        await self._history_state.set_data({"history": history})
 
     async def pop(self) -> MemoryStorageRecord | None:
         history_data = await self._history_state.get_data()
@@ -59,7 +61,7 @@ class HistoryManager:
         if not history:
             await self._history_state.set_data({})
         else:
-            await self._history_state.update_data(history=history)
+            await self._history_state.set_data({"history": history})
         loggers.scene.debug("Pop state=%s data=%s from history", state, data)
         return MemoryStorageRecord(state=state, data=data)
 
@@ -183,6 +183,35 @@ class BaseStorage(ABC):
         await self.set_data(key=key, data=current_data)
         return current_data.copy()
 
+    async def get_state_and_data(self, key: StorageKey) -> tuple[str | None, dict[str, Any]]:
+        """
+        Get state and data for key
+
+        Storages that can read both of them by one query should override this method
+
+        :param key: storage key
+        :return: current state and data
+        """
+        return await self.get_state(key=key), await self.get_data(key=key)
+
+    async def set_state_and_data(
+        self,
+        key: StorageKey,
+        state: StateType,
+        data: Mapping[str, Any],
+    ) -> None:
+        """
+        Write state and data (replace) for key
+
+        Storages that can write both of them by one query should override this method
+
+        :param key: storage key
+        :param state: new state
+        :param data: new data
+        """
+        await self.set_state(key=key, state=state)
+        await self.set_data(key=key, data=data)
+
     @abstractmethod
     async def close(self) -> None:  # pragma: no cover
         """
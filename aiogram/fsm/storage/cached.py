@@ -0,0 +1,299 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from copy import copy
+from dataclasses import dataclass
+from typing import Any, TypeVar, overload
+
+from aiogram import loggers
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+
+T = TypeVar("T")
+
+InvalidationCallback = Callable[[StorageKey | None], None]
+
+
+class BaseCacheInvalidator(ABC):
+    """
+    Base class for the channels that notify the other processes
+    about the records changed by this one
+    """
+
+    @abstractmethod
+    async def start(self, callback: InvalidationCallback) -> None:
+        """
+        Start receiving the notifications of the other processes
+
+        :param callback: Called with the key of the record changed by another process
+            or with :code:`None` when the notifications could be lost,
+            so the whole cache should be dropped
+        """
+
+    @abstractmethod
+    async def publish(self, key: StorageKey) -> None:
+        """
+        Notify the other processes that the record is changed
+
+        :param key: storage key
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Stop receiving the notifications
+        """
+
+
+@dataclass(frozen=True)
+class CachedStorageStats:
+    """
+    Snapshot of the :class:`CachedStorage` counters
+    """
+
+    size: int
+    """Number of the cached records"""
+    hits: int
+    """Number of the reads answered from the cache"""
+    misses: int
+    """Number of the reads sent to the backing storage"""
+    evictions: int
+    """Number of the records evicted to fit the size limit"""
+    invalidations: int
+    """Number of the notifications about the records changed by the other processes"""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the reads answered from the cache
+        """
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+
+class _CachedRecord:
+    __slots__ = ("data", "expires_at", "state")
+
+    def __init__(self, expires_at: float, state: str | None, data: dict[str, Any]) -> None:
+        self.expires_at = expires_at
+        self.state = state
+        self.data = data
+
+
+class CachedStorage(BaseStorage):
+    """
+    Storage that keeps the recently used records of another storage in the process memory
+
+    Reads are answered from the cache while the record is not expired,
+    state and data of the missing record are read from the backing storage by one query.
+    Writes are sent to the backing storage and then applied to the cached record.
+
+    When the backing storage is shared by several processes, the cached records
+    can become stale after they are changed by another process.
+    Pass the :code:`invalidator` (for example
+    :class:`aiogram.fsm.storage.redis.RedisCacheInvalidator`) to drop them on each change,
+    the :code:`ttl` limits the staleness when the notifications are lost.
+    """
+
+    def __init__(
+        self,
+        storage: BaseStorage,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        invalidator: BaseCacheInvalidator | None = None,
+    ) -> None:
+        """
+        :param storage: backing storage
+        :param max_size: maximum number of the cached records,
+            the least recently used ones are evicted when the cache is full
+        :param ttl: time to live of the cached records in seconds
+        :param invalidator: channel that notifies the other processes about the changed records
+        """
+        self.storage = storage
+        self.max_size = max_size
+        self.ttl = ttl
+        self.invalidator = invalidator
+
+        self._cache: OrderedDict[StorageKey, _CachedRecord] = OrderedDict()
+        # Incremented by each change, the records read while they were changed are not cached
+        self._generation = 0
+        self._started = False
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_stats(self) -> CachedStorageStats:
+        """
+        Get the snapshot of the cache counters
+        """
+        return CachedStorageStats(
+            size=len(self._cache),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+    def invalidate(self, key: StorageKey | None = None) -> None:
+        """
+        Drop the cached record or the whole cache
+
+        :param key: storage key, the whole cache is dropped when it's not specified
+        """
+        self._generation += 1
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _on_invalidate(self, key: StorageKey | None) -> None:
+        self._invalidations += 1
+        self.invalidate(key)
+
+    async def _start(self) -> None:
+        if self.invalidator is not None and not self._started:
+            # Failed start is retried by the next access of the storage
+            await self.invalidator.start(self._on_invalidate)
+            self._started = True
+
+    def _get(self, key: StorageKey) -> _CachedRecord | None:
+        record = self._cache.get(key)
+        if record is None:
+            return None
+        if record.expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return record
+
+    def _put(self, key: StorageKey, state: str | None, data: dict[str, Any]) -> None:
+        self._cache[key] = _CachedRecord(time.monotonic() + self.ttl, state, data.copy())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    async def _load(self, key: StorageKey) -> tuple[str | None, dict[str, Any]]:
+        await self._start()
+        record = self._get(key)
+        if record is not None:
+            self._hits += 1
+            return record.state, record.data
+        self._misses += 1
+        generation = self._generation
+        state, data = await self.storage.get_state_and_data(key=key)
+        if generation == self._generation:
+            self._put(key, state, data)
+        return state, data
+
+    async def _write(
+        self,
+        key: StorageKey,
+        write: Awaitable[T],
+        apply: Callable[[_CachedRecord | None, T], None],
+    ) -> T:
+        await self._start()
+        try:
+            result = await write
+        except BaseException:
+            # The record could be changed partially
+            self._cache.pop(key, None)
+            raise
+        finally:
+            self._generation += 1
+        # Changes are applied before other processes are notified,
+        # so this process doesn't read the stale record meanwhile
+        apply(self._cache.get(key), result)
+        if self.invalidator is not None:
+            try:
+                await self.invalidator.publish(key)
+            except Exception as e:
+                # The record is written already, so the write is not failed,
+                # other processes keep the stale record until it is evicted
+                loggers.fsm.warning(
+                    "Failed to publish the FSM cache invalidation of %s: %s", key, e
+                )
+        return result
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        def apply(record: _CachedRecord | None, _: None) -> None:
+            if record is not None:
+                record.state = state.state if isinstance(state, State) else state
+
+        await self._write(key, self.storage.set_state(key=key, state=state), apply)
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        state, _ = await self._load(key)
+        return state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+
+        def apply(record: _CachedRecord | None, _: None) -> None:
+            if record is not None:
+                record.data = data.copy()
+
+        await self._write(key, self.storage.set_data(key=key, data=data), apply)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        _, data = await self._load(key)
+        return data.copy()
+
+    @overload
+    async def get_value(self, storage_key: StorageKey, dict_key: str) -> Any | None: ...
+
+    @overload
+    async def get_value(self, storage_key: StorageKey, dict_key: str, default: Any) -> Any: ...
+
+    async def get_value(
+        self,
+        storage_key: StorageKey,
+        dict_key: str,
+        default: Any | None = None,
+    ) -> Any | None:
+        _, data = await self._load(storage_key)
+        return copy(data.get(dict_key, default))
+
+    async def update_data(self, key: StorageKey, data: Mapping[str, Any]) -> dict[str, Any]:
+        def apply(record: _CachedRecord | None, new_data: dict[str, Any]) -> None:
+            if record is not None:
+                record.data = new_data.copy()
+
+        return await self._write(key, self.storage.update_data(key=key, data=data), apply)
+
+    async def get_state_and_data(self, key: StorageKey) -> tuple[str | None, dict[str, Any]]:
+        state, data = await self._load(key)
+        return state, data.copy()
+
+    async def set_state_and_data(
+        self,
+        key: StorageKey,
+        state: StateType,
+        data: Mapping[str, Any],
+    ) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+
+        def apply(record: _CachedRecord | None, _: None) -> None:
+            # The whole record is known, so it's cached even if it was not cached before
+            self._put(key, state.state if isinstance(state, State) else state, data)
+
+        await self._write(
+            key,
+            self.storage.set_state_and_data(key=key, state=state, data=data),
+            apply,
+        )
+
+    async def close(self) -> None:
+        if self.invalidator is not None:
+            await self.invalidator.close()
+        self._cache.clear()
+        await self.storage.close()
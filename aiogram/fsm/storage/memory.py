@@ -1,5 +1,7 @@
+import heapq
+import time
 from asyncio import Lock
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import AsyncGenerator, Hashable, Mapping
 from contextlib import asynccontextmanager
 from copy import copy
@@ -56,6 +58,23 @@ class MemoryStorage(BaseStorage):
     async def get_data(self, key: StorageKey) -> dict[str, Any]:
         return self.storage[key].data.copy()
 
+    async def get_state_and_data(self, key: StorageKey) -> tuple[str | None, dict[str, Any]]:
+        record = self.storage[key]
+        return record.state, record.data.copy()
+
+    async def set_state_and_data(
+        self,
+        key: StorageKey,
+        state: StateType,
+        data: Mapping[str, Any],
+    ) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+        record = self.storage[key]
+        record.state = state.state if isinstance(state, State) else state
+        record.data = data.copy()
+
     @overload
     async def get_value(self, storage_key: StorageKey, dict_key: str) -> Any | None: ...
 
@@ -81,16 +100,156 @@ class DisabledEventIsolation(BaseEventIsolation):
         pass
 
 
-class SimpleEventIsolation(BaseEventIsolation):
+@dataclass(frozen=True)
+class EventIsolationStats:
+    """
+    Snapshot of the :class:`SimpleEventIsolation` counters
+    """
+
+    locks: int
+    """Number of the locks held or awaited right now (number of the stripes when striped)"""
+    acquired: int
+    """Number of the acquired locks"""
+    contended: int
+    """Number of the acquisitions that waited for another event"""
+    wait_time: float
+    """Total time spent waiting for the locks in seconds"""
+    max_wait_time: float
+    """The longest wait for the lock in seconds"""
+
+    @property
+    def contention_rate(self) -> float:
+        """
+        Share of the acquisitions that waited for another event
+        """
+        if not self.acquired:
+            return 0.0
+        return self.contended / self.acquired
+
+
+@dataclass
+class LockContention:
+    """
+    Contention of the lock of one key
+    """
+
+    key: Hashable
+    """Storage key"""
+    contended: int = 0
+    """Number of the acquisitions that waited for another event"""
+    wait_time: float = 0.0
+    """Total time spent waiting for the lock in seconds"""
+    max_wait_time: float = 0.0
+    """The longest wait for the lock in seconds"""
+
+
+class _LockEntry:
+    __slots__ = ("lock", "users")
+
     def __init__(self) -> None:
-        # TODO: Unused locks cleaner is needed
-        self._locks: defaultdict[Hashable, Lock] = defaultdict(Lock)
+        self.lock = Lock()
+        # Number of the events holding or waiting for the lock
+        self.users = 0
+
+
+class SimpleEventIsolation(BaseEventIsolation):
+    def __init__(self, stripes: int | None = None, max_tracked_keys: int = 1000) -> None:
+        """
+        Isolates the events of the same key by the in-memory locks
+
+        By default each key has its own lock that is removed when no event holds
+        or waits for it. With :code:`stripes` the keys share a fixed number of locks
+        selected by the hash of the key, so the memory is bounded,
+        but the events of different keys sharing the stripe wait for each other.
+
+        :param stripes: Number of the locks shared by all keys,
+            each key has its own lock by default
+        :param max_tracked_keys: Maximum number of the keys with the tracked contention,
+            the least recently contended keys are forgotten, 0 disables tracking per key
+        """
+        self.stripes = stripes
+        self.max_tracked_keys = max_tracked_keys
+        self._locks: dict[Hashable, _LockEntry] = {}
+        self._stripes = [Lock() for _ in range(stripes or 0)]
+        self._contention: OrderedDict[Hashable, LockContention] = OrderedDict()
+        self._acquired = 0
+        self._contended = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def get_stats(self) -> EventIsolationStats:
+        """
+        Get the snapshot of the isolation counters
+        """
+        return EventIsolationStats(
+            locks=len(self._stripes) or len(self._locks),
+            acquired=self._acquired,
+            contended=self._contended,
+            wait_time=self._wait_time,
+            max_wait_time=self._max_wait_time,
+        )
+
+    def get_hot_keys(self, limit: int = 10) -> list[LockContention]:
+        """
+        Get the keys whose events waited for each other the longest time
+
+        :param limit: Maximum number of the keys
+        """
+        return heapq.nlargest(limit, self._contention.values(), key=lambda item: item.wait_time)
+
+    def _record_wait(self, key: Hashable, wait_time: float) -> None:
+        self._contended += 1
+        self._wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        if not self.max_tracked_keys:
+            return
+        contention = self._contention.get(key)
+        if contention is None:
+            contention = self._contention[key] = LockContention(key=key)
+            if len(self._contention) > self.max_tracked_keys:
+                self._contention.popitem(last=False)
+        else:
+            self._contention.move_to_end(key)
+        contention.contended += 1
+        contention.wait_time += wait_time
+        contention.max_wait_time = max(contention.max_wait_time, wait_time)
+
+    async def _acquire(self, key: Hashable, lock: Lock) -> None:
+        if not lock.locked():
+            await lock.acquire()
+            self._acquired += 1
+            return
+        started_at = time.monotonic()
+        await lock.acquire()
+        self._acquired += 1
+        self._record_wait(key, time.monotonic() - started_at)
 
     @asynccontextmanager
     async def lock(self, key: StorageKey) -> AsyncGenerator[None, None]:
-        lock = self._locks[key]
-        async with lock:
-            yield
+        if self._stripes:
+            lock = self._stripes[hash(key) % len(self._stripes)]
+            await self._acquire(key, lock)
+            try:
+                yield
+            finally:
+                lock.release()
+            return
+
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = _LockEntry()
+        entry.users += 1
+        try:
+            await self._acquire(key, entry.lock)
+            try:
+                yield
+            finally:
+                entry.lock.release()
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[key]
 
     async def close(self) -> None:
         self._locks.clear()
+        self._contention.clear()
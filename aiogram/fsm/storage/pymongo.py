@@ -12,6 +12,7 @@ from aiogram.fsm.storage.base import (
     StateType,
     StorageKey,
 )
+from aiogram.fsm.storage.serializer import BaseSerializer
 
 
 class PyMongoStorage(BaseStorage):
@@ -25,12 +26,18 @@ class PyMongoStorage(BaseStorage):
         key_builder: KeyBuilder | None = None,
         db_name: str = "aiogram_fsm",
         collection_name: str = "states_and_data",
+        serializer: BaseSerializer | None = None,
     ) -> None:
         """
         :param client: instance of AsyncMongoClient
         :param key_builder: builder that helps to convert contextual key to string
         :param db_name: name of the MongoDB database for FSM
         :param collection_name: name of the collection for storing FSM states and data
+        :param serializer: serializer of the data, the data is stored as the binary value
+            when it's specified and as the embedded document by default.
+            The binary value can't be updated partially, so :code:`update_data` reads
+            the data and writes it back, concurrent updates of the same record
+            are lost unless they are isolated (see :code:`events_isolation`)
         """
         if key_builder is None:
             key_builder = DefaultKeyBuilder()
@@ -38,6 +45,7 @@ class PyMongoStorage(BaseStorage):
         self._database = self._client[db_name]
         self._collection = self._database[collection_name]
         self._key_builder = key_builder
+        self._serializer = serializer
 
     @classmethod
     def from_url(
@@ -70,6 +78,19 @@ class PyMongoStorage(BaseStorage):
             return value.state
         return str(value)
 
+    def _dump_data(self, data: dict[str, Any]) -> Any:
+        if self._serializer is None:
+            return data
+        return self._serializer.dumps(data)
+
+    def _load_data(self, value: Any) -> dict[str, Any]:
+        if not value:
+            return {}
+        # Documents written before the serializer was enabled keep the embedded data
+        if self._serializer is not None and isinstance(value, bytes):
+            return self._serializer.loads(value)
+        return cast(dict[str, Any], value)
+
     async def set_state(self, key: StorageKey, state: StateType = None) -> None:
         document_id = self._key_builder.build(key)
         if state is None:
@@ -113,18 +134,53 @@ class PyMongoStorage(BaseStorage):
         else:
             await self._collection.update_one(
                 filter={"_id": document_id},
-                update={"$set": {"data": data}},
+                update={"$set": {"data": self._dump_data(data)}},
                 upsert=True,
             )
 
     async def get_data(self, key: StorageKey) -> dict[str, Any]:
         document_id = self._key_builder.build(key)
         document = await self._collection.find_one({"_id": document_id})
-        if document is None or not document.get("data"):
+        if document is None:
             return {}
-        return cast(dict[str, Any], document["data"])
+        return self._load_data(document.get("data"))
+
+    async def get_state_and_data(self, key: StorageKey) -> tuple[str | None, dict[str, Any]]:
+        document_id = self._key_builder.build(key)
+        document = await self._collection.find_one({"_id": document_id})
+        if document is None:
+            return None, {}
+        return cast(str | None, document.get("state")), self._load_data(document.get("data"))
+
+    async def set_state_and_data(
+        self,
+        key: StorageKey,
+        state: StateType,
+        data: Mapping[str, Any],
+    ) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+
+        document_id = self._key_builder.build(key)
+        document: dict[str, Any] = {}
+        if state is not None:
+            document["state"] = self.resolve_state(state)
+        if data:
+            document["data"] = self._dump_data(data)
+        if not document:
+            await self._collection.delete_one({"_id": document_id})
+            return
+        await self._collection.replace_one({"_id": document_id}, document, upsert=True)
 
     async def update_data(self, key: StorageKey, data: Mapping[str, Any]) -> dict[str, Any]:
+        if self._serializer is not None:
+            # Serialized data can't be updated partially, so it's read and written back
+            current_data = await self.get_data(key)
+            current_data.update(data)
+            await self.set_data(key, current_data)
+            return current_data
+
         document_id = self._key_builder.build(key)
         update_with = {f"data.{key}": value for key, value in data.items()}
         update_result = await self._collection.find_one_and_update(
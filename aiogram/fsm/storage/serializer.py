@@ -0,0 +1,215 @@
+import json
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from typing import Any, Literal, cast
+
+CompressionCodec = Literal["zstd", "lz4", "zlib"]
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+_Compress = Callable[[bytes], bytes]
+_Decompress = Callable[[bytes], bytes]
+
+# Compressed values are recognized by the frame header of the codec
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_LZ4_MAGIC = b"\x04\x22\x4d\x18"
+# Header of the zlib stream with the default window size
+_ZLIB_CMF = 0x78
+
+
+class BaseSerializer(ABC):
+    """
+    Base class for serializers of the FSM data
+
+    Serializer converts the data of the record to bytes stored by the storage and back.
+    """
+
+    @abstractmethod
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        """
+        Serialize the data
+
+        :param data: data of the record
+        :return: serialized data
+        """
+
+    @abstractmethod
+    def loads(self, value: bytes) -> dict[str, Any]:
+        """
+        Deserialize the data
+
+        :param value: serialized data
+        :return: data of the record
+        """
+
+
+class JsonSerializer(BaseSerializer):
+    """
+    Serializer that encodes the data as the JSON text,
+    values are compatible with the records written without the serializer
+    """
+
+    def __init__(
+        self,
+        loads: Callable[..., Any] = json.loads,
+        dumps: Callable[..., str | bytes] = json.dumps,
+    ) -> None:
+        """
+        :param loads: JSON loader
+        :param dumps: JSON dumper, can return :code:`str` or :code:`bytes`
+            (like :code:`orjson.dumps`)
+        """
+        self._loads = loads
+        self._dumps = dumps
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        value = self._dumps(data)
+        if isinstance(value, bytes):
+            return value
+        return value.encode("utf-8")
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        return cast(dict[str, Any], self._loads(value.decode("utf-8")))
+
+
+class OrJsonSerializer(BaseSerializer):
+    """
+    Serializer that encodes the data as the JSON by the :code:`orjson` package
+    (:code:`pip install orjson`), values are readable by the :class:`JsonSerializer`
+    """
+
+    def __init__(self, option: int | None = None) -> None:
+        """
+        :param option: options of :code:`orjson.dumps`,
+            for example :code:`orjson.OPT_NON_STR_KEYS` to allow the non-string keys
+        """
+        try:
+            import orjson
+        except ImportError as exc:  # pragma: no cover
+            msg = "OrJsonSerializer requires the orjson package (`pip install orjson`)"
+            raise RuntimeError(msg) from exc
+        self._orjson = orjson
+        self.option = option
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        return self._orjson.dumps(data, option=self.option)
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        return cast(dict[str, Any], self._orjson.loads(value))
+
+
+class MsgPackSerializer(BaseSerializer):
+    """
+    Serializer that encodes the data as the MessagePack by the :code:`msgpack` package
+    (:code:`pip install msgpack`)
+
+    Values are more compact than the JSON, bytes are stored as is
+    and non-string keys of the nested dicts are kept.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as exc:  # pragma: no cover
+            msg = "MsgPackSerializer requires the msgpack package (`pip install msgpack`)"
+            raise RuntimeError(msg) from exc
+        self._packb = partial(msgpack.packb, use_bin_type=True)
+        self._unpackb = partial(msgpack.unpackb, raw=False, strict_map_key=False)
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        return cast(bytes, self._packb(data))
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        return cast(dict[str, Any], self._unpackb(value))
+
+
+def _is_zlib_frame(value: bytes) -> bool:
+    # The first two bytes of the zlib header are a multiple of 31
+    return len(value) > 1 and value[0] == _ZLIB_CMF and int.from_bytes(value[:2], "big") % 31 == 0
+
+
+def _load_codec(
+    codec: CompressionCodec,
+    level: int | None,
+) -> tuple[_Compress, _Decompress, Callable[[bytes], bool]]:
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover
+            msg = "zstd compression requires the zstandard package (`pip install zstandard`)"
+            raise RuntimeError(msg) from exc
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        decompressor = zstandard.ZstdDecompressor()
+        return compressor.compress, decompressor.decompress, lambda v: v.startswith(_ZSTD_MAGIC)
+    if codec == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as exc:  # pragma: no cover
+            msg = "lz4 compression requires the lz4 package (`pip install lz4`)"
+            raise RuntimeError(msg) from exc
+        return (
+            partial(lz4.frame.compress, compression_level=0 if level is None else level),
+            lz4.frame.decompress,
+            lambda v: v.startswith(_LZ4_MAGIC),
+        )
+    if codec == "zlib":
+        return (
+            partial(zlib.compress, level=-1 if level is None else level),
+            zlib.decompress,
+            _is_zlib_frame,
+        )
+    msg = f"Unknown compression codec {codec!r}"
+    raise ValueError(msg)
+
+
+class CompressedSerializer(BaseSerializer):
+    """
+    Serializer that compresses the values of another serializer
+    when they are larger than the threshold
+
+    Compressed values are recognized by the frame header of the codec,
+    so the records written before the compression was enabled
+    (or smaller than the threshold) are read as is.
+
+    Codecs:
+
+    - :code:`zstd` - requires the :code:`zstandard` package (:code:`pip install zstandard`)
+    - :code:`lz4` - requires the :code:`lz4` package (:code:`pip install lz4`)
+    - :code:`zlib` - from the standard library, slower than the other ones
+    """
+
+    def __init__(
+        self,
+        serializer: BaseSerializer | None = None,
+        codec: CompressionCodec = "zstd",
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: int | None = None,
+    ) -> None:
+        """
+        :param serializer: serializer of the data, :class:`JsonSerializer` by default
+        :param codec: compression codec
+        :param threshold: values shorter than this number of bytes are not compressed
+        :param level: compression level, the default level of the codec is used by default
+        """
+        if serializer is None:
+            serializer = JsonSerializer()
+        self.serializer = serializer
+        self.codec = codec
+        self.threshold = threshold
+        self._compress, self._decompress, self._is_compressed = _load_codec(codec, level)
+
+    def dumps(self, data: dict[str, Any]) -> bytes:
+        value = self.serializer.dumps(data)
+        if len(value) < self.threshold:
+            return value
+        compressed = self._compress(value)
+        # Incompressible values are stored as is
+        if len(compressed) >= len(value):
+            return value
+        return compressed
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        if self._is_compressed(value):
+            value = self._decompress(value)
+        return self.serializer.loads(value)
@@ -5,3 +5,5 @@ event = logging.getLogger("aiogram.event")
 middlewares = logging.getLogger("aiogram.middlewares")
 webhook = logging.getLogger("aiogram.webhook")
 scene = logging.getLogger("aiogram.scene")
+client = logging.getLogger("aiogram.client")
+fsm = logging.getLogger("aiogram.fsm")
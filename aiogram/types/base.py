@@ -1,7 +1,15 @@
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, cast, get_args
 from unittest.mock import sentinel
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    ModelWrapValidatorHandler,
+    TypeAdapter,
+    ValidationInfo,
+    model_validator,
+)
 
 from aiogram.client.context_controller import BotContextController
 from aiogram.client.default import Default
@@ -19,7 +27,165 @@ class TelegramObject(BotContextController, BaseModel):
         protected_namespaces=(),
     )
 
-    @model_validator(mode="before")
+    __lazy_validation__: ClassVar[bool] = True
+    """
+    Whether the optional nested objects of this object can be deferred
+    when it is validated in the lazy mode
+    """
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _remove_unset_validator(
+        cls,
+        values: Any,
+        handler: ModelWrapValidatorHandler[Any],
+        info: ValidationInfo,
+    ) -> Any:
+        # UNSET can't be passed within raw JSON, so JSON input is passed as is
+        # to be parsed by pydantic-core without building the intermediate dict
+        if info.mode == "json":
+            return handler(values)
+        values = cls.remove_unset(values)
+        if (
+            info.context
+            and info.context.get(LAZY_CONTEXT_KEY)
+            and cls.__lazy_validation__
+            and isinstance(values, dict)
+        ):
+            return cls._validate_lazy(values, handler)
+        return handler(values)
+
+    @classmethod
+    def _resolve_deferrable_fields(cls) -> dict[str, str]:
+        """
+        Resolve optional fields that contain nested objects, mapped from alias to field name
+        """
+        fields = _deferrable_fields.get(cls)
+        if fields is None:
+            fields = _deferrable_fields[cls] = {
+                field.alias or name: name
+                for name, field in cls.model_fields.items()
+                if not field.is_required() and _contains_model(field.annotation)
+            }
+        return fields
+
+    @classmethod
+    def _validate_lazy(
+        cls,
+        values: dict[str, Any],
+        handler: ModelWrapValidatorHandler[Any],
+    ) -> Any:
+        deferrable_fields = cls._resolve_deferrable_fields()
+        deferred: dict[str, Any] = {}
+        eager: dict[str, Any] = {}
+        for key, value in values.items():
+            name = deferrable_fields.get(key)
+            if name is None or value is None:
+                eager[key] = value
+            else:
+                deferred[name] = value
+
+        instance = handler(eager)
+        if deferred:
+            for name in deferred:
+                # Missing attribute will be resolved by the __getattr__ on the first access
+                instance.__dict__.pop(name, None)
+            cast(dict[str, Any], instance.__pydantic_private__)[DEFERRED_FIELDS_KEY] = deferred
+        return instance
+
+    @classmethod
+    def _get_field_adapter(cls, name: str) -> TypeAdapter[Any]:
+        adapter = _field_adapters.get((cls, name))
+        if adapter is None:
+            adapter = _field_adapters[cls, name] = TypeAdapter(cls.model_fields[name].annotation)
+        return adapter
+
+    def _resolve_deferred_field(self, name: str) -> Any:
+        private = cast(dict[str, Any], self.__pydantic_private__)
+        deferred = private[DEFERRED_FIELDS_KEY]
+        if name in self.__dict__:
+            # Field of the mutable object is already reassigned
+            value = self.__dict__[name]
+        else:
+            value = self._get_field_adapter(name).validate_python(
+                deferred[name],
+                context={"bot": self._bot},
+            )
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+        # The mapping is not modified in place because it can be shared with copies of the object
+        deferred = {key: raw for key, raw in deferred.items() if key != name}
+        if deferred:
+            private[DEFERRED_FIELDS_KEY] = deferred
+        else:
+            del private[DEFERRED_FIELDS_KEY]
+            # Restore the order of fields to keep the serialized object the same
+            # as the eagerly validated one
+            fields = self.__dict__
+            object.__setattr__(
+                self,
+                "__dict__",
+                {
+                    field_name: fields[field_name]
+                    for field_name in self.__class__.__pydantic_fields__
+                },
+            )
+        return value
+
+    def _resolve_own_deferred_fields(self) -> None:
+        private = self.__pydantic_private__
+        if private and DEFERRED_FIELDS_KEY in private:
+            for name in tuple(private[DEFERRED_FIELDS_KEY]):
+                self._resolve_deferred_field(name)
+
+    def resolve_deferred_fields(self) -> None:
+        """
+        Validate all deferred nested objects of this object and of all its nested objects
+        (including the objects in lists and dicts).
+
+        Deferred fields are not included into serialized object,
+        so it should be called before the serialization of lazily validated objects,
+        :meth:`model_dump` and :meth:`model_dump_json` do it automatically.
+        """
+        self._resolve_own_deferred_fields()
+        for value in self.__dict__.values():
+            _resolve_nested_deferred_fields(value)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        self.resolve_deferred_fields()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.resolve_deferred_fields()
+        return super().model_dump_json(**kwargs)
+
+    # Nested objects handle their own deferred fields when they are compared,
+    # hashed or represented, so only the fields of this object are handled here
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is type(other) and (_is_deferred(self) or _is_deferred(other)):
+            return _deferred_equals(self, other)
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        self._resolve_own_deferred_fields()
+        return hash(tuple(self.__dict__.get(name) for name in self.__class__.__pydantic_fields__))
+
+    def __repr_args__(self) -> Iterable[tuple[str | None, Any]]:
+        self._resolve_own_deferred_fields()
+        return super().__repr_args__()
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, item: str) -> Any:
+            # Only fields can be deferred, so private attributes are never touched
+            # until the instance is fully initialized
+            if item in self.__class__.__pydantic_fields__:
+                private = self.__pydantic_private__
+                if private and item in private.get(DEFERRED_FIELDS_KEY, ()):
+                    return self._resolve_deferred_field(item)
+            return super().__getattr__(item)
+
     @classmethod
     def remove_unset(cls, values: dict[str, Any]) -> dict[str, Any]:
         """
@@ -41,6 +207,70 @@ class MutableTelegramObject(TelegramObject):
     )
 
 
+def _is_deferred(obj: TelegramObject) -> bool:
+    private = obj.__pydantic_private__
+    return bool(private) and DEFERRED_FIELDS_KEY in cast(dict[str, Any], private)
+
+
+def _deferred_equals(first: TelegramObject, second: TelegramObject) -> bool:
+    """
+    Compare objects with deferred fields,
+    the deferred fields are resolved only when the other fields are equal
+    """
+    first_private = dict(first.__pydantic_private__ or {})
+    second_private = dict(second.__pydantic_private__ or {})
+    first_deferred = first_private.pop(DEFERRED_FIELDS_KEY, {})
+    second_deferred = second_private.pop(DEFERRED_FIELDS_KEY, {})
+    if first_private != second_private or (first.__pydantic_extra__ or {}) != (
+        second.__pydantic_extra__ or {}
+    ):
+        return False
+
+    first_fields, second_fields = first.__dict__, second.__dict__
+    unresolved = []
+    for name in first.__class__.__pydantic_fields__:
+        if name in first_fields and name in second_fields:
+            if first_fields[name] != second_fields[name]:
+                return False
+        elif name not in first_fields and name not in second_fields:
+            # The same raw values are validated to the equal objects
+            if first_deferred.get(name) != second_deferred.get(name):
+                unresolved.append(name)
+        elif first_fields.get(name, _MISSING) is None or second_fields.get(name, _MISSING) is None:
+            # Deferred values are never None
+            return False
+        else:
+            unresolved.append(name)
+    return all(getattr(first, name) == getattr(second, name) for name in unresolved)
+
+
+def _resolve_nested_deferred_fields(value: Any) -> None:
+    if isinstance(value, TelegramObject):
+        value.resolve_deferred_fields()
+    elif isinstance(value, list | tuple):
+        for item in value:
+            _resolve_nested_deferred_fields(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _resolve_nested_deferred_fields(item)
+
+
+def _contains_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in get_args(annotation))
+
+
+# Caches of lazy validation, filled on the first lazy validation of the class
+_deferrable_fields: dict[type[TelegramObject], dict[str, str]] = {}
+_field_adapters: dict[tuple[type[TelegramObject], str], TypeAdapter[Any]] = {}
+
+# Validation context key that enables lazy validation of nested objects
+LAZY_CONTEXT_KEY = "lazy"
+# Key of the private attributes storage where raw values of deferred fields are kept
+DEFERRED_FIELDS_KEY = "__deferred_fields__"
+_MISSING = object()
+
 # special sentinel object which used in a situation when None might be a useful value
 UNSET: Any = sentinel.UNSET
 UNSET_TYPE: Any = type(UNSET)
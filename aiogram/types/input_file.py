@@ -33,6 +33,13 @@ class InputFile(ABC):
         self.filename = filename
         self.chunk_size = chunk_size
 
+    @property
+    def size(self) -> int | None:
+        """
+        Size of the file in bytes when it is known before reading
+        """
+        return None
+
     @abstractmethod
     async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:  # pragma: no cover
         yield b""
@@ -73,6 +80,10 @@ class BufferedInputFile(InputFile):
             data = f.read()
         return cls(data, filename=filename, chunk_size=chunk_size)
 
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
     async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
         buffer = io.BytesIO(self.data)
         while chunk := buffer.read(self.chunk_size):
@@ -100,6 +111,10 @@ class FSInputFile(InputFile):
 
         self.path = path
 
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
     async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
         async with aiofiles.open(self.path, "rb") as f:
             while chunk := await f.read(self.chunk_size):
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
-from ..utils.mypy_hacks import lru_cache
 from .base import TelegramObject
 
 if TYPE_CHECKING:
@@ -36,6 +36,9 @@ class Update(TelegramObject):
     Source: https://core.telegram.org/bots/api#update
     """
 
+    # The event itself is always validated eagerly, only its nested objects can be deferred
+    __lazy_validation__ = False
+
     update_id: int
     """The update's unique identifier. Update identifiers start from a certain positive number and increase sequentially. This identifier becomes especially handy if you're using `webhooks <https://core.telegram.org/bots/api#setwebhook>`_, since it allows you to ignore repeated updates or to restore the correct update sequence, should they get out of order. If there are no new updates for at least a week, then identifier of the next update will be chosen randomly instead of sequentially"""
     message: Message | None = None
@@ -165,8 +168,9 @@ class Update(TelegramObject):
     def __hash__(self) -> int:
         return hash((type(self), self.update_id))
 
-    @property
-    @lru_cache()
+    # Cached by the instance, the shared cache would compare the updates with the same id
+    # and resolve their deferred fields
+    @cached_property
     def event_type(self) -> str:
         """
         Detect update type
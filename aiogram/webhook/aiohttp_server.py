@@ -3,7 +3,7 @@ import secrets
 from abc import ABC, abstractmethod
 from asyncio import Transport
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
 
 from aiohttp import JsonPayload, MultipartWriter, Payload, web
 from aiohttp.typedefs import Handler
@@ -13,11 +13,9 @@ from aiohttp.web_middlewares import middleware
 from aiogram import Bot, Dispatcher, loggers
 from aiogram.methods import TelegramMethod
 from aiogram.methods.base import TelegramType
+from aiogram.types import Update
 from aiogram.webhook.security import IPFilter
 
-if TYPE_CHECKING:
-    from aiogram.types import InputFile
-
 
 def setup_application(app: Application, dispatcher: Dispatcher, /, **kwargs: Any) -> None:
     """
@@ -37,6 +35,7 @@ def setup_application(app: Application, dispatcher: Dispatcher, /, **kwargs: Any
 
     async def on_startup(*a: Any, **kw: Any) -> None:  # pragma: no cover
         await dispatcher.emit_startup(**workflow_data)
+        dispatcher.compile_dispatch_plan()
 
     async def on_shutdown(*a: Any, **kw: Any) -> None:  # pragma: no cover
         await dispatcher.emit_shutdown(**workflow_data)
@@ -136,17 +135,26 @@ class BaseRequestHandler(ABC):
     def verify_secret(self, telegram_secret_token: str, bot: Bot) -> bool:
         pass
 
-    async def _background_feed_update(self, bot: Bot, update: dict[str, Any]) -> None:
+    async def _read_update(self, bot: Bot, request: web.Request) -> Update:
+        """
+        Read and validate the update from the request body before the response is sent,
+        when the default JSON loader is used the body is passed to pydantic as is
+        """
+        raw_update: dict[str, Any] | bytes
+        if bot.session.uses_default_json_loads:
+            raw_update = await request.read()
+        else:
+            raw_update = cast(dict[str, Any], await request.json(loads=bot.session.json_loads))
+        return self.dispatcher._validate_raw_update(bot, raw_update)
+
+    async def _background_feed_update(self, bot: Bot, update: Update) -> None:
         result = await self.dispatcher.feed_raw_update(bot=bot, update=update, **self.data)
         if isinstance(result, TelegramMethod):
             await self.dispatcher.silent_call_request(bot=bot, result=result)
 
-    async def _handle_request_background(self, bot: Bot, request: web.Request) -> web.Response:
+    async def _handle_request_background(self, bot: Bot, update: Update) -> web.Response:
         feed_update_task = asyncio.create_task(
-            self._background_feed_update(
-                bot=bot,
-                update=await request.json(loads=bot.session.json_loads),
-            ),
+            self._background_feed_update(bot=bot, update=update),
         )
         self._background_feed_update_tasks.add(feed_update_task)
         feed_update_task.add_done_callback(self._background_feed_update_tasks.discard)
@@ -171,16 +179,13 @@ class BaseRequestHandler(ABC):
         payload = writer.append(result.__api_method__)
         payload.set_content_disposition("form-data", name="method")
 
-        files: dict[str, InputFile] = {}
-        for key, value in result.model_dump(warnings=False).items():
-            value = bot.session.prepare_value(value, bot=bot, files=files)
-            if not value:
-                continue
-            payload = writer.append(value)
+        data, files = bot.session.prepare_payload(bot=bot, method=result)
+        for key, value in data.items():
+            payload = writer.append(bot.session.prepare_form_value(value))
             payload.set_content_disposition("form-data", name=key)
 
         for key, value in files.items():
-            payload = writer.append(value.read(bot))
+            payload = writer.append(bot.session.stream_file(bot, value))
             payload.set_content_disposition(
                 "form-data",
                 name=key,
@@ -189,10 +194,10 @@ class BaseRequestHandler(ABC):
 
         return writer
 
-    async def _handle_request(self, bot: Bot, request: web.Request) -> web.Response:
+    async def _handle_request(self, bot: Bot, update: Update) -> web.Response:
         result: TelegramMethod[Any] | None = await self.dispatcher.feed_webhook_update(
             bot,
-            await request.json(loads=bot.session.json_loads),
+            update,
             **self.data,
         )
         return web.Response(body=self._build_response_writer(bot=bot, result=result))
@@ -201,9 +206,15 @@ class BaseRequestHandler(ABC):
         bot = await self.resolve_bot(request)
         if not self.verify_secret(request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""), bot):
             return web.Response(body="Unauthorized", status=401)
+        try:
+            update = await self._read_update(bot=bot, request=request)
+        except ValueError as e:
+            # Invalid JSON or update, Telegram should not get the success response for it
+            loggers.webhook.warning("Received invalid update: %s", e)
+            return web.Response(body="Bad Request", status=400)
         if self.handle_in_background:
-            return await self._handle_request_background(bot=bot, request=request)
-        return await self._handle_request(bot=bot, request=request)
+            return await self._handle_request_background(bot=bot, update=update)
+        return await self._handle_request(bot=bot, update=update)
 
     __call__ = handle
 
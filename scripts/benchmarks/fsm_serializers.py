@@ -0,0 +1,108 @@
+"""
+Benchmark of FSM data serializers
+
+Compares the size of the stored values and the time of dumping and loading them
+by the serializers of :code:`aiogram.fsm.storage.serializer`
+for the data of different sizes. Serializers whose packages are not installed are skipped.
+
+Usage: python scripts/benchmarks/fsm_serializers.py
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from aiogram.fsm.storage.serializer import (
+    BaseSerializer,
+    CompressedSerializer,
+    CompressionCodec,
+    JsonSerializer,
+    MsgPackSerializer,
+    OrJsonSerializer,
+)
+
+NUMBER = 2000
+REPEAT = 5
+
+DATA: dict[str, dict[str, Any]] = {
+    "small": {"language": "en", "step": 3, "confirmed": False},
+    "wizard draft": {
+        "title": "Weekly digest",
+        "text": "Hello, <b>world</b>! Visit https://aiogram.dev for more information. " * 20,
+        "buttons": [{"text": f"Option {i}", "url": f"https://aiogram.dev/{i}"} for i in range(8)],
+        "schedule": {"weekday": 1, "hour": 10, "timezone": "Europe/Kyiv"},
+    },
+    "cart": {
+        "items": [
+            {
+                "id": 100000 + i,
+                "title": f"Product {i}",
+                "price": 9.99 + i,
+                "quantity": i % 5 + 1,
+                "options": {"size": "XL", "color": "black"},
+            }
+            for i in range(200)
+        ],
+        "currency": "EUR",
+        "promo_code": None,
+    },
+}
+
+
+def _optional(factory: Callable[[], BaseSerializer]) -> BaseSerializer | None:
+    try:
+        return factory()
+    except RuntimeError:
+        return None
+
+
+def _compressed(codec: CompressionCodec) -> Callable[[], BaseSerializer]:
+    return lambda: CompressedSerializer(codec=codec)
+
+
+SERIALIZERS: dict[str, Callable[[], BaseSerializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrJsonSerializer,
+    "msgpack": MsgPackSerializer,
+    "json+zlib": _compressed("zlib"),
+    "json+zstd": _compressed("zstd"),
+    "json+lz4": _compressed("lz4"),
+    "orjson+zstd": lambda: CompressedSerializer(OrJsonSerializer(), codec="zstd"),
+    "msgpack+zstd": lambda: CompressedSerializer(MsgPackSerializer(), codec="zstd"),
+}
+
+
+def measure(func: Callable[[], Any]) -> float:
+    # The best of several runs is the least affected by other processes
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    serializers = {
+        name: serializer
+        for name, factory in SERIALIZERS.items()
+        if (serializer := _optional(factory)) is not None
+    }
+    skipped = SERIALIZERS.keys() - serializers.keys()
+
+    for data_name, data in DATA.items():
+        print(f"\n{data_name}")  # noqa: T201
+        print(f"{'serializer':<16}{'size':>10}{'dumps':>12}{'loads':>12}")  # noqa: T201
+        for name, serializer in serializers.items():
+            value = serializer.dumps(data)
+            dumps_time = measure(partial(serializer.dumps, data))
+            loads_time = measure(partial(serializer.loads, value))
+            print(  # noqa: T201
+                f"{name:<16}"
+                f"{len(value):>8} B"
+                f"{dumps_time * 1e6:>9.1f} us"
+                f"{loads_time * 1e6:>9.1f} us"
+            )
+
+    if skipped:
+        print(f"\nSkipped (packages are not installed): {', '.join(sorted(skipped))}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
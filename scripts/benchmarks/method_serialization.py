@@ -0,0 +1,98 @@
+"""
+Benchmark of outgoing method serialization
+
+Compares dumping the method by pydantic followed by the recursive
+:code:`BaseSession.prepare_value` with the compiled serializer of the method class,
+that prepares the payload in a single traversal of the object.
+
+Usage: python scripts/benchmarks/method_serialization.py
+"""
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.session.serializer import get_model_serializer
+from aiogram.methods import EditMessageText, SendMessage, SendPhoto, TelegramMethod
+from aiogram.types import (
+    BufferedInputFile,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    MessageEntity,
+)
+
+NUMBER = 2000
+REPEAT = 5
+
+TEXT = "Hello, <b>world</b>! Visit https://aiogram.dev for more information. " * 10
+KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(
+                text=f"Option {row}-{column}", callback_data=f"opt:{row}:{column}"
+            )
+            for column in range(3)
+        ]
+        for row in range(4)
+    ],
+)
+METHODS: dict[str, TelegramMethod[Any]] = {
+    "sendMessage": SendMessage(chat_id=-1001234567890, text="Hello, world!"),
+    "sendMessage+kb": SendMessage(
+        chat_id=-1001234567890,
+        text=TEXT,
+        entities=[MessageEntity(type="url", offset=24 + 80 * i, length=19) for i in range(10)],
+        reply_markup=KEYBOARD,
+    ),
+    "editMessageText": EditMessageText(
+        chat_id=-1001234567890,
+        message_id=42,
+        text=TEXT,
+        reply_markup=KEYBOARD,
+    ),
+    "sendPhoto": SendPhoto(
+        chat_id=-1001234567890,
+        photo=BufferedInputFile(b"photo", filename="photo.jpg"),
+        caption=TEXT,
+    ),
+}
+
+
+def measure(func: Callable[[], Any]) -> float:
+    # The best of several runs is the least affected by other processes
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def serialize_legacy(session: AiohttpSession, bot: Bot, method: TelegramMethod[Any]) -> Any:
+    files: dict[str, Any] = {}
+    return {
+        key: session.prepare_value(value, bot=bot, files=files, _dumps_json=False)
+        for key, value in method.model_dump(warnings=False).items()
+    }
+
+
+def serialize_compiled(bot: Bot, method: TelegramMethod[Any]) -> Any:
+    return get_model_serializer(type(method))(method, bot, {})
+
+
+def main() -> None:
+    bot = Bot("42:TEST")
+    session = AiohttpSession()
+
+    print(f"{'method':<18}{'model_dump':>14}{'compiled':>12}{'speedup':>10}")  # noqa: T201
+    for name, method in METHODS.items():
+        legacy_time = measure(partial(serialize_legacy, session, bot, method))
+        compiled_time = measure(partial(serialize_compiled, bot, method))
+        print(  # noqa: T201
+            f"{name:<18}"
+            f"{legacy_time * 1e6:>11.1f} us"
+            f"{compiled_time * 1e6:>9.1f} us"
+            f"{legacy_time / compiled_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Realistic Telegram payloads shared by benchmarks
+"""
+
+import json
+from typing import Any
+
+USER = {
+    "id": 123456789,
+    "is_bot": False,
+    "first_name": "John",
+    "last_name": "Doe",
+    "username": "johndoe",
+    "language_code": "en",
+    "is_premium": True,
+}
+GROUP = {
+    "id": -1001234567890,
+    "title": "aiogram benchmark group",
+    "username": "aiogram_benchmark",
+    "type": "supergroup",
+    "is_forum": True,
+}
+
+
+def message(message_id: int, text: str, reply: bool = True) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "message_id": message_id,
+        "message_thread_id": 42,
+        "from": USER,
+        "chat": GROUP,
+        "date": 1700000000 + message_id,
+        "is_topic_message": True,
+        "text": text,
+        "entities": [
+            {"type": "bold", "offset": 0, "length": 5},
+            {"type": "mention", "offset": 6, "length": 8},
+            {"type": "url", "offset": 15, "length": 19},
+        ],
+        "link_preview_options": {"is_disabled": True},
+    }
+    if reply:
+        payload["reply_to_message"] = {
+            **message(message_id - 1, "Hello @aiogram https://aiogram.dev", reply=False),
+            "photo": [
+                {
+                    "file_id": f"AgACAgIAAxkBAAI{size}",
+                    "file_unique_id": f"AQAD{size}",
+                    "file_size": size * 100,
+                    "width": size,
+                    "height": size,
+                }
+                for size in (90, 320, 800, 1280)
+            ],
+        }
+    return payload
+
+
+MESSAGE_UPDATE = {
+    "update_id": 100000001,
+    "message": message(1000, "Hello @aiogram https://aiogram.dev"),
+}
+CALLBACK_QUERY_UPDATE = {
+    "update_id": 100000002,
+    "callback_query": {
+        "id": "1234567890123456789",
+        "from": USER,
+        "message": {
+            **message(1001, "Choose an option", reply=False),
+            "reply_markup": {
+                "inline_keyboard": [
+                    [
+                        {"text": f"Option {row}-{column}", "callback_data": f"opt:{row}:{column}"}
+                        for column in range(3)
+                    ]
+                    for row in range(4)
+                ],
+            },
+        },
+        "chat_instance": "-1234567890123456789",
+        "data": "opt:1:2",
+    },
+}
+
+PAYLOADS = {
+    "message": json.dumps(MESSAGE_UPDATE).encode(),
+    "callback_query": json.dumps(CALLBACK_QUERY_UPDATE).encode(),
+}
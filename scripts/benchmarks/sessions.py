@@ -0,0 +1,180 @@
+"""
+Benchmark of HTTP session backends
+
+Runs a fake Bot API server in a separate process and measures requests per second,
+p50/p99 latency and peak memory of Python allocations of the client
+for each session backend with :code:`sendMessage`, multipart :code:`sendDocument`
+and :code:`getUpdates` (100 updates per response) requests.
+
+The fake server speaks HTTP/1.1 over plain TCP, so the HTTP/2 multiplexing
+of :code:`HttpxSession` is not involved here, it works only with TLS servers
+like :code:`api.telegram.org`.
+
+Usage: python scripts/benchmarks/sessions.py [--requests 5000] [--concurrency 100]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiohttp import web
+from payloads import MESSAGE_UPDATE, message
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.session.base import BaseSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.methods import GetUpdates, SendDocument, SendMessage
+from aiogram.types import BufferedInputFile
+
+MESSAGE_RESPONSE = json.dumps({"ok": True, "result": message(1000, "Hello", reply=False)})
+UPDATES_RESPONSE = json.dumps(
+    {
+        "ok": True,
+        "result": [{**MESSAGE_UPDATE, "update_id": update_id} for update_id in range(100)],
+    }
+)
+DOCUMENT = BufferedInputFile(b"\0" * 64 * 1024, filename="document.bin")
+# Memory is measured separately because tracing of allocations slows down the client
+MEMORY_REQUESTS = 500
+
+SCENARIOS: dict[str, Callable[[], Any]] = {
+    "sendMessage": lambda: SendMessage(chat_id=42, text="Hello"),
+    "sendDocument": lambda: SendDocument(chat_id=42, document=DOCUMENT),
+    "getUpdates": lambda: GetUpdates(offset=1, timeout=0),
+}
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def run_server(port: int) -> None:
+    async def handle_method(request: web.Request) -> web.Response:
+        # Read the whole body to emulate the request parsing on the server side
+        await request.read()
+        if request.match_info["method"] == "getUpdates":
+            return web.Response(text=UPDATES_RESPONSE, content_type="application/json")
+        return web.Response(text=MESSAGE_RESPONSE, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/bot{token}/{method}", handle_method)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+async def wait_server(port: int) -> None:
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:  # noqa: PERF203
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+async def run_requests(
+    call: Callable[[], Awaitable[Any]],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started_at = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started_at, latencies
+
+
+async def benchmark(
+    session: BaseSession,
+    scenario: Callable[[], Any],
+    requests: int,
+    concurrency: int,
+) -> tuple[float, float, float, float]:
+    async with Bot("42:TEST", session=session).context() as bot:
+
+        async def call() -> Any:
+            return await bot(scenario())
+
+        # Warm up connections and caches
+        await run_requests(call, concurrency, concurrency)
+
+        elapsed, latencies = await run_requests(call, requests, concurrency)
+
+        tracemalloc.start()
+        await run_requests(call, MEMORY_REQUESTS, concurrency)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return requests / elapsed, percentiles[49], percentiles[98], peak_memory
+
+
+def get_sessions(api: TelegramAPIServer) -> dict[str, Callable[[], BaseSession]]:
+    sessions: dict[str, Callable[[], BaseSession]] = {
+        "aiohttp": lambda: AiohttpSession(api=api),
+    }
+    try:
+        from aiogram.client.session.httpx import HttpxSession
+    except ImportError:
+        print("httpx is not installed, HttpxSession is skipped")  # noqa: T201
+    else:
+        sessions["httpx"] = lambda: HttpxSession(api=api)
+    return sessions
+
+
+async def main(requests: int, concurrency: int) -> None:
+    port = get_free_port()
+    server = multiprocessing.Process(target=run_server, args=(port,), daemon=True)
+    server.start()
+    try:
+        await wait_server(port)
+        sessions = get_sessions(TelegramAPIServer.from_base(f"http://127.0.0.1:{port}"))
+
+        print(  # noqa: T201
+            f"{'scenario':<16}{'session':<10}{'rps':>10}{'p50':>12}{'p99':>12}{'memory':>12}"
+        )
+        for scenario_name, scenario in SCENARIOS.items():
+            for session_name, session_factory in sessions.items():
+                rps, p50, p99, memory = await benchmark(
+                    session_factory(),
+                    scenario,
+                    requests=requests,
+                    concurrency=concurrency,
+                )
+                print(  # noqa: T201
+                    f"{scenario_name:<16}"
+                    f"{session_name:<10}"
+                    f"{rps:>10.0f}"
+                    f"{p50 * 1e3:>9.2f} ms"
+                    f"{p99 * 1e3:>9.2f} ms"
+                    f"{memory / 1024 / 1024:>9.2f} MB"
+                )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(requests=args.requests, concurrency=args.concurrency))
@@ -0,0 +1,70 @@
+"""
+Benchmark of incoming update deserialization
+
+Compares two-step deserialization (JSON decoding into dict and then validation)
+with the validation of the raw JSON body by pydantic-core
+(model validators still run in Python for each nested object)
+and with the lazy validation of nested objects (including access to the fields
+that are usually used by the filters and middlewares).
+
+Usage: python scripts/benchmarks/update_parsing.py
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from payloads import PAYLOADS
+
+from aiogram import Bot
+from aiogram.types import Update
+from aiogram.types.base import LAZY_CONTEXT_KEY
+
+NUMBER = 2000
+REPEAT = 5
+
+
+def measure(func: Callable[[], Any]) -> float:
+    # The best of several runs is the least affected by other processes
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def validate_dict(body: bytes, context: dict[str, Any]) -> None:
+    Update.model_validate(json.loads(body), context=context)
+
+
+def validate_json(body: bytes, context: dict[str, Any]) -> None:
+    Update.model_validate_json(body, context=context)
+
+
+def validate_lazy(body: bytes, context: dict[str, Any]) -> None:
+    update = Update.model_validate(json.loads(body), context=context)
+    # Update.event is not used here because its cache is not applicable to the benchmark
+    event = update.message or update.callback_query
+    getattr(event, "chat", None)
+    getattr(event, "from_user", None)
+
+
+def main() -> None:
+    bot = Bot("42:TEST")
+    context = {"bot": bot}
+    lazy_context = {"bot": bot, LAZY_CONTEXT_KEY: True}
+
+    print(f"{'payload':<16}{'dict':>14}{'raw bytes':>14}{'lazy':>14}{'speedup':>10}")  # noqa: T201
+    for name, body in PAYLOADS.items():
+        two_steps = measure(partial(validate_dict, body, context))
+        raw = measure(partial(validate_json, body, context))
+        lazy = measure(partial(validate_lazy, body, lazy_context))
+        print(  # noqa: T201
+            f"{name:<16}"
+            f"{two_steps * 1e6:>11.1f} us"
+            f"{raw * 1e6:>11.1f} us"
+            f"{lazy * 1e6:>11.1f} us"
+            f"{two_steps / min(raw, lazy):>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
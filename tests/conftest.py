@@ -11,6 +11,7 @@ from redis.exceptions import ConnectionError
 
 from aiogram import Dispatcher
 from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.cached import CachedStorage
 from aiogram.fsm.storage.memory import (
     DisabledEventIsolation,
     MemoryStorage,
@@ -18,7 +19,7 @@ from aiogram.fsm.storage.memory import (
 )
 from aiogram.fsm.storage.mongo import MongoStorage
 from aiogram.fsm.storage.pymongo import PyMongoStorage
-from aiogram.fsm.storage.redis import RedisStorage
+from aiogram.fsm.storage.redis import RedisHashStorage, RedisStorage
 from tests.mocked_bot import MockedBot
 
 DATA_DIR = Path(__file__).parent / "data"
@@ -73,6 +74,20 @@ async def redis_storage(redis_server):
         await storage.close()
 
 
+@pytest.fixture()
+async def redis_hash_storage(redis_server):
+    storage = RedisHashStorage.from_url(redis_server)
+    try:
+        await storage.redis.info()
+    except ConnectionError as e:
+        pytest.fail(str(e))
+    try:
+        yield storage
+    finally:
+        await storage.redis.flushdb()
+        await storage.close()
+
+
 @pytest.fixture()
 def mongo_server(request):
     mongo_uri = request.config.getoption("--mongo")
@@ -142,6 +157,15 @@ async def memory_storage():
         await storage.close()
 
 
+@pytest.fixture()
+async def cached_storage():
+    storage = CachedStorage(MemoryStorage())
+    try:
+        yield storage
+    finally:
+        await storage.close()
+
+
 @pytest.fixture()
 async def redis_isolation(redis_storage):
     return redis_storage.create_isolation()
@@ -0,0 +1,212 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aiogram.client.broadcast import (
+    Broadcast,
+    FileBroadcastCheckpoint,
+    MemoryBroadcastCheckpoint,
+)
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import SendMessage
+from tests.mocked_bot import MockedBot
+
+
+def send_message(chat_id: int) -> SendMessage:
+    return SendMessage(chat_id=chat_id, text="Hello")
+
+
+def fake_requests(bot: MockedBot, errors: dict[int, list[Exception]] | None = None) -> list[int]:
+    """
+    Replace requests of the bot, requests to the chats from :code:`errors`
+    fail with the errors one by one
+    """
+    errors = errors or {}
+    sent: list[int] = []
+
+    @bot.session.middleware
+    async def fake_request(make_request, bot, method):
+        await asyncio.sleep(0)
+        chat_errors = errors.get(method.chat_id)
+        if chat_errors:
+            raise chat_errors.pop(0)
+        sent.append(method.chat_id)
+        return True
+
+    return sent
+
+
+async def async_chat_ids(count: int):
+    for chat_id in range(count):
+        yield chat_id
+
+
+class TestFileBroadcastCheckpoint:
+    async def test_save_and_load(self, tmp_path: Path):
+        checkpoint = FileBroadcastCheckpoint(tmp_path / "broadcast.json")
+        assert await checkpoint.load() == 0
+
+        await checkpoint.save(42)
+        assert await FileBroadcastCheckpoint(tmp_path / "broadcast.json").load() == 42
+        assert not (tmp_path / "broadcast.json.tmp").exists()
+        await checkpoint.close()
+
+
+class TestBroadcast:
+    @pytest.mark.parametrize("chat_ids", [range(100), async_chat_ids(100)])
+    async def test_broadcast(self, bot: MockedBot, chat_ids):
+        sent = fake_requests(bot)
+        reports = []
+
+        async def on_progress(stats):
+            reports.append(stats)
+
+        stats = await bot.broadcast(
+            send_message,
+            chat_ids,
+            rate=10_000,
+            concurrency=10,
+            on_progress=on_progress,
+        )
+
+        assert sorted(sent) == list(range(100))
+        assert stats.position == stats.sent == 100
+        assert stats.blocked == stats.failed == stats.skipped == 0
+        assert stats.in_flight == 0
+        assert stats.throughput > 0
+        assert reports == [stats]
+
+    async def test_concurrency(self, bot: MockedBot):
+        in_flight = max_in_flight = 0
+
+        @bot.session.middleware
+        async def fake_request(make_request, bot, method):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return True
+
+        await bot.broadcast(send_message, range(50), rate=10_000, concurrency=5)
+
+        assert max_in_flight == 5
+
+    async def test_errors(self, bot: MockedBot):
+        method = send_message(0)
+        sent = fake_requests(
+            bot,
+            {
+                1: [TelegramForbiddenError(method=method, message="bot was blocked by the user")],
+                2: [TelegramBadRequest(method=method, message="chat not found")],
+                3: [TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=0)],
+                4: [
+                    TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=0)
+                    for _ in range(3)
+                ],
+            },
+        )
+        blocked = []
+        failed = []
+
+        async def on_blocked(chat_id):
+            blocked.append(chat_id)
+
+        async def on_failed(chat_id, error):
+            failed.append((chat_id, type(error)))
+
+        stats = await bot.broadcast(
+            send_message,
+            range(6),
+            rate=10_000,
+            max_retries=2,
+            on_blocked=on_blocked,
+            on_failed=on_failed,
+        )
+
+        assert sorted(sent) == [0, 3, 5]
+        assert blocked == [1]
+        assert sorted(failed) == [(2, TelegramBadRequest), (4, TelegramRetryAfter)]
+        assert stats.sent == 3
+        assert stats.blocked == 1
+        assert stats.failed == 2
+        assert stats.retries == 3
+        assert stats.position == 6
+
+    async def test_rate(self, bot: MockedBot):
+        fake_requests(bot)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        await bot.broadcast(send_message, range(24), rate=20)
+
+        # Burst of 20 requests is sent immediately, others are paced by 0.05 seconds
+        assert loop.time() - started_at >= 0.15
+
+    async def test_resume(self, bot: MockedBot):
+        checkpoint = MemoryBroadcastCheckpoint()
+        fails = True
+
+        def method_factory(chat_id):
+            if chat_id == 30 and fails:
+                msg = "Database is down"
+                raise RuntimeError(msg)
+            return send_message(chat_id)
+
+        sent = fake_requests(bot)
+        with pytest.raises(RuntimeError, match="Database is down"):
+            await bot.broadcast(
+                method_factory,
+                range(100),
+                rate=10_000,
+                concurrency=5,
+                checkpoint=checkpoint,
+            )
+
+        # Recipients after the failed one may be sent, but are not marked as processed
+        assert checkpoint.position == 30
+        assert set(range(30)) <= set(sent)
+        assert 30 not in sent
+
+        fails = False
+        sent.clear()
+        stats = await bot.broadcast(method_factory, range(100), rate=10_000, checkpoint=checkpoint)
+
+        assert min(sent) == 30
+        assert 99 in sent
+        assert stats.skipped == 30
+        assert stats.position == 100
+        assert checkpoint.position == 100
+
+    async def test_periodic_report(self, bot: MockedBot):
+        @bot.session.middleware
+        async def fake_request(make_request, bot, method):
+            await asyncio.sleep(0.005)
+            return True
+
+        checkpoint = MemoryBroadcastCheckpoint()
+        positions = []
+
+        async def on_progress(stats):
+            positions.append(stats.position)
+
+        await Broadcast(
+            bot,
+            send_message,
+            range(10),
+            rate=100,
+            concurrency=1,
+            checkpoint=checkpoint,
+            interval=0.001,
+            on_progress=on_progress,
+        ).run()
+
+        assert len(positions) > 1
+        assert positions[-1] == 10
+        assert positions == sorted(positions)
+        assert checkpoint.position == 10
@@ -0,0 +1,157 @@
+import io
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aresponses import ResponsesMockServer
+
+from aiogram import Bot
+from aiogram.client.download import get_parts
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.types import Document, File
+
+CONTENT = bytes(range(256)) * 40
+
+
+@pytest.fixture(autouse=True)
+def min_part_size(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("aiogram.client.download.MIN_PART_SIZE", 1024)
+
+
+@pytest.fixture()
+async def bot():
+    async with Bot("42:TEST").context() as bot:
+        yield bot
+
+
+def add_file_responses(aresponses: ResponsesMockServer, ranges: bool = True, count: int = 1):
+    requested_ranges = []
+
+    def handler(request: web.Request) -> web.Response:
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if not ranges or match is None:
+            return web.Response(body=CONTENT)
+        start, end = int(match.group(1)), int(match.group(2))
+        requested_ranges.append((start, end))
+        return web.Response(status=206, body=CONTENT[start : end + 1])
+
+    for _ in range(count):
+        aresponses.add(method_pattern="get", response=handler)
+    return requested_ranges
+
+
+class TestGetParts:
+    @pytest.mark.parametrize(
+        "file_size,connections,parts",
+        [
+            [10_000, 4, [(0, 2499), (2500, 4999), (5000, 7499), (7500, 9999)]],
+            [10_001, 2, [(0, 5000), (5001, 10000)]],
+            # Parts are not smaller than the minimal size
+            [2048, 4, [(0, 1023), (1024, 2047)]],
+            [1000, 4, [(0, 999)]],
+            [10_000, 1, [(0, 9999)]],
+        ],
+    )
+    def test_get_parts(self, file_size: int, connections: int, parts):
+        assert get_parts(file_size, connections) == parts
+
+
+class TestDownloadFile:
+    async def test_download_in_parts(
+        self, bot: Bot, aresponses: ResponsesMockServer, tmp_path: Path
+    ):
+        requested_ranges = add_file_responses(aresponses, count=4)
+        destination = tmp_path / "file.bin"
+
+        await bot.download_file(
+            "file.bin",
+            destination,
+            file_size=len(CONTENT),
+            connections=4,
+            chunk_size=1000,
+        )
+
+        assert destination.read_bytes() == CONTENT
+        assert sorted(requested_ranges) == [
+            (0, 2559),
+            (2560, 5119),
+            (5120, 7679),
+            (7680, 10239),
+        ]
+
+    async def test_ranges_not_supported(
+        self, bot: Bot, aresponses: ResponsesMockServer, tmp_path: Path
+    ):
+        add_file_responses(aresponses, ranges=False, count=5)
+        destination = tmp_path / "file.bin"
+
+        await bot.download_file(
+            "file.bin",
+            destination,
+            file_size=len(CONTENT),
+            connections=4,
+        )
+
+        # The file is downloaded again by a single request
+        assert destination.read_bytes() == CONTENT
+
+    async def test_binary_io_not_split(self, bot: Bot, aresponses: ResponsesMockServer):
+        requested_ranges = add_file_responses(aresponses)
+
+        result = await bot.download_file("file.bin", file_size=len(CONTENT), connections=4)
+
+        assert result.getvalue() == CONTENT
+        assert not requested_ranges
+
+    async def test_local_file_copy(self, bot: Bot, tmp_path: Path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(CONTENT)
+        destination = tmp_path / "destination.bin"
+        bot.session.api = TelegramAPIServer.from_base("http://localhost:8081", is_local=True)
+
+        assert await bot.download_file(source, destination) is None
+        assert destination.read_bytes() == CONTENT
+
+
+async def get_file(file_id: str) -> File:
+    return File(file_id=file_id, file_unique_id=file_id, file_path=f"{file_id}.bin")
+
+
+class TestDownloadMany:
+    async def test_download_many(self, bot: Bot, aresponses: ResponsesMockServer, tmp_path: Path):
+        add_file_responses(aresponses, count=3)
+        buffer = io.BytesIO()
+
+        with patch.object(bot, "get_file", side_effect=get_file):
+            results = await bot.download_many(
+                [
+                    ("0", tmp_path / "0.bin"),
+                    (Document(file_id="1", file_unique_id="1"), buffer),
+                    ("2", None),
+                ],
+                concurrency=2,
+            )
+
+        assert results[0] is None
+        assert (tmp_path / "0.bin").read_bytes() == CONTENT
+        assert results[1] is buffer
+        assert buffer.getvalue() == CONTENT
+        assert results[2].getvalue() == CONTENT
+
+    async def test_return_exceptions(self, bot: Bot, aresponses: ResponsesMockServer):
+        add_file_responses(aresponses)
+
+        with patch.object(bot, "get_file", side_effect=get_file):
+            results = await bot.download_many(
+                [("0", None), (object(), None)],  # type: ignore[list-item]
+                return_exceptions=True,
+            )
+
+        assert results[0].getvalue() == CONTENT
+        assert isinstance(results[1], TypeError)
+
+    async def test_raise_error(self, bot: Bot):
+        with pytest.raises(TypeError):
+            await bot.download_many([(object(), None)])  # type: ignore[list-item]
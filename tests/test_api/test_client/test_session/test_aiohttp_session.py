@@ -17,7 +17,12 @@ from aiogram.client.session import aiohttp
 from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.exceptions import TelegramNetworkError
 from aiogram.methods import TelegramMethod
-from aiogram.types import InputFile
+from aiogram.types import (
+    BufferedInputFile,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputFile,
+)
 from tests.mocked_bot import MockedBot
 
 
@@ -182,6 +187,70 @@ class TestAiohttpSession:
             assert isinstance(result, int)
             assert result == 42
 
+    async def test_make_request_json_body(self, bot: MockedBot, aresponses: ResponsesMockServer):
+        async def handler(request):
+            assert request.content_type == "application/json"
+            assert await request.json() == {
+                "chat_id": 42,
+                "text": "test",
+                "reply_markup": {"inline_keyboard": [[{"text": "button", "url": "https://t.me"}]]},
+            }
+            return aresponses.Response(
+                status=200,
+                text='{"ok": true, "result": true}',
+                headers={"Content-Type": "application/json"},
+            )
+
+        aresponses.add(aresponses.ANY, "/bot42:TEST/method", "post", handler)
+
+        class TestMethod(TelegramMethod[bool]):
+            __returning__ = bool
+            __api_method__ = "method"
+
+            chat_id: int
+            text: str
+            parse_mode: str | Default | None = Default("parse_mode")
+            reply_markup: InlineKeyboardMarkup
+
+        async with AiohttpSession() as session:
+            call = TestMethod(
+                chat_id=42,
+                text="test",
+                reply_markup=InlineKeyboardMarkup(
+                    inline_keyboard=[[InlineKeyboardButton(text="button", url="https://t.me")]],
+                ),
+            )
+            assert await session.make_request(bot, call) is True
+
+    async def test_make_request_multipart(self, bot: MockedBot, aresponses: ResponsesMockServer):
+        async def handler(request):
+            assert request.content_type == "multipart/form-data"
+            data = await request.post()
+            assert data["chat_id"] == "42"
+            assert data["document"].startswith("attach://")
+            assert data[data["document"][9:]].filename == "file.txt"
+            return aresponses.Response(
+                status=200,
+                text='{"ok": true, "result": true}',
+                headers={"Content-Type": "application/json"},
+            )
+
+        aresponses.add(aresponses.ANY, "/bot42:TEST/method", "post", handler)
+
+        class TestMethod(TelegramMethod[bool]):
+            __returning__ = bool
+            __api_method__ = "method"
+
+            chat_id: int
+            document: InputFile
+
+        async with AiohttpSession() as session:
+            call = TestMethod(
+                chat_id=42,
+                document=BufferedInputFile(b"content", filename="file.txt"),
+            )
+            assert await session.make_request(bot, call) is True
+
     @pytest.mark.parametrize("error", [ClientError("mocked"), asyncio.TimeoutError()])
     async def test_make_request_network_error(self, error):
         async def side_effect(*args, **kwargs):
@@ -258,3 +327,78 @@ class TestAiohttpSession:
                     assert session == ctx
                 mocked_close.assert_awaited_once()
                 mocked_create_session.assert_awaited_once()
+
+    async def test_connector_options(self):
+        async with AiohttpSession(limit=10, limit_per_host=5, keepalive_timeout=30) as session:
+            connector = session._session.connector
+            assert connector.limit == 10
+            assert connector.limit_per_host == 5
+            assert connector._keepalive_timeout == 30
+
+            stats = session.get_pool_stats()
+            assert stats.limit == 10
+            assert stats.limit_per_host == 5
+
+    async def test_pool_stats(self, bot: MockedBot, aresponses: ResponsesMockServer):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return aresponses.Response(
+                status=200,
+                text='{"ok": true, "result": 42}',
+                headers={"Content-Type": "application/json"},
+            )
+
+        for _ in range(3):
+            aresponses.add(aresponses.ANY, "/bot42:TEST/method", "post", handler)
+
+        class TestMethod(TelegramMethod[int]):
+            __returning__ = int
+            __api_method__ = "method"
+
+        async with AiohttpSession(limit=1) as session:
+            stats = session.get_pool_stats()
+            assert stats.in_flight == 0
+            assert stats.active_connections == 0
+            assert stats.avg_wait_time == 0.0
+
+            await asyncio.gather(*(session.make_request(bot, TestMethod()) for _ in range(3)))
+
+            stats = session.get_pool_stats()
+            assert stats.in_flight == 0
+            assert stats.queued == 0
+            assert stats.active_connections == 0
+            assert stats.idle_connections == 1
+            assert stats.created_connections == 1
+            assert stats.reused_connections == 2
+            # Two requests waited for the only connection
+            assert stats.wait_count == 2
+            assert stats.max_wait_time > 0
+            assert stats.avg_wait_time == stats.total_wait_time / 2
+
+    async def test_pool_stats_closed_session(self):
+        session = AiohttpSession()
+        stats = session.get_pool_stats()
+        assert stats.active_connections == 0
+        assert stats.idle_connections == 0
+
+    async def test_warmup(self, aresponses: ResponsesMockServer):
+        for _ in range(3):
+            aresponses.add(aresponses.ANY, "/", "get", aresponses.Response(status=302))
+
+        session = AiohttpSession(warmup_connections=3)
+        try:
+            await session.create_session()
+            stats = session.get_pool_stats()
+            assert stats.created_connections == 3
+            assert stats.idle_connections == 3
+        finally:
+            await session.close()
+
+    async def test_warmup_network_error(self):
+        async with AiohttpSession() as session:
+            with patch(
+                "aiohttp.client.ClientSession._request",
+                new_callable=AsyncMock,
+                side_effect=ClientError("mocked"),
+            ):
+                assert await session.warmup(2) == 0
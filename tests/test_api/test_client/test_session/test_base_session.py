@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 from collections.abc import AsyncGenerator
@@ -10,6 +11,7 @@ from pytz import utc
 from aiogram import Bot
 from aiogram.client.default import Default, DefaultBotProperties
 from aiogram.client.session.base import BaseSession, TelegramType
+from aiogram.client.session.coalescing import DEFAULT_COALESCED_METHODS
 from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
 from aiogram.enums import ChatType, ParseMode, TopicIconColor
 from aiogram.exceptions import (
@@ -26,8 +28,22 @@ from aiogram.exceptions import (
     TelegramServerError,
     TelegramUnauthorizedError,
 )
-from aiogram.methods import DeleteMessage, GetMe, TelegramMethod
-from aiogram.types import UNSET_PARSE_MODE, LinkPreviewOptions, User
+from aiogram.methods import (
+    DeleteMessage,
+    GetMe,
+    SendDocument,
+    SendMessage,
+    TelegramMethod,
+)
+from aiogram.types import (
+    UNSET_PARSE_MODE,
+    BufferedInputFile,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    LinkPreviewOptions,
+    MessageEntity,
+    User,
+)
 from aiogram.types.base import UNSET_DISABLE_WEB_PAGE_PREVIEW, UNSET_PROTECT_CONTENT
 from tests.mocked_bot import MockedBot
 
@@ -150,6 +166,82 @@ class TestBaseSession:
         assert bot.session.prepare_value(UNSET_DISABLE_WEB_PAGE_PREVIEW, bot=bot, files={}) is None
         assert bot.session.prepare_value(UNSET_PROTECT_CONTENT, bot=bot, files={}) is None
 
+    def test_prepare_payload(self, bot: MockedBot):
+        session = CustomSession()
+        payload, files = session.prepare_payload(
+            bot,
+            SendMessage(
+                chat_id=42,
+                text="test",
+                entities=[MessageEntity(type="bold", offset=0, length=4)],
+                disable_notification=False,
+                reply_markup=InlineKeyboardMarkup(
+                    inline_keyboard=[[InlineKeyboardButton(text="test", callback_data="test")]]
+                ),
+            ),
+        )
+
+        # Nested values are not encoded separately, defaults of the bot are not set
+        assert payload == {
+            "chat_id": 42,
+            "text": "test",
+            "entities": [{"type": "bold", "offset": 0, "length": 4}],
+            "disable_notification": False,
+            "reply_markup": {"inline_keyboard": [[{"text": "test", "callback_data": "test"}]]},
+        }
+        assert files == {}
+
+    def test_prepare_payload_files(self, bot: MockedBot):
+        session = CustomSession()
+        document = BufferedInputFile(b"test", filename="test.txt")
+        payload, files = session.prepare_payload(
+            bot,
+            SendDocument(chat_id=42, document=document, caption=""),
+        )
+
+        assert set(payload) == {"chat_id", "document"}
+        assert files == {payload["document"][9:]: document}
+
+    def test_prepare_payload_custom_prepare_value(self, bot: MockedBot):
+        class UpperCaseSession(CustomSession):
+            def prepare_value(self, value: Any, *args: Any, **kwargs: Any) -> Any:
+                if isinstance(value, str):
+                    return value.upper()
+                return super().prepare_value(value, *args, **kwargs)
+
+        payload, _ = UpperCaseSession().prepare_payload(bot, SendMessage(chat_id=42, text="test"))
+
+        # Overridden prepare_value is respected
+        assert payload == {"chat_id": 42, "text": "TEST"}
+
+    async def test_stream_file(self, bot: MockedBot):
+        progress = AsyncMock()
+        session = CustomSession(upload_memory_limit=1024, upload_progress=progress)
+        file = BufferedInputFile(b"test", filename="test.txt", chunk_size=3)
+
+        chunks = [chunk async for chunk in session.stream_file(bot, file)]
+
+        assert chunks == [b"tes", b"t"]
+        assert session.upload_limiter is not None
+        assert session.upload_limiter.used == 0
+        assert progress.await_count == 2
+        progress.assert_awaited_with(file, 4, 4)
+
+    def test_stream_file_not_limited(self):
+        assert CustomSession().upload_limiter is None
+
+    @pytest.mark.parametrize(
+        "value,result",
+        [
+            ["test", "test"],
+            [42, "42"],
+            [False, "false"],
+            [{"test": [1, 2]}, '{"test": [1, 2]}'],
+        ],
+    )
+    def test_prepare_form_value(self, value: Any, result: str):
+        assert CustomSession().prepare_form_value(value) == result
+
     @pytest.mark.parametrize(
         "status_code,content,error",
         [
@@ -201,6 +293,25 @@ class TestBaseSession:
             if error.url:
                 assert error.url in string
 
+    @pytest.mark.parametrize("custom_json_loads", [True, False])
+    def test_check_response_bytes(self, custom_json_loads: bool):
+        if custom_json_loads:
+            session = CustomSession(json_loads=lambda value: json.loads(value))  # noqa: PLW0108
+        else:
+            session = CustomSession()
+        assert session.uses_default_json_loads is not custom_json_loads
+
+        bot = MockedBot()
+        response = session.check_response(
+            bot=bot,
+            method=GetMe(),
+            status_code=200,
+            content=b'{"ok":true,"result":{"id":42,"is_bot":true,"first_name":"Test"}}',
+        )
+        assert isinstance(response.result, User)
+        assert response.result.id == 42
+        assert response.result.bot is bot
+
     def test_check_response_json_decode_error(self):
         session = CustomSession()
         bot = MockedBot()
@@ -269,6 +380,21 @@ class TestBaseSession:
         assert my_middleware in session.middleware
         assert len(session.middleware) == 1
 
+    async def test_coalescing_disabled_by_default(self, bot: MockedBot):
+        assert not CustomSession().coalescer.methods
+
+        bot.add_result_for(GetMe, ok=True, result=User(id=42, is_bot=True, first_name="Test"))
+        bot.add_result_for(GetMe, ok=True, result=User(id=43, is_bot=True, first_name="Test"))
+        results = await asyncio.gather(bot(GetMe()), bot(GetMe()))
+
+        assert sorted(user.id for user in results) == [42, 43]
+
+    async def test_coalesce_methods(self):
+        session = CustomSession(coalesce_methods=DEFAULT_COALESCED_METHODS)
+
+        assert session.coalescer.is_coalesced(GetMe())
+        assert not session.coalescer.is_coalesced(SendMessage(chat_id=42, text="test"))
+
     async def test_use_middleware(self, bot: MockedBot):
         flag_before = False
         flag_after = False
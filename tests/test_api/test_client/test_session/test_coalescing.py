@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from aiogram.client.session.coalescing import RequestCoalescer
+from aiogram.exceptions import TelegramNotFound
+from aiogram.methods import GetChat, GetChatAdministrators, GetMe, SendMessage
+from aiogram.types import User
+from tests.mocked_bot import MockedBot
+
+
+class TestRequestCoalescer:
+    async def test_concurrent_calls(self, bot: MockedBot):
+        coalescer = RequestCoalescer([GetChatAdministrators])
+        method = GetChatAdministrators(chat_id=42)
+        calls = 0
+
+        async def make_request():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(coalescer(bot, method, make_request) for _ in range(10)),
+            coalescer(bot, GetChatAdministrators(chat_id=42), make_request),
+        )
+
+        assert calls == 1
+        assert results == [1] * 11
+        assert not coalescer.in_flight
+
+        # Completed requests are not reused
+        assert await coalescer(bot, method, make_request) == 2
+
+    async def test_different_calls(self, bot: MockedBot):
+        coalescer = RequestCoalescer([GetChat])
+        calls = 0
+
+        async def make_request():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            coalescer(bot, GetChat(chat_id=1), make_request),
+            coalescer(bot, GetChat(chat_id=2), make_request),
+            coalescer(MockedBot(token="1:OTHER"), GetChat(chat_id=1), make_request),
+        )
+
+        assert calls == 3
+
+    async def test_exception(self, bot: MockedBot):
+        coalescer = RequestCoalescer([GetChat])
+        method = GetChat(chat_id=42)
+
+        async def make_request():
+            await asyncio.sleep(0.01)
+            raise TelegramNotFound(method=method, message="chat not found")
+
+        results = await asyncio.gather(
+            coalescer(bot, method, make_request),
+            coalescer(bot, method, make_request),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], TelegramNotFound)
+        assert results[0] is results[1]
+        assert not coalescer.in_flight
+
+    async def test_first_call_cancelled(self, bot: MockedBot):
+        coalescer = RequestCoalescer([GetMe])
+        method = GetMe()
+
+        async def make_request():
+            await asyncio.sleep(0.01)
+            return 42
+
+        first = asyncio.create_task(coalescer(bot, method, make_request))
+        second = asyncio.create_task(coalescer(bot, method, make_request))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+        assert first.cancelled()
+
+    async def test_all_calls_cancelled(self, bot: MockedBot):
+        coalescer = RequestCoalescer([GetMe])
+        method = GetMe()
+        cancelled = asyncio.Event()
+
+        async def make_request():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        tasks = [asyncio.create_task(coalescer(bot, method, make_request)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert not coalescer.in_flight
+
+    def test_is_coalesced(self):
+        coalescer = RequestCoalescer([GetMe])
+
+        assert coalescer.is_coalesced(GetMe())
+        assert not coalescer.is_coalesced(SendMessage(chat_id=42, text="test"))
+
+
+class TestSessionCoalescing:
+    @pytest.mark.parametrize("coalesced", [True, False])
+    async def test_session_call(self, bot: MockedBot, coalesced: bool):
+        if coalesced:
+            bot.session.coalescer = RequestCoalescer([GetMe])
+        calls = 0
+
+        @bot.session.middleware
+        async def slow_middleware(make_request, b, method):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return await make_request(b, method)
+
+        for _ in range(2):
+            bot.add_result_for(GetMe, ok=True, result=User(id=42, is_bot=True, first_name="Test"))
+
+        results = await asyncio.gather(bot.get_me(), bot.get_me())
+
+        assert results[0].id == results[1].id == 42
+        assert calls == (1 if coalesced else 2)
@@ -0,0 +1,182 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from email import policy
+from email.parser import BytesParser
+
+import httpx
+import pytest
+from aiohttp import ClientResponseError
+
+from aiogram.client.session.httpx import HttpxSession
+from aiogram.exceptions import TelegramNetworkError
+from aiogram.methods import TelegramMethod
+from aiogram.types import BufferedInputFile
+from tests.mocked_bot import MockedBot
+
+
+class SampleMethod(TelegramMethod[int]):
+    __returning__ = int
+    __api_method__ = "method"
+
+    text: str | None = None
+    number: int | None = None
+    document: BufferedInputFile | None = None
+
+
+def make_session(handler) -> HttpxSession:
+    session = HttpxSession()
+    session._client_init["transport"] = httpx.MockTransport(handler)
+    return session
+
+
+class TestHttpxSession:
+    async def test_create_session(self):
+        session = HttpxSession(http2=False, limit=10, keepalive_timeout=30)
+        assert session._client is None
+        client = await session.create_session()
+        assert isinstance(client, httpx.AsyncClient)
+        assert await session.create_session() is client
+
+        await session.close()
+        assert client.is_closed
+        # Closed client is recreated
+        assert await session.create_session() is not client
+        await session.close()
+
+    async def test_close_not_created(self):
+        await HttpxSession().close()
+
+    async def test_build_multipart(self, bot: MockedBot):
+        session = HttpxSession()
+        content_type, body = session.build_multipart(
+            bot,
+            SampleMethod(
+                text='te"st',
+                number=42,
+                document=BufferedInputFile(b"content", filename="file.txt"),
+            ),
+        )
+        assert isinstance(body, AsyncGenerator)
+
+        # Body is parsed back by the standard MIME parser
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            b"Content-Type: %b\r\n\r\n%b"
+            % (content_type.encode(), b"".join([chunk async for chunk in body]))
+        )
+        fields = {
+            part.get_param("name", header="Content-Disposition"): (
+                part.get_filename(),
+                part.get_payload(decode=True),
+            )
+            for part in message.iter_parts()
+        }
+
+        assert fields["text"] == (None, b'te"st')
+        assert fields["number"] == (None, b"42")
+        key = fields["document"][1].decode()[len("attach://") :]
+        assert fields[key] == ("file.txt", b"content")
+
+    async def test_make_request(self, bot: MockedBot):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b'{"ok": true, "result": 42}')
+
+        async with make_session(handler) as session:
+            result = await session.make_request(bot, SampleMethod(text="test"))
+
+        assert result == 42
+        assert len(requests) == 1
+        assert str(requests[0].url) == "https://api.telegram.org/bot42:TEST/method"
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == {"text": "test"}
+
+    async def test_make_request_multipart(self, bot: MockedBot):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b'{"ok": true, "result": 42}')
+
+        async with make_session(handler) as session:
+            await session.make_request(
+                bot,
+                SampleMethod(document=BufferedInputFile(b"content", filename="file.txt")),
+            )
+
+        assert requests[0].headers["Content-Type"].startswith("multipart/form-data")
+        assert b'filename="file.txt"' in requests[0].content
+        assert b"content" in requests[0].content
+
+    @pytest.mark.parametrize(
+        "error,message",
+        [
+            [httpx.ConnectError("mocked"), "ConnectError: mocked"],
+            [httpx.ReadTimeout("mocked"), "Request timeout error"],
+        ],
+    )
+    async def test_make_request_network_error(self, bot: MockedBot, error, message):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise error
+
+        async with make_session(handler) as session:
+            with pytest.raises(TelegramNetworkError, match=message):
+                await session.make_request(bot, SampleMethod())
+
+    async def test_stream_content(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["X-Test"] == "test"
+            return httpx.Response(200, content=b"\f" * 10)
+
+        async with make_session(handler) as session:
+            chunks = [
+                chunk
+                async for chunk in session.stream_content(
+                    "https://api.telegram.org/file/bot42:TEST/file.txt",
+                    headers={"X-Test": "test"},
+                    chunk_size=1,
+                )
+            ]
+
+        assert chunks == [b"\f"] * 10
+
+    async def test_stream_content_404(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404)
+
+        async with make_session(handler) as session:
+            stream = session.stream_content("https://api.telegram.org/file/bot42:TEST/file.txt")
+            with pytest.raises(ClientResponseError) as exc_info:
+                async for _ in stream:
+                    ...
+
+        assert exc_info.value.status == 404
+        assert str(exc_info.value.request_info.url).endswith("/file.txt")
+
+    async def test_stream_content_404_without_raise_for_status(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, content=b"error")
+
+        async with make_session(handler) as session:
+            chunks = [
+                chunk
+                async for chunk in session.stream_content(
+                    "https://api.telegram.org/file/bot42:TEST/file.txt",
+                    raise_for_status=False,
+                )
+            ]
+
+        assert chunks == [b"error"]
+
+    async def test_concurrent_requests(self, bot: MockedBot):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"ok": true, "result": 42}')
+
+        async with make_session(handler) as session:
+            results = await asyncio.gather(
+                *(session.make_request(bot, SampleMethod()) for _ in range(10))
+            )
+
+        assert results == [42] * 10
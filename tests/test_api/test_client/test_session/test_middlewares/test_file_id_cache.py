@@ -0,0 +1,366 @@
+import asyncio
+import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.asyncio import Redis
+
+from aiogram.client.session.middlewares.file_id_cache import (
+    HASH_IN_THREAD_THRESHOLD,
+    FileIdCache,
+    MemoryFileIdStorage,
+    RedisFileIdStorage,
+)
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import SendDocument, SendMediaGroup, SendMessage, SendPhoto, UploadStickerFile
+from aiogram.types import (
+    BufferedInputFile,
+    Chat,
+    Document,
+    File,
+    FSInputFile,
+    InputMediaDocument,
+    InputMediaPhoto,
+    Message,
+    PhotoSize,
+    URLInputFile,
+)
+from tests.mocked_bot import MockedBot
+
+CHAT = Chat(id=42, type="private")
+DATE = datetime.datetime.now()
+
+
+def photo_message(file_id: str) -> Message:
+    return Message(
+        message_id=42,
+        date=DATE,
+        chat=CHAT,
+        photo=[
+            PhotoSize(file_id=f"{file_id}_small", file_unique_id="small", width=90, height=90),
+            PhotoSize(file_id=file_id, file_unique_id="big", width=800, height=800),
+        ],
+    )
+
+
+def document_message(file_id: str) -> Message:
+    return Message(
+        message_id=42,
+        date=DATE,
+        chat=CHAT,
+        document=Document(file_id=file_id, file_unique_id="document"),
+    )
+
+
+class TestMemoryFileIdStorage:
+    async def test_lru(self):
+        storage = MemoryFileIdStorage(max_size=2)
+        await storage.set("a", "file_a")
+        await storage.set("b", "file_b")
+        assert await storage.get("a") == "file_a"
+
+        await storage.set("c", "file_c")
+        assert len(storage) == 2
+        # "b" is the least recently used
+        assert await storage.get("b") is None
+        assert await storage.get("a") == "file_a"
+        assert await storage.get("c") == "file_c"
+
+        await storage.delete("a")
+        await storage.delete("a")
+        assert await storage.get("a") is None
+        await storage.close()
+
+
+@pytest.mark.redis
+class TestRedisFileIdStorage:
+    async def test_storage(self, redis_server):
+        storage = RedisFileIdStorage(Redis.from_url(redis_server), ttl=60)
+        try:
+            await storage.set("key", "file_id")
+            assert await storage.get("key") == "file_id"
+
+            await storage.delete("key")
+            assert await storage.get("key") is None
+        finally:
+            await storage.close()
+
+
+class TestFileIdCache:
+    def test_get_file_key_buffered(self):
+        middleware = FileIdCache()
+        file = BufferedInputFile(b"content", filename="file.txt")
+
+        key = middleware.get_file_key(file)
+        assert key == middleware.get_file_key(BufferedInputFile(b"content", filename="file.txt"))
+        assert key != middleware.get_file_key(BufferedInputFile(b"content", filename="other.txt"))
+        assert key != middleware.get_file_key(BufferedInputFile(b"other", filename="file.txt"))
+
+    async def test_large_file_hashed_in_thread(self, bot: MockedBot):
+        middleware = FileIdCache()
+        data = b"x" * HASH_IN_THREAD_THRESHOLD
+        document = BufferedInputFile(data, filename="file.txt")
+        method = SendDocument(chat_id=42, document=document)
+        make_request = AsyncMock(return_value=document_message("document_id"))
+
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mocked_to_thread:
+            await middleware(make_request, bot, method)
+            await middleware(make_request, bot, method)
+            # Small files are hashed in the event loop
+            await middleware(
+                make_request,
+                bot,
+                SendDocument(chat_id=42, document=BufferedInputFile(b"small", filename="a.txt")),
+            )
+
+        # Hash is calculated once for the same object
+        mocked_to_thread.assert_called_once()
+        assert make_request.await_args_list[1].args[1].document == "document_id"
+        assert middleware.get_file_key(document) == middleware.get_file_key(
+            BufferedInputFile(data, filename="file.txt")
+        )
+
+    def test_get_file_key_fs(self, tmp_path: Path):
+        middleware = FileIdCache()
+        path = tmp_path / "file.txt"
+        path.write_bytes(b"content")
+
+        key = middleware.get_file_key(FSInputFile(path))
+        assert key == middleware.get_file_key(FSInputFile(path))
+
+        path.write_bytes(b"new content")
+        assert middleware.get_file_key(FSInputFile(path)) != key
+
+        assert middleware.get_file_key(FSInputFile(tmp_path / "missing.txt")) is None
+
+    def test_get_file_key_not_supported(self):
+        assert FileIdCache().get_file_key(URLInputFile("https://example.com/file.txt")) is None
+
+    async def test_without_files(self, bot: MockedBot):
+        middleware = FileIdCache()
+        make_request = AsyncMock(return_value=42)
+        method = SendMessage(chat_id=42, text="test")
+
+        assert await middleware(make_request, bot, method) == 42
+        make_request.assert_awaited_once_with(bot, method)
+
+    async def test_send_by_file_id(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        make_request = AsyncMock(return_value=photo_message("uploaded"))
+
+        await middleware(make_request, bot, SendPhoto(chat_id=42, photo=photo, caption="test"))
+        assert make_request.await_args.args[1].photo is photo
+
+        method = SendPhoto(chat_id=1, photo=photo, caption="test")
+        await middleware(make_request, bot, method)
+        sent = make_request.await_args.args[1]
+        assert sent.photo == "uploaded"
+        assert sent.chat_id == 1
+        assert sent.caption == "test"
+        # Original method is not changed
+        assert method.photo is photo
+
+        assert middleware.misses == 1
+        assert middleware.hits == 1
+
+    async def test_file_id_per_bot_and_type(self, bot: MockedBot):
+        middleware = FileIdCache()
+        file = BufferedInputFile(b"content", filename="file.jpg")
+        await middleware(
+            AsyncMock(return_value=photo_message("uploaded")),
+            bot,
+            SendPhoto(chat_id=42, photo=file),
+        )
+
+        make_request = AsyncMock(return_value=document_message("document"))
+        await middleware(make_request, bot, SendDocument(chat_id=42, document=file))
+        assert make_request.await_args.args[1].document is file
+
+        other_bot = MockedBot(token="1:OTHER")
+        make_request = AsyncMock(return_value=photo_message("other"))
+        await middleware(make_request, other_bot, SendPhoto(chat_id=42, photo=file))
+        assert make_request.await_args.args[1].photo is file
+
+    async def test_media_group(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        document = BufferedInputFile(b"document", filename="file.txt")
+        method = SendMediaGroup(
+            chat_id=42,
+            media=[
+                InputMediaPhoto(media=photo, caption="photo"),
+                InputMediaPhoto(media="existing"),
+                InputMediaDocument(media=document),
+            ],
+        )
+        make_request = AsyncMock(
+            return_value=[
+                photo_message("photo_id"),
+                photo_message("existing"),
+                document_message("document_id"),
+            ]
+        )
+
+        await middleware(make_request, bot, method)
+        await middleware(make_request, bot, method)
+
+        media = make_request.await_args.args[1].media
+        assert [item.media for item in media] == ["photo_id", "existing", "document_id"]
+        assert media[0].caption == "photo"
+        assert middleware.hits == 2
+
+    async def test_same_file_in_media_group(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        make_request = AsyncMock(return_value=[photo_message("first"), photo_message("second")])
+
+        await middleware(
+            make_request,
+            bot,
+            SendMediaGroup(chat_id=42, media=[InputMediaPhoto(media=photo)] * 2),
+        )
+
+        make_request.assert_awaited_once()
+
+    async def test_upload_sticker_file(self, bot: MockedBot):
+        middleware = FileIdCache()
+        sticker = BufferedInputFile(b"sticker", filename="sticker.webp")
+        method = UploadStickerFile(user_id=42, sticker=sticker, sticker_format="static")
+        make_request = AsyncMock(return_value=File(file_id="sticker_id", file_unique_id="id"))
+
+        await middleware(make_request, bot, method)
+        await middleware(make_request, bot, method)
+
+        assert make_request.await_args.args[1].sticker == "sticker_id"
+
+    async def test_failed_upload_not_cached(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        method = SendPhoto(chat_id=42, photo=photo)
+
+        with pytest.raises(TelegramBadRequest):
+            await middleware(
+                AsyncMock(side_effect=TelegramBadRequest(method=method, message="chat not found")),
+                bot,
+                method,
+            )
+
+        make_request = AsyncMock(return_value=photo_message("uploaded"))
+        await middleware(make_request, bot, method)
+        assert make_request.await_args.args[1].photo is photo
+
+    async def test_invalid_file_id(self, bot: MockedBot):
+        storage = MemoryFileIdStorage()
+        middleware = FileIdCache(storage=storage)
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        method = SendPhoto(chat_id=42, photo=photo)
+        await middleware(AsyncMock(return_value=photo_message("expired")), bot, method)
+
+        make_request = AsyncMock(
+            side_effect=[
+                TelegramBadRequest(method=method, message="Bad Request: wrong file identifier"),
+                photo_message("uploaded"),
+            ]
+        )
+        await middleware(make_request, bot, method)
+
+        assert make_request.await_count == 2
+        assert make_request.await_args_list[0].args[1].photo == "expired"
+        assert make_request.await_args_list[1].args[1].photo is photo
+        (key,) = storage._data
+        assert await storage.get(key) == "uploaded"
+
+    async def test_other_error_with_file_id(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        method = SendPhoto(chat_id=42, photo=photo)
+        await middleware(AsyncMock(return_value=photo_message("uploaded")), bot, method)
+
+        make_request = AsyncMock(
+            side_effect=TelegramBadRequest(method=method, message="Bad Request: chat not found")
+        )
+        with pytest.raises(TelegramBadRequest):
+            await middleware(make_request, bot, method)
+        make_request.assert_awaited_once()
+
+    async def test_concurrent_uploads(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        uploads = 0
+
+        async def make_request(bot, method):
+            nonlocal uploads
+            if not isinstance(method.photo, str):
+                uploads += 1
+                await asyncio.sleep(0.01)
+            return photo_message("uploaded")
+
+        await asyncio.gather(
+            *(
+                middleware(make_request, bot, SendPhoto(chat_id=chat_id, photo=photo))
+                for chat_id in range(10)
+            )
+        )
+
+        assert uploads == 1
+        assert middleware.hits == 9
+        assert not middleware._uploads
+
+    async def test_concurrent_upload_failed(self, bot: MockedBot):
+        middleware = FileIdCache()
+        photo = BufferedInputFile(b"photo", filename="photo.jpg")
+        method = SendPhoto(chat_id=42, photo=photo)
+
+        async def fail(bot, method):
+            await asyncio.sleep(0.01)
+            raise TelegramBadRequest(method=method, message="chat not found")
+
+        make_request = AsyncMock(return_value=photo_message("uploaded"))
+        results = await asyncio.gather(
+            middleware(fail, bot, method),
+            middleware(make_request, bot, method),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], TelegramBadRequest)
+        # The waiting request uploads the file itself
+        assert make_request.await_args.args[1].photo is photo
+
+    async def test_concurrent_media_groups_in_reversed_order(self, bot: MockedBot):
+        class SlowStorage(MemoryFileIdStorage):
+            async def get(self, key: str) -> str | None:
+                # Let the other request take its uploads meanwhile
+                await asyncio.sleep(0)
+                return await super().get(key)
+
+        middleware = FileIdCache(storage=SlowStorage())
+        first = BufferedInputFile(b"first", filename="first.txt")
+        second = BufferedInputFile(b"second", filename="second.txt")
+
+        async def make_request(bot, method):
+            await asyncio.sleep(0.01)
+            return [
+                document_message(
+                    item.media if isinstance(item.media, str) else item.media.filename
+                )
+                for item in method.media
+            ]
+
+        def media_group(*files: BufferedInputFile) -> SendMediaGroup:
+            return SendMediaGroup(
+                chat_id=42,
+                media=[InputMediaDocument(media=file) for file in files],
+            )
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                middleware(make_request, bot, media_group(first, second)),
+                middleware(make_request, bot, media_group(second, first)),
+            ),
+            timeout=1,
+        )
+
+        assert middleware.misses + middleware.hits == 4
+        assert not middleware._uploads
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.client.session.middlewares.flood_control import FloodControl, TokenBucket
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import BanChatMember, DeleteMessage, GetMe, SendChatAction, SendMessage
+from tests.mocked_bot import MockedBot
+
+
+class TestTokenBucket:
+    async def test_burst(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        for _ in range(3):
+            assert await bucket.acquire() == 0
+        assert bucket.get_delay() == pytest.approx(0.1, abs=0.01)
+
+    async def test_pacing(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        started_at = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        # The first token is available immediately, the next ones every 20 ms
+        assert time.monotonic() - started_at >= 0.04
+
+    async def test_pause(self):
+        bucket = TokenBucket(rate=1000, capacity=1000)
+        bucket.pause(0.05)
+        assert not bucket.is_idle()
+        assert await bucket.acquire() >= 0.04
+
+    async def test_is_idle(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.is_idle()
+        await bucket.acquire()
+        assert not bucket.is_idle()
+
+
+class TestFloodControl:
+    async def test_not_chat_method(self, bot: MockedBot):
+        middleware = FloodControl()
+        make_request = AsyncMock(return_value=42)
+
+        assert await middleware(make_request, bot, GetMe()) == 42
+        assert middleware.get_stats().chats == 0
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            SendChatAction(chat_id=42, action="typing"),
+            DeleteMessage(chat_id=42, message_id=1),
+            BanChatMember(chat_id=-42, user_id=42),
+        ],
+    )
+    async def test_not_paced_chat_method(self, bot: MockedBot, method):
+        middleware = FloodControl(private_chat_rate=0.1, group_chat_rate=0.1)
+        make_request = AsyncMock(return_value=42)
+
+        for _ in range(5):
+            assert await asyncio.wait_for(middleware(make_request, bot, method), timeout=1) == 42
+        assert middleware.get_stats().chats == 0
+
+    async def test_custom_methods(self, bot: MockedBot):
+        middleware = FloodControl(methods={SendChatAction})
+        make_request = AsyncMock()
+
+        await middleware(make_request, bot, SendChatAction(chat_id=42, action="typing"))
+        await middleware(make_request, bot, SendMessage(chat_id=43, text="test"))
+
+        assert (bot.id, 42) in middleware._chat_buckets
+        assert (bot.id, 43) not in middleware._chat_buckets
+
+    async def test_private_chat_pacing(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_rate=20, private_chat_burst=20)
+        make_request = AsyncMock()
+        method = SendMessage(chat_id=42, text="test")
+
+        started_at = time.monotonic()
+        await asyncio.gather(*(middleware(make_request, bot, method) for _ in range(22)))
+
+        # Burst of one second is sent immediately, the next requests every 50 ms
+        assert time.monotonic() - started_at >= 0.09
+        assert make_request.await_count == 22
+        stats = middleware.get_stats()
+        assert stats.queued == 0
+        assert stats.chats == 1
+        assert stats.throttled == 2
+        assert stats.total_delay > 0
+
+    async def test_chats_are_independent(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_rate=0.1, group_chat_rate=0.1)
+        make_request = AsyncMock()
+
+        started_at = time.monotonic()
+        await asyncio.gather(
+            middleware(make_request, bot, SendMessage(chat_id=1, text="test")),
+            middleware(make_request, bot, SendMessage(chat_id=2, text="test")),
+            middleware(make_request, bot, SendMessage(chat_id=-100, text="test")),
+            middleware(make_request, bot, SendMessage(chat_id="@channel", text="test")),
+        )
+
+        assert time.monotonic() - started_at < 1
+        assert middleware.get_stats().chats == 4
+
+    async def test_group_chat_rate(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_rate=1, group_chat_rate=0.5)
+
+        assert middleware._get_chat_bucket(bot.id, 42).rate == 1
+        assert middleware._get_chat_bucket(bot.id, -42).rate == 0.5
+        assert middleware._get_chat_bucket(bot.id, "@channel").rate == 0.5
+
+    async def test_default_burst(self, bot: MockedBot):
+        middleware = FloodControl()
+
+        private_bucket = middleware._get_chat_bucket(bot.id, 42)
+        assert private_bucket.capacity == 3
+        assert private_bucket.rate == 1
+        group_bucket = middleware._get_chat_bucket(bot.id, -42)
+        assert group_bucket.capacity == 20
+        assert group_bucket.rate == pytest.approx(1 / 3)
+
+    async def test_group_chat_burst(self, bot: MockedBot):
+        middleware = FloodControl()
+        make_request = AsyncMock()
+        method = SendMessage(chat_id=-42, text="test")
+
+        # The whole per-minute allowance is sent at once
+        await asyncio.wait_for(
+            asyncio.gather(*(middleware(make_request, bot, method) for _ in range(20))),
+            timeout=1,
+        )
+        assert make_request.await_count == 20
+        assert middleware.get_stats().throttled == 0
+
+        # The next request waits for the refill of the bucket
+        task = asyncio.create_task(middleware(make_request, bot, method))
+        await asyncio.sleep(0.01)
+        assert middleware.get_queue_depth(bot.id, -42) == 1
+        assert middleware._get_chat_bucket(bot.id, -42).get_delay() > 2
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def test_private_chat_burst(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_burst=5)
+        make_request = AsyncMock()
+        method = SendMessage(chat_id=42, text="test")
+
+        await asyncio.wait_for(
+            asyncio.gather(*(middleware(make_request, bot, method) for _ in range(5))),
+            timeout=1,
+        )
+        assert middleware.get_stats().throttled == 0
+        assert middleware._get_chat_bucket(bot.id, 42).get_delay() > 0.9
+
+    async def test_queue_depth(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_rate=0.1, private_chat_burst=1)
+        make_request = AsyncMock()
+        method = SendMessage(chat_id=42, text="test")
+
+        await middleware(make_request, bot, method)
+        tasks = [asyncio.create_task(middleware(make_request, bot, method)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        assert middleware.get_queue_depth(bot.id, 42) == 2
+        assert middleware.get_queue_depth(bot.id, 43) == 0
+        assert middleware.get_queue_depth(bot.id) == 0
+        assert middleware.get_stats().queued == 2
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert middleware.get_stats().queued == 0
+
+    async def test_retry_after(self, bot: MockedBot):
+        middleware = FloodControl()
+        method = SendMessage(chat_id=42, text="test")
+        make_request = AsyncMock(
+            side_effect=[TelegramRetryAfter(method=method, message="test", retry_after=0), 42]
+        )
+
+        with patch.object(TokenBucket, "pause") as mocked_pause:
+            assert await middleware(make_request, bot, method) == 42
+
+        mocked_pause.assert_called_once_with(0)
+        assert make_request.await_count == 2
+        assert middleware.get_stats().retry_after == 1
+
+    async def test_retry_after_pauses_chat_only(self, bot: MockedBot):
+        middleware = FloodControl()
+        method = SendMessage(chat_id=42, text="test")
+        make_request = AsyncMock(
+            side_effect=TelegramRetryAfter(method=method, message="test", retry_after=10)
+        )
+
+        task = asyncio.create_task(middleware(make_request, bot, method))
+        await asyncio.sleep(0.01)
+
+        assert middleware._get_chat_bucket(bot.id, 42).get_delay() > 9
+        assert middleware._get_global_bucket(bot.id).get_delay() == 0
+        make_request.side_effect = None
+        # Other chats are not affected
+        await asyncio.wait_for(
+            middleware(make_request, bot, SendMessage(chat_id=43, text="test")),
+            timeout=1,
+        )
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async def test_max_retries(self, bot: MockedBot):
+        middleware = FloodControl(max_retries=2)
+        method = SendMessage(chat_id=42, text="test")
+        make_request = AsyncMock(
+            side_effect=TelegramRetryAfter(method=method, message="test", retry_after=0)
+        )
+
+        with pytest.raises(TelegramRetryAfter):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 3
+
+    async def test_cleanup(self, bot: MockedBot):
+        middleware = FloodControl(private_chat_rate=1000)
+        make_request = AsyncMock()
+        await middleware(make_request, bot, SendMessage(chat_id=42, text="test"))
+        await asyncio.sleep(0.01)
+
+        middleware._cleaned_up_at = 0
+        middleware._get_chat_bucket(bot.id, 43)
+        assert (bot.id, 42) not in middleware._chat_buckets
+        assert (bot.id, 43) in middleware._chat_buckets
@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.client.session.middlewares.response_cache import ResponseCache
+from aiogram.exceptions import TelegramBadRequest, TelegramNotFound
+from aiogram.methods import (
+    BanChatMember,
+    GetChat,
+    GetChatMember,
+    GetChatMemberCount,
+    GetMe,
+    SendMessage,
+)
+from tests.mocked_bot import MockedBot
+
+
+class TestResponseCache:
+    async def test_cached(self, bot: MockedBot):
+        middleware = ResponseCache()
+        make_request = AsyncMock(return_value=42)
+
+        assert await middleware(make_request, bot, GetChatMemberCount(chat_id=1)) == 42
+        assert await middleware(make_request, bot, GetChatMemberCount(chat_id=1)) == 42
+        make_request.assert_awaited_once()
+
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=2))
+        assert make_request.await_count == 2
+
+        stats = middleware.get_stats()
+        assert stats.size == 2
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    async def test_not_cached_method(self, bot: MockedBot):
+        middleware = ResponseCache()
+        make_request = AsyncMock(return_value=42)
+        method = SendMessage(chat_id=42, text="test")
+
+        await middleware(make_request, bot, method)
+        await middleware(make_request, bot, method)
+
+        assert make_request.await_count == 2
+        assert middleware.get_stats().misses == 0
+        assert middleware.get_stats().hit_rate == 0.0
+
+    async def test_custom_ttls(self, bot: MockedBot):
+        middleware = ResponseCache(ttls={GetMe: 10})
+        make_request = AsyncMock(return_value=42)
+
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+
+        assert make_request.await_count == 2
+
+    async def test_expired(self, bot: MockedBot):
+        middleware = ResponseCache(ttls={GetChatMemberCount: 30})
+        make_request = AsyncMock(return_value=42)
+
+        with patch("time.monotonic", return_value=100.0):
+            await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        with patch("time.monotonic", return_value=129.0):
+            await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        assert make_request.await_count == 1
+
+        with patch("time.monotonic", return_value=130.0):
+            await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        assert make_request.await_count == 2
+
+    async def test_cached_per_bot(self, bot: MockedBot):
+        middleware = ResponseCache()
+        make_request = AsyncMock(return_value=42)
+
+        await middleware(make_request, bot, GetMe())
+        await middleware(make_request, MockedBot(token="1:OTHER"), GetMe())
+
+        assert make_request.await_count == 2
+
+    @pytest.mark.parametrize(
+        "error_type,message",
+        [
+            [TelegramNotFound, "Not Found"],
+            [TelegramBadRequest, "Bad Request: chat not found"],
+        ],
+    )
+    async def test_negative_cache(self, bot: MockedBot, error_type, message):
+        middleware = ResponseCache(negative_ttl=10)
+        method = GetChat(chat_id=1)
+        make_request = AsyncMock(side_effect=error_type(method=method, message=message))
+
+        for _ in range(3):
+            with pytest.raises(error_type):
+                await middleware(make_request, bot, method)
+
+        make_request.assert_awaited_once()
+        assert middleware.get_stats().negative_hits == 2
+
+        with patch("time.monotonic", return_value=10**9), pytest.raises(error_type):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 2
+
+    async def test_negative_cache_disabled(self, bot: MockedBot):
+        middleware = ResponseCache(negative_ttl=0)
+        method = GetChat(chat_id=1)
+        make_request = AsyncMock(side_effect=TelegramNotFound(method=method, message="Not Found"))
+
+        for _ in range(2):
+            with pytest.raises(TelegramNotFound):
+                await middleware(make_request, bot, method)
+
+        assert make_request.await_count == 2
+
+    async def test_other_error_not_cached(self, bot: MockedBot):
+        middleware = ResponseCache()
+        method = GetChat(chat_id=1)
+        make_request = AsyncMock(
+            side_effect=[TelegramBadRequest(method=method, message="Bad Request"), 42]
+        )
+
+        with pytest.raises(TelegramBadRequest):
+            await middleware(make_request, bot, method)
+        assert await middleware(make_request, bot, method) == 42
+
+    async def test_lru(self, bot: MockedBot):
+        middleware = ResponseCache(max_size=2)
+        make_request = AsyncMock(return_value=42)
+
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=2))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=3))
+        assert make_request.await_count == 3
+
+        # Chat 2 is the least recently used
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        assert make_request.await_count == 3
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=2))
+        assert make_request.await_count == 4
+
+        stats = middleware.get_stats()
+        assert stats.size == 2
+        assert stats.evictions == 2
+        assert set(middleware._chats) == {(bot.id, 1), (bot.id, 2)}
+
+    async def test_invalidated_by_changes(self, bot: MockedBot):
+        middleware = ResponseCache()
+        make_request = AsyncMock(return_value=42)
+        await middleware(make_request, bot, GetChatMember(chat_id=1, user_id=42))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=1))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=2))
+
+        await middleware(make_request, bot, BanChatMember(chat_id=1, user_id=42))
+        assert middleware.get_stats().size == 1
+
+        await middleware(make_request, bot, GetChatMember(chat_id=1, user_id=42))
+        await middleware(make_request, bot, GetChatMemberCount(chat_id=2))
+        assert make_request.await_count == 5
+
+    async def test_invalidate(self, bot: MockedBot):
+        middleware = ResponseCache()
+        other_bot = MockedBot(token="1:OTHER")
+        make_request = AsyncMock(return_value=42)
+        for current_bot in (bot, other_bot):
+            await middleware(make_request, current_bot, GetMe())
+            await middleware(make_request, current_bot, GetChat(chat_id=1))
+
+        middleware.invalidate(bot.id, chat_id=1)
+        assert middleware.get_stats().size == 3
+
+        middleware.invalidate(bot.id)
+        assert middleware.get_stats().size == 2
+        assert set(middleware._chats) == {(other_bot.id, 1)}
+
+        middleware.clear()
+        assert middleware.get_stats().size == 0
+        assert not middleware._chats
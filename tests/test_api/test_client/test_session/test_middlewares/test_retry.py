@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.client.session.middlewares.retry import (
+    RetryBudget,
+    RetryMiddleware,
+    RetryPolicy,
+)
+from aiogram.exceptions import (
+    RestartingTelegram,
+    TelegramBadRequest,
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import GetMe, SendMessage
+from aiogram.utils.backoff import BackoffConfig
+from tests.mocked_bot import MockedBot
+
+GET_ME = GetMe()
+SEND_MESSAGE = SendMessage(chat_id=42, text="test")
+
+
+@pytest.fixture(autouse=True)
+def mocked_sleep():
+    with patch(
+        "aiogram.client.session.middlewares.retry.asyncio.sleep",
+        new_callable=AsyncMock,
+    ) as mocked:
+        yield mocked
+
+
+class TestRetryBudget:
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+
+        for _ in range(10):
+            budget.deposit()
+        assert budget.tokens == 2
+
+
+class TestRetryMiddleware:
+    def test_get_policy(self):
+        policy = RetryPolicy(retry_on=(TelegramServerError,))
+        middleware = RetryMiddleware(policies={SendMessage: policy})
+
+        assert middleware.get_policy(SEND_MESSAGE) is policy
+        assert middleware.get_policy(GET_ME) is middleware.safe_policy
+        assert middleware.get_policy(SendMessage.model_construct()) is policy
+
+        middleware = RetryMiddleware(policies={SendMessage: None})
+        assert middleware.get_policy(SEND_MESSAGE) is None
+
+    async def test_success(self, bot: MockedBot):
+        middleware = RetryMiddleware()
+        make_request = AsyncMock(return_value=42)
+
+        assert await middleware(make_request, bot, GET_ME) == 42
+        make_request.assert_awaited_once_with(bot, GET_ME)
+        assert not middleware.retries
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TelegramServerError(method=GET_ME, message="Bad Gateway"),
+            RestartingTelegram(method=GET_ME, message="restart"),
+            TelegramNetworkError(method=GET_ME, message="timeout"),
+            TelegramRetryAfter(method=GET_ME, message="flood", retry_after=1),
+        ],
+    )
+    async def test_retry_safe_method(self, bot: MockedBot, mocked_sleep: AsyncMock, error):
+        middleware = RetryMiddleware()
+        make_request = AsyncMock(side_effect=[error, error, 42])
+
+        assert await middleware(make_request, bot, GET_ME) == 42
+        assert make_request.await_count == 3
+        assert mocked_sleep.await_count == 2
+        assert middleware.retries == {("GetMe", type(error).__name__): 2}
+
+    async def test_retry_after_delay(self, bot: MockedBot, mocked_sleep: AsyncMock):
+        middleware = RetryMiddleware()
+        error = TelegramRetryAfter(method=SEND_MESSAGE, message="flood", retry_after=5)
+        make_request = AsyncMock(side_effect=[error, 42])
+
+        assert await middleware(make_request, bot, SEND_MESSAGE) == 42
+        delay = mocked_sleep.await_args.args[0]
+        assert 5 <= delay <= 5 + middleware.default_policy.backoff_config.jitter
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TelegramServerError(method=SEND_MESSAGE, message="Bad Gateway"),
+            TelegramNetworkError(method=SEND_MESSAGE, message="timeout"),
+        ],
+    )
+    async def test_not_retry_unsafe_method(self, bot: MockedBot, error):
+        middleware = RetryMiddleware()
+        make_request = AsyncMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            await middleware(make_request, bot, SEND_MESSAGE)
+        make_request.assert_awaited_once()
+        assert not middleware.retries
+        assert not middleware.failures
+
+    async def test_retry_unsafe_method_restarting(self, bot: MockedBot):
+        middleware = RetryMiddleware()
+        make_request = AsyncMock(
+            side_effect=[RestartingTelegram(method=SEND_MESSAGE, message="restart"), 42]
+        )
+
+        assert await middleware(make_request, bot, SEND_MESSAGE) == 42
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TelegramBadRequest(method=GET_ME, message="Bad Request"),
+            TelegramEntityTooLarge(method=GET_ME, message="Too Large"),
+            TelegramRetryAfter(method=GET_ME, message="flood", retry_after=3600),
+        ],
+    )
+    async def test_not_retry_error(self, bot: MockedBot, error):
+        middleware = RetryMiddleware()
+        make_request = AsyncMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            await middleware(make_request, bot, GET_ME)
+        make_request.assert_awaited_once()
+
+    async def test_max_retries(self, bot: MockedBot):
+        middleware = RetryMiddleware(
+            safe_policy=RetryPolicy(
+                retry_on=(TelegramServerError,),
+                max_retries=2,
+                backoff_config=BackoffConfig(min_delay=0.1, max_delay=1, factor=2, jitter=0),
+            ),
+        )
+        make_request = AsyncMock(
+            side_effect=TelegramServerError(method=GET_ME, message="Bad Gateway")
+        )
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, GET_ME)
+        assert make_request.await_count == 3
+        assert middleware.retries == {("GetMe", "TelegramServerError"): 2}
+        assert middleware.failures == {("GetMe", "TelegramServerError"): 1}
+
+    async def test_disabled_policy(self, bot: MockedBot):
+        middleware = RetryMiddleware(policies={GetMe: None})
+        make_request = AsyncMock(
+            side_effect=TelegramServerError(method=GET_ME, message="Bad Gateway")
+        )
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, GET_ME)
+        make_request.assert_awaited_once()
+
+    async def test_budget_exhausted(self, bot: MockedBot):
+        middleware = RetryMiddleware(budget=RetryBudget(ratio=0, max_tokens=1))
+        make_request = AsyncMock(
+            side_effect=TelegramServerError(method=GET_ME, message="Bad Gateway")
+        )
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, GET_ME)
+        # Only one retry is allowed by the budget
+        assert make_request.await_count == 2
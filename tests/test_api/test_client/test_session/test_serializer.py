@@ -0,0 +1,172 @@
+import datetime
+from typing import Any
+
+import pytest
+from pydantic import field_serializer
+
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.serializer import get_model_serializer, prepare_value
+from aiogram.enums import InputMediaType, ParseMode
+from aiogram.methods import (
+    BanChatMember,
+    CreateChatInviteLink,
+    SendMediaGroup,
+    SendMessage,
+    SendPoll,
+    TelegramMethod,
+)
+from aiogram.types import (
+    BufferedInputFile,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputMediaPhoto,
+    InputPollOption,
+    LinkPreviewOptions,
+    MessageEntity,
+    ReplyParameters,
+    SuggestedPostParameters,
+    SuggestedPostPrice,
+    TelegramObject,
+    Update,
+)
+from aiogram.types.base import LAZY_CONTEXT_KEY
+from tests.mocked_bot import MockedBot
+
+METHODS = [
+    SendMessage(chat_id=42, text="test"),
+    SendMessage(
+        chat_id="@channel",
+        text="test",
+        parse_mode=ParseMode.HTML,
+        entities=[MessageEntity(type="bold", offset=0, length=4)],
+        link_preview_options=LinkPreviewOptions(is_disabled=True),
+        reply_parameters=ReplyParameters(message_id=42),
+        suggested_post_parameters=SuggestedPostParameters(
+            price=SuggestedPostPrice(currency="XTR", amount=42),
+            send_date=datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+        ),
+        reply_markup=InlineKeyboardMarkup(
+            inline_keyboard=[[InlineKeyboardButton(text="test", callback_data="test")]],
+        ),
+        disable_notification=False,
+    ),
+    SendPoll(
+        chat_id=42,
+        question="test",
+        options=[InputPollOption(text="foo"), "bar"],
+        close_date=datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+    ),
+    CreateChatInviteLink(chat_id=42, expire_date=1700000000),
+    # Extra fields are sent too
+    SendMessage(chat_id=42, text="test", unknown_field={"foo": None, "bar": [1, None]}),
+]
+
+
+def prepare_legacy(bot: MockedBot, method: TelegramMethod[Any]) -> dict[str, Any]:
+    files: dict[str, Any] = {}
+    return {
+        key: prepared
+        for key, value in method.model_dump(warnings=False).items()
+        if (prepared := bot.session.prepare_value(value, bot=bot, files=files, _dumps_json=False))
+        is not None
+    }
+
+
+class TestModelSerializer:
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize(
+        "default",
+        [
+            DefaultBotProperties(),
+            DefaultBotProperties(
+                parse_mode=ParseMode.MARKDOWN_V2,
+                link_preview_is_disabled=True,
+                protect_content=True,
+            ),
+        ],
+    )
+    def test_same_as_model_dump(self, method: TelegramMethod[Any], default: DefaultBotProperties):
+        bot = MockedBot(default=default)
+        files: dict[str, Any] = {}
+
+        result = get_model_serializer(type(method))(method, bot, files)
+
+        assert result == prepare_legacy(bot, method)
+        assert files == {}
+
+    def test_cached(self):
+        assert get_model_serializer(SendMessage) is get_model_serializer(SendMessage)
+
+    def test_files(self, bot: MockedBot):
+        photo = BufferedInputFile(b"test", filename="photo.jpg")
+        method = SendMediaGroup(
+            chat_id=42, media=[InputMediaPhoto(media=photo), InputMediaPhoto(media="file_id")]
+        )
+        files: dict[str, Any] = {}
+
+        result = get_model_serializer(SendMediaGroup)(method, bot, files)
+
+        (key,) = files
+        assert files[key] is photo
+        assert result["media"] == [
+            {"type": "photo", "media": f"attach://{key}"},
+            {"type": "photo", "media": "file_id"},
+        ]
+
+    def test_datetime(self, bot: MockedBot):
+        until_date = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+        method = BanChatMember(chat_id=42, user_id=42, until_date=until_date)
+
+        result = get_model_serializer(BanChatMember)(method, bot, {})
+
+        assert result["until_date"] == str(round(until_date.timestamp()))
+
+    def test_lazy_object(self, bot: MockedBot):
+        update = Update.model_validate(
+            {
+                "update_id": 42,
+                "message": {
+                    "message_id": 42,
+                    "date": 1700000000,
+                    "chat": {"id": 42, "type": "private"},
+                    "entities": [{"type": "bold", "offset": 0, "length": 4}],
+                },
+            },
+            context={LAZY_CONTEXT_KEY: True},
+        )
+        message = update.message
+
+        result = get_model_serializer(type(message))(message, bot, {})
+
+        # Deferred fields are resolved before serialization
+        assert result["entities"] == [{"type": "bold", "offset": 0, "length": 4}]
+
+    def test_custom_serializer_fallback(self, bot: MockedBot):
+        class CustomObject(TelegramObject):
+            value: int
+
+            @field_serializer("value")
+            def serialize_value(self, value: int) -> str:
+                return f"value={value}"
+
+        result = get_model_serializer(CustomObject)(CustomObject(value=42), bot, {})
+
+        assert result == {"value": "value=42"}
+
+
+class TestPrepareValue:
+    @pytest.mark.parametrize(
+        "value,result",
+        [
+            [None, None],
+            ["test", "test"],
+            [42, 42],
+            [True, True],
+            [ParseMode.HTML, "HTML"],
+            [InputMediaType.PHOTO, "photo"],
+            [[1, None, {"foo": None}], [1, {}]],
+            [(1, 2), (1, 2)],
+        ],
+    )
+    def test_prepare_value(self, bot: MockedBot, value: Any, result: Any):
+        assert prepare_value(value, bot, {}) == result
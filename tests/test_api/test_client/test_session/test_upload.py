@@ -0,0 +1,160 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from aiogram import Bot
+from aiogram.client.session.upload import UploadMemoryLimiter, stream_file
+from aiogram.types import BufferedInputFile, InputFile
+from tests.mocked_bot import MockedBot
+
+
+class ClosableInputFile(InputFile):
+    def __init__(self, chunks: list[bytes]) -> None:
+        super().__init__(filename="file.bin", chunk_size=max(map(len, chunks)))
+        self.chunks = chunks
+        self.closed = False
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        try:
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+class TestUploadMemoryLimiter:
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            UploadMemoryLimiter(0)
+
+    async def test_acquire_release(self):
+        limiter = UploadMemoryLimiter(10)
+
+        assert await limiter.acquire(6) == 6
+        assert limiter.used == 6
+
+        task = asyncio.create_task(limiter.acquire(6))
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert limiter.waiting == 1
+
+        limiter.release(6)
+        assert await task == 6
+        assert limiter.used == 6
+        assert limiter.waiting == 0
+
+    async def test_chunk_bigger_than_limit(self):
+        limiter = UploadMemoryLimiter(10)
+
+        assert await limiter.acquire(100) == 10
+        assert limiter.used == 10
+
+    async def test_fifo(self):
+        limiter = UploadMemoryLimiter(10)
+        await limiter.acquire(10)
+        big = asyncio.create_task(limiter.acquire(8))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(limiter.acquire(2))
+        await asyncio.sleep(0)
+
+        limiter.release(5)
+        await asyncio.sleep(0)
+        # Small request doesn't overtake the big one queued before it
+        assert not big.done()
+        assert not small.done()
+
+        limiter.release(5)
+        await asyncio.gather(big, small)
+        assert limiter.used == 10
+
+    async def test_cancelled_waiter(self):
+        limiter = UploadMemoryLimiter(10)
+        await limiter.acquire(5)
+        big = asyncio.create_task(limiter.acquire(10))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(limiter.acquire(5))
+        await asyncio.sleep(0)
+
+        big.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await big
+
+        # Request queued after the cancelled one is not blocked by it
+        assert await small == 5
+        assert limiter.used == 10
+        assert limiter.waiting == 0
+
+
+class TestStreamFile:
+    async def test_stream(self, bot: MockedBot):
+        file = BufferedInputFile(b"0123456789", filename="file.bin", chunk_size=4)
+
+        chunks = [chunk async for chunk in stream_file(file, bot)]
+
+        assert chunks == [b"0123", b"4567", b"89"]
+
+    async def test_progress(self, bot: MockedBot):
+        file = BufferedInputFile(b"0123456789", filename="file.bin", chunk_size=4)
+        calls = []
+
+        async def progress(input_file: InputFile, uploaded: int, total: int | None) -> None:
+            calls.append((input_file, uploaded, total))
+
+        async for _ in stream_file(file, bot, progress=progress):
+            pass
+
+        assert calls == [(file, 4, 10), (file, 8, 10), (file, 10, 10)]
+
+    async def test_memory_limit(self, bot: MockedBot):
+        limiter = UploadMemoryLimiter(8)
+        max_used = 0
+
+        async def upload(file: InputFile) -> bytes:
+            nonlocal max_used
+            data = b""
+            async for chunk in stream_file(file, bot, limiter):
+                max_used = max(max_used, limiter.used)
+                # Slow connection
+                await asyncio.sleep(0)
+                data += chunk
+            return data
+
+        files = [
+            BufferedInputFile(bytes(range(100)), filename=f"{index}.bin", chunk_size=index + 3)
+            for index in range(5)
+        ]
+        results = await asyncio.gather(*(upload(file) for file in files))
+
+        assert results == [bytes(range(100))] * 5
+        assert max_used == 8
+        assert limiter.used == 0
+
+    async def test_wait_for_memory(self, bot: MockedBot):
+        limiter = UploadMemoryLimiter(8)
+        await limiter.acquire(4)
+        stream = stream_file(
+            BufferedInputFile(b"0123456789", filename="file.bin", chunk_size=6), bot, limiter
+        )
+
+        task = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        limiter.release(4)
+        assert await task == b"012345"
+        assert limiter.used == 6
+
+        await stream.aclose()
+        assert limiter.used == 0
+
+    async def test_close_file_reader(self, bot: MockedBot):
+        limiter = UploadMemoryLimiter(100)
+        file = ClosableInputFile([b"foo", b"bar"])
+        stream = stream_file(file, bot, limiter)
+
+        assert await anext(stream) == b"foo"
+        await stream.aclose()
+
+        assert file.closed
+        assert limiter.used == 0
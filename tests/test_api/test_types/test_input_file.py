@@ -1,3 +1,5 @@
+import os
+
 from aresponses import ResponsesMockServer
 
 from aiogram import Bot
@@ -15,6 +17,11 @@ class TestInputFile:
         assert file.filename.endswith(".py")
         assert file.chunk_size > 0
 
+    def test_fs_input_file_size(self):
+        file = FSInputFile(__file__)
+
+        assert file.size == os.path.getsize(__file__)
+
     async def test_fs_input_file_readable(self, bot: MockedBot):
         file = FSInputFile(__file__, chunk_size=1)
 
@@ -34,6 +41,9 @@ class TestInputFile:
         assert file.filename == "file.bin"
         assert isinstance(file.data, bytes)
 
+    def test_buffered_input_file_size(self):
+        assert BufferedInputFile(b"\f" * 10, filename="file.bin").size == 10
+
     async def test_buffered_input_file_readable(self, bot: MockedBot):
         file = BufferedInputFile(b"\f" * 10, filename="file.bin", chunk_size=1)
 
@@ -73,6 +83,7 @@ class TestInputFile:
         )
         async with Bot(token="42:TEST").context() as bot:
             file = URLInputFile("https://test.org/", chunk_size=1)
+            assert file.size is None
 
             size = 0
             async for chunk in file.read(bot):
@@ -0,0 +1,252 @@
+import pickle
+
+import pytest
+
+from aiogram.types import CallbackQuery, Message, MessageEntity, Update, User
+from aiogram.types.base import DEFERRED_FIELDS_KEY, LAZY_CONTEXT_KEY
+from tests.mocked_bot import MockedBot
+
+RAW_UPDATE = {
+    "update_id": 42,
+    "message": {
+        "message_id": 42,
+        "date": 1700000000,
+        "text": "test",
+        "chat": {"id": -42, "type": "supergroup", "title": "Test"},
+        "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+        "entities": [{"type": "bold", "offset": 0, "length": 4}],
+        "reply_to_message": {
+            "message_id": 41,
+            "date": 1700000000,
+            "text": "reply",
+            "chat": {"id": -42, "type": "supergroup", "title": "Test"},
+        },
+    },
+}
+
+RAW_POLL_UPDATE = {
+    "update_id": 43,
+    "poll": {
+        "id": "42",
+        "question": "test",
+        "options": [
+            {
+                "persistent_id": "1",
+                "text": "first",
+                "voter_count": 0,
+                "text_entities": [{"type": "bold", "offset": 0, "length": 5}],
+            },
+            {"persistent_id": "2", "text": "second", "voter_count": 1},
+        ],
+        "total_voter_count": 1,
+        "is_closed": False,
+        "is_anonymous": True,
+        "type": "regular",
+        "allows_multiple_answers": False,
+        "allows_revoting": False,
+        "members_only": False,
+    },
+}
+RAW_PHOTO_UPDATE = {
+    "update_id": 44,
+    "message": {
+        "message_id": 42,
+        "date": 1700000000,
+        "chat": {"id": 42, "type": "private"},
+        "photo": [
+            {"file_id": "small", "file_unique_id": "small", "width": 90, "height": 90},
+            {"file_id": "big", "file_unique_id": "big", "width": 800, "height": 800},
+        ],
+        "caption": "test",
+        "caption_entities": [
+            {
+                "type": "text_mention",
+                "offset": 0,
+                "length": 4,
+                "user": {"id": 42, "is_bot": False, "first_name": "Test"},
+            },
+        ],
+        "reply_to_message": {
+            "message_id": 41,
+            "date": 1700000000,
+            "chat": {"id": 42, "type": "private"},
+            "text": "reply",
+            "entities": [
+                {
+                    "type": "text_mention",
+                    "offset": 0,
+                    "length": 5,
+                    "user": {"id": 43, "is_bot": False, "first_name": "Other"},
+                },
+            ],
+        },
+    },
+}
+
+
+def validate_lazy(raw: dict, bot: MockedBot | None = None) -> Update:
+    return Update.model_validate(raw, context={"bot": bot, LAZY_CONTEXT_KEY: True})
+
+
+class TestTelegramObjectLazyValidation:
+    def test_event_is_validated_eagerly(self):
+        update = validate_lazy(RAW_UPDATE)
+
+        assert DEFERRED_FIELDS_KEY not in update.__pydantic_private__
+        assert isinstance(update.__dict__["message"], Message)
+
+    def test_nested_objects_are_deferred(self):
+        message = validate_lazy(RAW_UPDATE).message
+
+        assert set(message.__pydantic_private__[DEFERRED_FIELDS_KEY]) == {
+            "from_user",
+            "entities",
+            "reply_to_message",
+        }
+        assert "reply_to_message" not in message.__dict__
+        # Required nested objects can't be deferred
+        assert message.__dict__["chat"].id == -42
+
+    def test_deferred_field_access(self, bot: MockedBot):
+        message = validate_lazy(RAW_UPDATE, bot=bot).message
+
+        assert message.text == "test"
+        assert isinstance(message.from_user, User)
+        assert message.from_user.id == 42
+        assert message.from_user.bot is bot
+        assert "from_user" in message.model_fields_set
+        assert set(message.__pydantic_private__[DEFERRED_FIELDS_KEY]) == {
+            "entities",
+            "reply_to_message",
+        }
+
+        reply = message.reply_to_message
+        assert isinstance(reply, Message)
+        assert reply is message.reply_to_message
+        assert reply.text == "reply"
+        assert reply.bot is bot
+        # Deferred objects are validated eagerly
+        assert DEFERRED_FIELDS_KEY not in reply.__pydantic_private__
+
+    def test_missing_fields(self):
+        message = validate_lazy(RAW_UPDATE).message
+
+        assert message.caption is None
+        assert message.quote is None
+        assert message.external_reply is None
+
+    def test_dump(self):
+        lazy_update = validate_lazy(RAW_UPDATE)
+        update = Update.model_validate(RAW_UPDATE)
+
+        assert lazy_update.model_dump() == update.model_dump()
+        assert lazy_update.model_dump_json() == update.model_dump_json()
+        # All deferred fields are resolved by the serialization
+        assert DEFERRED_FIELDS_KEY not in lazy_update.message.__pydantic_private__
+        assert lazy_update == update
+
+    def test_copy(self):
+        message = validate_lazy(RAW_UPDATE).message
+        copied = message.model_copy()
+
+        assert message.reply_to_message.message_id == 41
+        assert DEFERRED_FIELDS_KEY in copied.__pydantic_private__
+        assert copied.reply_to_message.message_id == 41
+        assert pickle.loads(pickle.dumps(message)).entities == message.entities
+
+    def test_union_field(self):
+        callback_query = CallbackQuery.model_validate(
+            {
+                "id": "42",
+                "chat_instance": "42",
+                "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+                "message": {
+                    "message_id": 42,
+                    "date": 1700000000,
+                    "chat": {"id": 42, "type": "private"},
+                },
+            },
+            context={LAZY_CONTEXT_KEY: True},
+        )
+
+        assert "message" not in callback_query.__dict__
+        assert isinstance(callback_query.message, Message)
+        assert callback_query.message.message_id == 42
+
+    def test_unknown_attribute(self):
+        message = validate_lazy(RAW_UPDATE).message
+
+        with pytest.raises(AttributeError):
+            message.unknown_field  # noqa: B018
+
+    @pytest.mark.parametrize("raw", [RAW_UPDATE, RAW_POLL_UPDATE, RAW_PHOTO_UPDATE])
+    def test_nested_lists_dump(self, raw: dict):
+        lazy_update = validate_lazy(raw)
+        update = Update.model_validate(raw)
+
+        assert lazy_update.model_dump() == update.model_dump()
+        assert lazy_update.model_dump_json() == update.model_dump_json()
+        assert lazy_update.model_dump(exclude_unset=True) == update.model_dump(exclude_unset=True)
+
+    @pytest.mark.parametrize("raw", [RAW_UPDATE, RAW_POLL_UPDATE, RAW_PHOTO_UPDATE])
+    def test_equality(self, raw: dict):
+        update = Update.model_validate(raw)
+
+        # Objects are compared before any field is accessed
+        assert validate_lazy(raw) == update
+        assert update == validate_lazy(raw)
+        assert validate_lazy(raw).event == update.event
+        assert repr(validate_lazy(raw)) == repr(update)
+        assert str(validate_lazy(raw)) == str(update)
+
+    def test_equality_without_resolving(self):
+        first = validate_lazy(RAW_UPDATE).message
+        second = validate_lazy(RAW_UPDATE).message
+
+        # The same raw values are not validated to be compared
+        assert first == second
+        assert DEFERRED_FIELDS_KEY in first.__pydantic_private__
+        assert "reply_to_message" not in second.__dict__
+
+    def test_inequality(self):
+        raw = {
+            **RAW_UPDATE,
+            "message": {**RAW_UPDATE["message"], "reply_to_message": None},
+        }
+        other_raw = {
+            **RAW_UPDATE,
+            "message": {**RAW_UPDATE["message"], "from": {**RAW_UPDATE["message"]["from"]}},
+        }
+        other_raw["message"]["from"]["first_name"] = "Other"
+        lazy_message = validate_lazy(RAW_UPDATE).message
+
+        assert lazy_message != Update.model_validate(raw).message
+        assert lazy_message != validate_lazy(other_raw).message
+        assert validate_lazy(other_raw).message != Update.model_validate(RAW_UPDATE).message
+        # Deferred value is never equal to the missing one
+        assert "reply_to_message" not in lazy_message.__dict__
+
+    def test_nested_list_items_equality(self):
+        lazy_update = validate_lazy(RAW_POLL_UPDATE)
+        update = Update.model_validate(RAW_POLL_UPDATE)
+
+        assert lazy_update.poll.options == update.poll.options
+        assert lazy_update.poll.options[0].text_entities[0].type == "bold"
+
+    def test_hash(self):
+        raw = RAW_PHOTO_UPDATE["message"]["caption_entities"][0]
+        entity = MessageEntity.model_validate(raw, context={LAZY_CONTEXT_KEY: True})
+        eager_entity = MessageEntity.model_validate(raw)
+
+        assert DEFERRED_FIELDS_KEY in entity.__pydantic_private__
+        assert hash(entity) == hash(eager_entity)
+        assert entity in {eager_entity}
+
+    def test_resolve_deferred_fields_of_list_items(self):
+        message = validate_lazy(RAW_PHOTO_UPDATE).message
+        message.resolve_deferred_fields()
+
+        (entity,) = message.__dict__["caption_entities"]
+        assert entity.__dict__["user"].id == 42
+        reply = message.__dict__["reply_to_message"]
+        assert reply.__dict__["entities"][0].__dict__["user"].id == 43
@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+import json
 import signal
 import time
 import warnings
@@ -14,6 +15,10 @@ import pytest
 from aiogram import Bot
 from aiogram.dispatcher.dispatcher import Dispatcher
 from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler
+from aiogram.dispatcher.offset.base import OffsetTracker
+from aiogram.dispatcher.offset.memory import MemoryOffsetStorage
+from aiogram.dispatcher.prefetch import PollingMetrics
+from aiogram.dispatcher.raw import GetRawUpdates, RawUpdate
 from aiogram.dispatcher.router import Router
 from aiogram.methods import GetMe, GetUpdates, SendMessage, TelegramMethod
 from aiogram.types import (
@@ -48,7 +53,7 @@ from aiogram.types import (
     User,
 )
 from aiogram.types.error_event import ErrorEvent
-from tests.mocked_bot import MockedBot
+from tests.mocked_bot import MockedBot, MockedSession
 
 
 async def simple_message_handler(message: Message):
@@ -163,6 +168,69 @@ class TestDispatcher:
         )
         assert result == "test"
 
+    @pytest.mark.parametrize("as_bytes", [True, False])
+    @pytest.mark.parametrize("custom_json_loads", [True, False])
+    async def test_feed_raw_update_json(self, as_bytes: bool, custom_json_loads: bool):
+        dp = Dispatcher()
+        bot = Bot("42:TEST", session=MockedSession())
+        if custom_json_loads:
+            # Any loader except the json.loads itself is treated as a custom one
+            bot.session.json_loads = lambda value: json.loads(value)  # noqa: PLW0108
+
+        @dp.message()
+        async def my_handler(message: Message):
+            assert message.bot is bot
+            return message.text
+
+        update = json.dumps(
+            {
+                "update_id": 42,
+                "message": {
+                    "message_id": 42,
+                    "date": int(time.time()),
+                    "text": "test",
+                    "chat": {"id": 42, "type": "private"},
+                    "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+                },
+            }
+        )
+        if as_bytes:
+            update = update.encode()
+
+        assert bot.session.uses_default_json_loads is not custom_json_loads
+        assert await dp.feed_raw_update(bot=bot, update=update) == "test"
+
+    async def test_feed_raw_update_lazy(self):
+        dp = Dispatcher(lazy_updates=True)
+        bot = Bot("42:TEST", session=MockedSession())
+
+        @dp.message()
+        async def my_handler(message: Message):
+            assert "reply_to_message" not in message.__dict__
+            assert message.reply_to_message.text == "reply"
+            assert message.reply_to_message.bot is bot
+            return message.text
+
+        update = {
+            "update_id": 42,
+            "message": {
+                "message_id": 42,
+                "date": int(time.time()),
+                "text": "test",
+                "chat": {"id": 42, "type": "private"},
+                "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+                "reply_to_message": {
+                    "message_id": 41,
+                    "date": int(time.time()),
+                    "text": "reply",
+                    "chat": {"id": 42, "type": "private"},
+                },
+            },
+        }
+
+        assert await dp.feed_raw_update(bot=bot, update=update) == "test"
+        assert await dp.feed_raw_update(bot=bot, update=json.dumps(update).encode()) == "test"
+
     async def test_listen_updates(self, bot: MockedBot):
         dispatcher = Dispatcher()
         bot.add_result_for(
@@ -176,6 +244,52 @@ class TestDispatcher:
                 break
         assert index == 42
 
+    async def test_listen_updates_limit_and_metrics(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        metrics = PollingMetrics()
+        bot.add_result_for(
+            GetUpdates, ok=True, result=[Update(update_id=update_id) for update_id in range(5)]
+        )
+
+        async for update in dispatcher._listen_updates(bot=bot, limit=5, metrics=metrics):
+            if update.update_id == 4:
+                break
+
+        request = bot.get_request()
+        assert isinstance(request, GetUpdates)
+        assert request.limit == 5
+        assert metrics.fetches == 1
+        assert metrics.fetched_updates == 5
+
+    async def test_listen_updates_with_offset_tracker(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        storage = MemoryOffsetStorage()
+        await storage.set_offset(bot.id, 10)
+        tracker = OffsetTracker(storage, bot_id=bot.id)
+        # Responses are returned in reverse order
+        bot.add_result_for(GetUpdates, ok=True, result=[Update(update_id=12)])
+        bot.add_result_for(
+            GetUpdates, ok=True, result=[Update(update_id=update_id) for update_id in (10, 11)]
+        )
+
+        listen = dispatcher._listen_updates(bot=bot, offset_tracker=tracker)
+        assert (await anext(listen)).update_id == 10
+        assert bot.get_request().offset == 10
+        assert (await anext(listen)).update_id == 11
+        assert tracker.pending == 2
+
+        # The next request is not sent until all fetched updates are processed
+        next_update = asyncio.create_task(anext(listen))
+        await asyncio.sleep(0)
+        assert not next_update.done()
+
+        tracker.complete()
+        tracker.complete()
+        assert (await next_update).update_id == 12
+        assert bot.get_request().offset == 12
+        assert await storage.get_offset(bot.id) == 12
+        await listen.aclose()
+
     async def test_listen_update_with_error(self, bot: MockedBot):
         dispatcher = Dispatcher()
         listen = dispatcher._listen_updates(bot=bot)
@@ -841,6 +955,158 @@ class TestDispatcher:
             else:
                 mocked_process_update.assert_awaited()
 
+    async def test_polling_with_prefetch(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+
+        async def _mock_updates(*_, **__):
+            for update_id in range(5):
+                yield Update(update_id=update_id)
+
+        with (
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._process_update", new_callable=AsyncMock
+            ) as mocked_process_update,
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates"
+            ) as patched_listen_updates,
+        ):
+            patched_listen_updates.side_effect = _mock_updates
+            await dispatcher._polling(
+                bot=bot,
+                handle_as_tasks=False,
+                polling_limit=10,
+                prefetch_size=2,
+            )
+
+        assert patched_listen_updates.call_args.kwargs["limit"] == 10
+        metrics = patched_listen_updates.call_args.kwargs["metrics"]
+        assert dispatcher.polling_metrics[bot.id] is metrics
+        assert metrics.pending == 0
+        assert [
+            call.kwargs["update"].update_id for call in mocked_process_update.call_args_list
+        ] == list(range(5))
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    async def test_stop_polling_with_prefetched_updates(
+        self,
+        bot: MockedBot,
+        workers: int | None,
+    ):
+        dispatcher = Dispatcher()
+        started = asyncio.Event()
+        processed = []
+        confirmed = []
+
+        async def mock_process_update(*args, update: Update, **kwargs):
+            processed.append(update.update_id)
+            started.set()
+            if update.update_id == 0:
+                await asyncio.sleep(0.01)
+            return True
+
+        async def _mock_updates(*_, **__):
+            for update_id in range(5):
+                yield Update(update_id=update_id)
+                # The offset of the next getUpdates request confirms this update
+                confirmed.append(update_id)
+            await asyncio.Event().wait()
+
+        with (
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._process_update",
+                side_effect=mock_process_update,
+            ),
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates",
+                side_effect=_mock_updates,
+            ),
+        ):
+            task = asyncio.create_task(
+                dispatcher._polling(
+                    bot=bot,
+                    handle_as_tasks=workers is not None,
+                    workers=workers,
+                    workers_queue_size=1,
+                    prefetch_size=2,
+                )
+            )
+            await started.wait()
+            await asyncio.sleep(0)
+            assert dispatcher.polling_metrics[bot.id].pending
+            assert set(confirmed) - set(processed)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # Confirmed but not dispatched updates are dispatched before the stop
+        assert set(confirmed) <= set(processed)
+        assert dispatcher.polling_metrics[bot.id].pending == 0
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    async def test_polling_with_offset_storage(self, bot: MockedBot, workers: int | None):
+        dispatcher = Dispatcher()
+        storage = MemoryOffsetStorage()
+        processed = []
+
+        async def _process_update(*_, update: Update, **__):
+            await asyncio.sleep(0)
+            processed.append(update.update_id)
+            return True
+
+        async def _mock_updates(*_, offset_tracker: OffsetTracker, **__):
+            for update_id in range(5):
+                offset_tracker.begin(update_id)
+                yield Update(update_id=update_id)
+
+        with (
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._process_update",
+                side_effect=_process_update,
+            ),
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates",
+                side_effect=_mock_updates,
+            ),
+        ):
+            await dispatcher._polling(bot=bot, workers=workers, offset_storage=storage)
+            # Tasks are not awaited by the polling
+            await asyncio.gather(*dispatcher._handle_update_tasks)
+
+        assert sorted(processed) == list(range(5))
+        if workers:
+            assert await storage.get_offset(bot.id) == 5
+
+    async def test_polling_lazy_updates(self, bot: MockedBot):
+        dispatcher = Dispatcher(lazy_updates=True)
+
+        async def _mock_updates(*_, **__):
+            yield RawUpdate(
+                update_id=42,
+                message={
+                    "message_id": 42,
+                    "date": int(time.time()),
+                    "chat": {"id": 42, "type": "private"},
+                    "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+                },
+            )
+
+        with (
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._process_update", new_callable=AsyncMock
+            ) as mocked_process_update,
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates"
+            ) as patched_listen_updates,
+        ):
+            patched_listen_updates.side_effect = _mock_updates
+            await dispatcher._polling(bot=bot, handle_as_tasks=False)
+
+        assert patched_listen_updates.call_args.kwargs["get_updates_type"] is GetRawUpdates
+        update = mocked_process_update.call_args.kwargs["update"]
+        assert isinstance(update, Update)
+        assert "from_user" not in update.message.__dict__
+        assert update.message.from_user.id == 42
+
     @pytest.mark.parametrize(
         "handle_as_tasks,tasks_concurrency_limit,should_create_semaphore",
         [
@@ -892,6 +1158,39 @@ class TestDispatcher:
             else:
                 mocked_semaphore.assert_not_called()
 
+    async def test_polling_with_workers(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        processed = []
+
+        async def mock_process_update(*args, update: Update, **kwargs):
+            processed.append(update.update_id)
+            return True
+
+        async def _mock_updates(*_):
+            for i in range(5):
+                yield Update(update_id=i)
+
+        with (
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._process_update",
+                side_effect=mock_process_update,
+            ),
+            patch(
+                "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates"
+            ) as patched_listen_updates,
+            patch("asyncio.Semaphore") as mocked_semaphore,
+        ):
+            patched_listen_updates.return_value = _mock_updates()
+            await dispatcher._polling(
+                bot=bot,
+                handle_as_tasks=True,
+                tasks_concurrency_limit=10,
+                workers=2,
+            )
+            mocked_semaphore.assert_not_called()
+
+        assert sorted(processed) == [0, 1, 2, 3, 4]
+
     async def test_process_with_semaphore(self):
         """Test that _process_with_semaphore correctly processes updates and releases the semaphore"""
         dispatcher = Dispatcher()
@@ -1052,6 +1351,16 @@ class TestDispatcher:
             "the bot instance should be passed as positional argument",
         ):
             await dispatcher.start_polling(bot, bot=bot)
+        with pytest.raises(
+            ValueError, match="Workers can be used only when handle_as_tasks is True"
+        ):
+            await dispatcher.start_polling(bot, workers=2, handle_as_tasks=False)
+        with pytest.raises(
+            ValueError, match="prefetch_size can't be combined with offset_storage"
+        ):
+            await dispatcher.start_polling(
+                bot, prefetch_size=10, offset_storage=MemoryOffsetStorage()
+            )
 
         bot.add_result_for(
             GetMe, ok=True, result=User(id=42, is_bot=True, first_name="The bot", username="tbot")
@@ -1180,6 +1489,46 @@ class TestDispatcher:
 
         assert start_called
 
+    def test_run_polling_with_processes(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        with patch(
+            "aiogram.dispatcher.multiprocess.MultiProcessPolling.run",
+            autospec=True,
+        ) as patched_run:
+            dispatcher.run_polling(bot, processes=2, workers=3, workers_queue_size=5, foo=42)
+
+        polling = patched_run.call_args.args[0]
+        assert polling.bots == (bot,)
+        assert polling.processes == 2
+        assert polling.workers == 3
+        assert polling.queue_size == 5
+        assert polling.workflow_data == {"foo": 42}
+
+    @pytest.mark.parametrize(
+        "kwargs,names",
+        [
+            ({"handle_as_tasks": False}, "handle_as_tasks"),
+            ({"handle_signals": False}, "handle_signals"),
+            ({"close_bot_session": False}, "close_bot_session"),
+            ({"tasks_concurrency_limit": 10}, "tasks_concurrency_limit"),
+            ({"polling_limit": 10, "prefetch_size": 10}, "polling_limit, prefetch_size"),
+            ({"offset_storage": MemoryOffsetStorage()}, "offset_storage"),
+        ],
+    )
+    def test_run_polling_with_processes_unsupported_arguments(
+        self,
+        bot: MockedBot,
+        kwargs: dict[str, Any],
+        names: str,
+    ):
+        dispatcher = Dispatcher()
+        with (
+            patch("aiogram.dispatcher.multiprocess.MultiProcessPolling.run") as patched_run,
+            pytest.raises(ValueError, match=f"Arguments {names} are not supported with processes"),
+        ):
+            dispatcher.run_polling(bot, processes=2, **kwargs)
+        patched_run.assert_not_called()
+
     async def test_feed_webhook_update_fast_process(self, bot: MockedBot):
         dispatcher = Dispatcher()
         dispatcher.message.register(simple_message_handler)
@@ -235,3 +235,29 @@ class TestTelegramEventObserver:
         r2.message.register(handler)
 
         assert await r1.message.trigger(None) is UNHANDLED
+
+    async def test_middleware_chain_is_cached(self):
+        router = Router()
+        router.message.register(my_handler)
+        handler = router.message.handlers[0]
+
+        chain = router.message._resolve_middleware_chain(handler)
+        assert router.message._resolve_middleware_chain(handler) is chain
+
+        router.message.register(my_handler)
+        assert router.message._resolve_middleware_chain(handler) is not chain
+
+    async def test_trigger_chain_is_cached(self):
+        router = Router()
+        router.message.register(my_handler)
+
+        chain = router.message._resolve_trigger_chain()
+        assert router.message._resolve_trigger_chain() is chain
+        assert await chain(42, {}) == 42
+
+        @router.message.outer_middleware()
+        async def outer_middleware(h, event, data):
+            return await h(event + 1, data)
+
+        chain = router.message._resolve_trigger_chain()
+        assert await chain(42, {}) == 43
@@ -0,0 +1,167 @@
+import json
+import queue
+from collections import Counter
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from aiogram import Dispatcher
+from aiogram.dispatcher.multiprocess import (
+    MultiProcessPolling,
+    WorkerHealth,
+    resolve_process_index,
+    resolve_raw_update_key,
+    run_worker,
+)
+from aiogram.dispatcher.raw import GetRawUpdates, RawUpdate
+from aiogram.types import Message
+from tests.mocked_bot import MockedBot
+
+RAW_MESSAGE = {
+    "message_id": 42,
+    "date": 1700000000,
+    "chat": {"id": -100, "type": "group", "title": "Test"},
+    "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+    "text": "test",
+}
+
+
+class TestResolveRawUpdateKey:
+    @pytest.mark.parametrize(
+        "update,key",
+        [
+            ({"update_id": 1, "message": RAW_MESSAGE}, -100),
+            (
+                {
+                    "update_id": 1,
+                    "callback_query": {
+                        "id": "1",
+                        "from": {"id": 42},
+                        "message": RAW_MESSAGE,
+                        "chat_instance": "1",
+                    },
+                },
+                -100,
+            ),
+            (
+                {
+                    "update_id": 1,
+                    "callback_query": {"id": "1", "from": {"id": 42}, "chat_instance": "1"},
+                },
+                42,
+            ),
+            ({"update_id": 1, "poll_answer": {"voter_chat": {"id": -200}, "user": None}}, -200),
+            ({"update_id": 1, "business_connection": {"user": {"id": 42}}}, 42),
+            ({"update_id": 1, "poll": {"id": "poll"}}, 1),
+            ({"update_id": 1}, 1),
+        ],
+    )
+    def test_resolve(self, update: dict[str, Any], key: int):
+        assert resolve_raw_update_key(update) == key
+
+
+class TestResolveProcessIndex:
+    def test_distribution(self):
+        keys = range(-5000, 5000)
+        counts = Counter(resolve_process_index(key, 4) for key in keys)
+        assert sorted(counts) == [0, 1, 2, 3]
+        assert min(counts.values()) > len(keys) / 4 * 0.9
+
+    def test_added_process(self):
+        keys = range(-5000, 5000)
+        for key in keys:
+            index = resolve_process_index(key, 4)
+            assert 0 <= index < 4
+            # Keys are moved only to the added process
+            assert resolve_process_index(key, 5) in {index, 4}
+            # Keys of the other processes are not moved when the last one is removed
+            if index != 3:
+                assert resolve_process_index(key, 3) == index
+
+
+class TestRunWorker:
+    async def test_process_updates(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        received = []
+
+        @dispatcher.message()
+        async def handler(message: Message, bot: MockedBot, test: str):
+            received.append((message.chat.id, message.text, test))
+
+        updates_queue = queue.Queue()
+        health_queue = queue.Queue()
+        updates_queue.put((0, {"update_id": 1, "message": RAW_MESSAGE}))
+        updates_queue.put(None)
+
+        await run_worker(
+            index=3,
+            dispatcher=dispatcher,
+            bots=(bot,),
+            updates_queue=updates_queue,
+            health_queue=health_queue,
+            workers=2,
+            health_interval=0.1,
+            workflow_data={"test": "PASS"},
+        )
+
+        assert received == [(-100, "test", "PASS")]
+
+        reports = []
+        while not health_queue.empty():
+            reports.append(health_queue.get())
+        assert all(isinstance(report, WorkerHealth) for report in reports)
+        assert reports[-1].index == 3
+        assert reports[-1].processed == 1
+        assert reports[-1].pending == 0
+
+
+class TestMultiProcessPolling:
+    @pytest.mark.parametrize(
+        "bots,processes,message",
+        [
+            (1, 0, "Processes count should be greater than 0"),
+            (0, 1, "At least one bot instance is required"),
+        ],
+    )
+    def test_invalid_params(self, bots: int, processes: int, message: str):
+        with pytest.raises(ValueError, match=message):
+            MultiProcessPolling(
+                Dispatcher(),
+                *(MockedBot() for _ in range(bots)),
+                processes=processes,
+            )
+
+    async def test_fetch_shards_updates(self, bot: MockedBot):
+        polling = MultiProcessPolling(Dispatcher(), bot, processes=3)
+        polling._queues = [queue.Queue() for _ in range(3)]
+
+        async def _mock_updates(*_, **kwargs):
+            assert kwargs["get_updates_type"] is GetRawUpdates
+            for update_id, chat_id in enumerate((1, 2, 3, 4, 1)):
+                yield RawUpdate(
+                    update_id=update_id,
+                    message={**RAW_MESSAGE, "chat": {"id": chat_id, "type": "private"}},
+                )
+
+        with patch(
+            "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates"
+        ) as patched_listen_updates:
+            patched_listen_updates.side_effect = _mock_updates
+            await polling._fetch(bot_index=0, bot=bot)
+
+        shards = [
+            [item[1]["update_id"] for item in list(shard.queue)] for shard in polling._queues
+        ]
+        expected = [[], [], []]
+        for update_id, chat_id in enumerate((1, 2, 3, 4, 1)):
+            expected[resolve_process_index(chat_id, 3)].append(update_id)
+        assert shards == expected
+        # Updates of the same chat are sent to the same process in order
+        assert [0, 4] in [[i for i in shard if i in {0, 4}] for shard in shards]
+
+    def test_health(self, bot: MockedBot):
+        polling = MultiProcessPolling(Dispatcher(), bot, processes=1)
+        report = WorkerHealth(index=0, pid=1, processed=1, pending=0, timestamp=0)
+        polling._health[0] = report
+        assert polling.health == {0: report}
@@ -0,0 +1,145 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.dispatcher.offset.base import OffsetTracker
+from aiogram.dispatcher.offset.file import FileOffsetStorage
+from aiogram.dispatcher.offset.memory import MemoryOffsetStorage
+from aiogram.dispatcher.offset.redis import RedisOffsetStorage
+from aiogram.fsm.storage.redis import RedisStorage
+
+
+class TestMemoryOffsetStorage:
+    async def test_get_set(self):
+        storage = MemoryOffsetStorage()
+        assert await storage.get_offset(42) is None
+
+        await storage.set_offset(42, 100)
+        assert await storage.get_offset(42) == 100
+        assert await storage.get_offset(43) is None
+        await storage.close()
+
+
+class TestFileOffsetStorage:
+    async def test_get_set(self, tmp_path):
+        path = tmp_path / "offsets.json"
+        storage = FileOffsetStorage(path)
+        assert await storage.get_offset(42) is None
+        assert not path.exists()
+
+        await storage.set_offset(42, 100)
+        await storage.set_offset(43, 200)
+        assert await storage.get_offset(42) == 100
+        assert json.loads(path.read_text()) == {"42": 100, "43": 200}
+        assert not path.with_name("offsets.json.tmp").exists()
+
+        # Offsets are persisted across instances
+        assert await FileOffsetStorage(path).get_offset(43) == 200
+
+
+class TestRedisOffsetStorage:
+    def test_from_url(self):
+        with patch("redis.asyncio.connection.ConnectionPool.from_url") as mock_pool:
+            storage = RedisOffsetStorage.from_url("redis://localhost:6379/0")
+            assert isinstance(storage, RedisOffsetStorage)
+            assert storage.close_connection
+            mock_pool.assert_called_once_with("redis://localhost:6379/0")
+
+    async def test_from_storage(self):
+        redis_mock = AsyncMock()
+        storage = RedisOffsetStorage.from_storage(RedisStorage(redis=redis_mock))
+        assert storage.redis is redis_mock
+
+        # The connection is owned by the FSM storage
+        await storage.close()
+        redis_mock.aclose.assert_not_called()
+
+    async def test_close(self):
+        redis_mock = AsyncMock()
+        await RedisOffsetStorage(redis=redis_mock).close()
+        redis_mock.aclose.assert_called_once_with(close_connection_pool=True)
+
+    @pytest.mark.parametrize("value,offset", [(None, None), (b"100", 100), ("100", 100)])
+    async def test_get_offset(self, value, offset):
+        redis_mock = AsyncMock()
+        redis_mock.get.return_value = value
+        storage = RedisOffsetStorage(redis=redis_mock, prefix="test")
+
+        assert await storage.get_offset(42) == offset
+        redis_mock.get.assert_called_once_with("test:42:offset")
+
+    async def test_set_offset(self):
+        redis_mock = AsyncMock()
+        storage = RedisOffsetStorage(redis=redis_mock)
+
+        await storage.set_offset(42, 100)
+        redis_mock.set.assert_called_once_with("polling:42:offset", 100)
+
+
+class TestOffsetTracker:
+    async def test_load(self):
+        storage = MemoryOffsetStorage()
+        await storage.set_offset(42, 100)
+        tracker = OffsetTracker(storage, bot_id=42)
+
+        assert await tracker.load() == 100
+        assert tracker.committed_offset == 100
+
+    async def test_commit_after_processing(self):
+        storage = MemoryOffsetStorage()
+        tracker = OffsetTracker(storage, bot_id=42)
+        await tracker.load()
+
+        tracker.begin(1)
+        tracker.begin(2)
+        assert tracker.pending == 2
+
+        tracker.complete()
+        await tracker.commit()
+        assert await storage.get_offset(42) is None
+
+        tracker.complete()
+        await tracker.commit()
+        assert await storage.get_offset(42) == 3
+        assert tracker.committed_offset == 3
+
+    async def test_commit_not_changed(self):
+        storage = AsyncMock()
+        storage.get_offset.return_value = None
+        tracker = OffsetTracker(storage, bot_id=42)
+
+        await tracker.commit()
+        storage.set_offset.assert_not_called()
+
+        tracker.begin(1)
+        tracker.complete()
+        await tracker.commit()
+        await tracker.commit()
+        storage.set_offset.assert_called_once_with(42, 2)
+
+    async def test_track(self):
+        tracker = OffsetTracker(MemoryOffsetStorage(), bot_id=42)
+
+        async def fail():
+            raise RuntimeError("Kaboom")
+
+        tracker.begin(1)
+        with pytest.raises(RuntimeError, match="Kaboom"):
+            await tracker.track(fail())
+        # Failed update is also processed
+        assert tracker.pending == 0
+
+    async def test_wait_and_commit(self):
+        storage = MemoryOffsetStorage()
+        tracker = OffsetTracker(storage, bot_id=42)
+        tracker.begin(1)
+
+        waiter = asyncio.create_task(tracker.wait_and_commit())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        tracker.complete()
+        await waiter
+        assert await storage.get_offset(42) == 2
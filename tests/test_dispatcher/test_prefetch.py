@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from aiogram.dispatcher.prefetch import PollingMetrics, UpdatesPrefetcher
+from aiogram.types import Update
+
+
+async def make_source(count: int, fetched: list[int], error: Exception | None = None):
+    for update_id in range(count):
+        fetched.append(update_id)
+        yield Update(update_id=update_id)
+    if error:
+        raise error
+
+
+class TestPollingMetrics:
+    def test_fetch(self):
+        metrics = PollingMetrics()
+        assert metrics.avg_fetch_latency == 0.0
+
+        metrics.observe_fetch(0.5, updates=10)
+        metrics.observe_fetch(1.5, updates=5)
+
+        assert metrics.fetches == 2
+        assert metrics.fetched_updates == 15
+        assert metrics.last_fetch_latency == 1.5
+        assert metrics.avg_fetch_latency == 1.0
+
+    def test_processing_lag(self):
+        metrics = PollingMetrics()
+        metrics.observe_processing_lag(2.0)
+        metrics.observe_processing_lag(1.0)
+
+        assert metrics.last_processing_lag == 1.0
+        assert metrics.max_processing_lag == 2.0
+
+
+class TestUpdatesPrefetcher:
+    def test_invalid_queue_size(self):
+        with pytest.raises(ValueError, match="Queue size should be greater than 0"):
+            UpdatesPrefetcher(make_source(1, []), queue_size=0)
+
+    async def test_iterate(self):
+        fetched: list[int] = []
+        prefetcher = UpdatesPrefetcher(make_source(10, fetched), queue_size=3)
+
+        received = [update.update_id async for update in prefetcher]
+
+        assert received == list(range(10))
+        assert prefetcher.metrics.pending == 0
+        assert prefetcher.metrics.max_processing_lag >= 0
+
+    async def test_prefetch_while_dispatching(self):
+        fetched: list[int] = []
+        prefetcher = UpdatesPrefetcher(make_source(10, fetched), queue_size=3)
+
+        async for update in prefetcher:
+            assert update.update_id == 0
+            # Let the background task to fetch next updates
+            for _ in range(10):
+                await asyncio.sleep(0)
+            break
+
+        # One update is dispatched, the queue is full and one more update
+        # is read from the source and waits for a free slot
+        assert fetched == [0, 1, 2, 3, 4]
+
+    async def test_propagate_error(self):
+        fetched: list[int] = []
+        prefetcher = UpdatesPrefetcher(
+            make_source(2, fetched, error=RuntimeError("Kaboom")),
+            queue_size=10,
+        )
+        received = []
+
+        with pytest.raises(RuntimeError, match="Kaboom"):
+            async for update in prefetcher:
+                received.append(update.update_id)  # noqa: PERF401
+
+        # All prefetched updates are dispatched before the error
+        assert received == [0, 1]
+
+    async def test_start_twice(self):
+        prefetcher = UpdatesPrefetcher(make_source(10, []), queue_size=3)
+        iterator = aiter(prefetcher)
+        await anext(iterator)
+
+        with pytest.raises(RuntimeError, match="Prefetcher is already started"):
+            await anext(aiter(prefetcher))
+
+        await iterator.aclose()
+
+    async def test_close(self):
+        fetched: list[int] = []
+        prefetcher = UpdatesPrefetcher(make_source(100, fetched), queue_size=3)
+        iterator = aiter(prefetcher)
+        await anext(iterator)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        await prefetcher.close()
+        await prefetcher.close()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert len(fetched) < 100
+        # Prefetched updates are kept until they are drained
+        assert [update.update_id for update in prefetcher.drain()] == [1, 2, 3]
+        assert prefetcher.drain() == []
+        assert prefetcher.metrics.pending == 0
+
+    async def test_close_not_started(self):
+        source = make_source(1, [])
+        await UpdatesPrefetcher(source, queue_size=3).close()
@@ -0,0 +1,27 @@
+import json
+
+from aiogram.dispatcher.raw import GetRawUpdates, RawUpdate
+from tests.mocked_bot import MockedBot
+
+RAW_MESSAGE = {
+    "message_id": 42,
+    "date": 1700000000,
+    "chat": {"id": 42, "type": "private"},
+    "text": "test",
+}
+
+
+class TestGetRawUpdates:
+    def test_updates_are_not_deserialized(self, bot: MockedBot):
+        content = json.dumps({"ok": True, "result": [{"update_id": 1, "message": RAW_MESSAGE}]})
+        response = bot.session.check_response(
+            bot=bot,
+            method=GetRawUpdates(),
+            status_code=200,
+            content=content,
+        )
+        assert len(response.result) == 1
+        update = response.result[0]
+        assert isinstance(update, RawUpdate)
+        assert update.update_id == 1
+        assert update.to_dict() == {"update_id": 1, "message": RAW_MESSAGE}
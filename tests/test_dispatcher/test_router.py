@@ -184,3 +184,133 @@ class TestRouter:
         assert await r1.propagate_event(update_type="custom-event", event=None) is None
         assert await r2.propagate_event(update_type="custom-event", event=None) is UNHANDLED
         assert await r3.propagate_event(update_type="custom-event", event=None) is None
+
+    async def test_dispatch_plan_is_reused(self):
+        r1 = Router()
+        r2 = Router()
+        r1.include_router(r2)
+
+        async def handler(evt):
+            return evt
+
+        r2.message.register(handler)
+        r1.compile_dispatch_plan()
+
+        plan = r1._dispatch_plan["message"]
+        chains = dict(r2.message._middleware_chains)
+        assert chains
+
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+        assert r1._dispatch_plan["message"] is plan
+        assert r2.message._middleware_chains == chains
+
+    async def test_dispatch_plan_compile_only_specified_types(self):
+        router = Router()
+        router.compile_dispatch_plan(update_types=["message"])
+        assert set(router._dispatch_plan) == {"message"}
+
+    async def test_dispatch_plan_invalidated_by_middleware(self):
+        r1 = Router()
+        r2 = Router()
+        r1.include_router(r2)
+        calls = []
+
+        async def handler(evt):
+            return evt
+
+        r2.message.register(handler)
+        r1.compile_dispatch_plan()
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+
+        @r1.message.middleware()
+        async def inner_middleware(h, event, data):
+            calls.append("inner")
+            return await h(event, data)
+
+        @r1.message.outer_middleware()
+        async def outer_middleware(h, event, data):
+            calls.append("outer")
+            return await h(event, data)
+
+        assert not r1._dispatch_plan
+        assert not r2.message._middleware_chains
+
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+        assert calls == ["outer", "inner"]
+
+        r1.message.middleware.unregister(inner_middleware)
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+        assert calls == ["outer", "inner", "outer"]
+
+    async def test_dispatch_plan_invalidated_by_include_router(self):
+        r1 = Router()
+        r2 = Router()
+        calls = []
+
+        async def handler(evt):
+            return evt
+
+        @r1.message.middleware()
+        async def inner_middleware(h, event, data):
+            calls.append("inner")
+            return await h(event, data)
+
+        r2.message.register(handler)
+        assert await r2.propagate_event(update_type="message", event=42) == 42
+        assert not calls
+
+        r1.include_router(r2)
+        assert not r2._dispatch_plan
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+        assert calls == ["inner"]
+
+    async def test_skip_routers_without_handlers(self):
+        r1 = Router(name="Router 1")
+        r2_1 = Router(name="Router 2-1")
+        r2_2 = Router(name="Router 2-2")
+        r3 = Router(name="Router 3")
+        r1.include_routers(r2_1, r2_2)
+        r2_1.include_router(r3)
+        calls = []
+
+        async def handler(evt):
+            return evt
+
+        for router in (r2_1, r2_2, r3):
+
+            @router.message.outer_middleware()
+            async def outer_middleware(h, event, data):
+                calls.append(data["event_router"].name)
+                return await h(event, data)
+
+        r2_2.callback_query.register(handler)
+        r3.message.register(handler)
+
+        assert r1._resolve_update_types_index() == {"message", "callback_query"}
+        assert r1._resolve_sub_routers("message") == (r2_1,)
+        assert r1._resolve_sub_routers("callback_query") == (r2_2,)
+        assert r1._resolve_sub_routers("poll") == ()
+
+        assert await r1.propagate_event(update_type="message", event=42) == 42
+        assert calls == ["Router 2-1", "Router 3"]
+
+        calls.clear()
+        assert await r1.propagate_event(update_type="poll", event=42) is UNHANDLED
+        assert calls == []
+
+    async def test_update_types_index_invalidation(self):
+        r1 = Router()
+        r2 = Router()
+        r3 = Router()
+        r1.include_router(r2)
+
+        async def handler(evt):
+            return evt
+
+        assert await r1.propagate_event(update_type="message", event=42) is UNHANDLED
+        assert r1._resolve_sub_routers("message") == ()
+
+        r2.include_router(r3)
+        r3.message.register(handler)
+        assert r1._resolve_sub_routers("message") == (r2,)
+        assert await r1.propagate_event(update_type="message", event=42) == 42
@@ -0,0 +1,132 @@
+import asyncio
+import datetime
+
+import pytest
+
+from aiogram.dispatcher.worker_pool import ShardedWorkerPool
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+
+def make_message_update(update_id: int, chat_id: int) -> Update:
+    return Update(
+        update_id=update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.datetime.now(),
+            chat=Chat(id=chat_id, type="private"),
+            from_user=User(id=chat_id, is_bot=False, first_name="Test"),
+            text="test",
+        ),
+    )
+
+
+class TestShardedWorkerPool:
+    @pytest.mark.parametrize(
+        "workers,queue_size,message",
+        [
+            (0, 10, "Workers count should be greater than 0"),
+            (1, 0, "Queue size should be greater than 0"),
+        ],
+    )
+    def test_invalid_params(self, workers: int, queue_size: int, message: str):
+        async def processor(update: Update):
+            pass
+
+        with pytest.raises(ValueError, match=message):
+            ShardedWorkerPool(processor, workers=workers, queue_size=queue_size)
+
+    def test_resolve_key(self):
+        assert ShardedWorkerPool.resolve_key(make_message_update(1, chat_id=-42)) == -42
+        assert (
+            ShardedWorkerPool.resolve_key(
+                Update(
+                    update_id=1,
+                    callback_query=CallbackQuery(
+                        id="test",
+                        from_user=User(id=42, is_bot=False, first_name="Test"),
+                        chat_instance="test",
+                    ),
+                )
+            )
+            == 42
+        )
+        assert ShardedWorkerPool.resolve_key(Update(update_id=1)) == 1
+
+    async def test_put_not_started(self):
+        async def processor(update: Update):
+            pass
+
+        pool = ShardedWorkerPool(processor, workers=1)
+        with pytest.raises(RuntimeError, match="Worker pool is not started"):
+            await pool.put(Update(update_id=1))
+
+    async def test_start_twice(self):
+        async def processor(update: Update):
+            pass
+
+        pool = ShardedWorkerPool(processor, workers=1)
+        pool.start()
+        try:
+            with pytest.raises(RuntimeError, match="Worker pool is already started"):
+                pool.start()
+        finally:
+            await pool.close()
+        assert not pool.is_running
+
+    async def test_order_per_chat(self):
+        processed: list[tuple[int, int]] = []
+
+        async def processor(update: Update):
+            # Earlier updates are slower, so the order will be broken without sharding
+            await asyncio.sleep(0.001 * (10 - update.update_id % 10))
+            processed.append((update.message.chat.id, update.update_id))
+
+        pool = ShardedWorkerPool(processor, workers=3, queue_size=2)
+        pool.start()
+        for update_id in range(30):
+            await pool.put(make_message_update(update_id, chat_id=update_id % 5))
+        await pool.close()
+
+        assert len(processed) == 30
+        for chat_id in range(5):
+            chat_updates = [update_id for chat, update_id in processed if chat == chat_id]
+            assert chat_updates == sorted(chat_updates)
+
+    async def test_backpressure(self):
+        release = asyncio.Event()
+
+        async def processor(update: Update):
+            await release.wait()
+
+        pool = ShardedWorkerPool(processor, workers=1, queue_size=1)
+        pool.start()
+        await pool.put(make_message_update(1, chat_id=1))  # Taken by the worker
+        await asyncio.sleep(0)
+        await pool.put(make_message_update(2, chat_id=1))  # Waiting in the queue
+        assert pool.pending == 1
+
+        put = asyncio.create_task(pool.put(make_message_update(3, chat_id=1)))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+
+        release.set()
+        await put
+        await pool.close()
+        assert pool.pending == 0
+
+    async def test_processor_exception(self, caplog):
+        processed = []
+
+        async def processor(update: Update):
+            if update.update_id == 1:
+                raise RuntimeError("Kaboom!")
+            processed.append(update.update_id)
+
+        pool = ShardedWorkerPool(processor, workers=1)
+        pool.start()
+        await pool.put(make_message_update(1, chat_id=1))
+        await pool.put(make_message_update(2, chat_id=1))
+        await pool.close()
+
+        assert processed == [2]
+        assert "Failed to process update id=1 in the worker" in caplog.text
@@ -0,0 +1,202 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.cached import BaseCacheInvalidator, CachedStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+
+STORAGE_KEY = StorageKey(bot_id=1, chat_id=1, user_id=1)
+OTHER_KEY = StorageKey(bot_id=1, chat_id=2, user_id=2)
+
+
+class FakeInvalidator(BaseCacheInvalidator):
+    """
+    Delivers the notifications to the other invalidators of the same bus
+    """
+
+    def __init__(self, bus: list["FakeInvalidator"]) -> None:
+        self.bus = bus
+        self.callback = None
+        self.published = []
+
+    async def start(self, callback):
+        self.callback = callback
+        self.bus.append(self)
+
+    async def publish(self, key):
+        self.published.append(key)
+        for invalidator in self.bus:
+            if invalidator is not self:
+                invalidator.callback(key)
+
+    async def close(self):
+        self.bus.remove(self)
+
+
+def _make_storage(**kwargs) -> tuple[CachedStorage, MemoryStorage]:
+    backend = MemoryStorage()
+    backend.get_state_and_data = AsyncMock(wraps=backend.get_state_and_data)
+    return CachedStorage(backend, **kwargs), backend
+
+
+class TestCachedStorage:
+    async def test_reads_are_cached(self):
+        storage, backend = _make_storage()
+        await backend.set_state_and_data(STORAGE_KEY, "state", {"foo": "bar"})
+
+        assert await storage.get_state(STORAGE_KEY) == "state"
+        assert await storage.get_data(STORAGE_KEY) == {"foo": "bar"}
+        assert await storage.get_value(STORAGE_KEY, "foo") == "bar"
+        assert await storage.get_state_and_data(STORAGE_KEY) == ("state", {"foo": "bar"})
+        backend.get_state_and_data.assert_awaited_once()
+
+        stats = storage.get_stats()
+        assert stats.size == 1
+        assert stats.hits == 3
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.75
+
+    async def test_returned_data_is_copied(self):
+        storage, _ = _make_storage()
+        await storage.set_data(STORAGE_KEY, {"foo": "bar"})
+
+        data = await storage.get_data(STORAGE_KEY)
+        data["foo"] = "baz"
+
+        assert await storage.get_data(STORAGE_KEY) == {"foo": "bar"}
+
+    async def test_writes_update_cache(self):
+        storage, backend = _make_storage()
+        await storage.get_state_and_data(STORAGE_KEY)
+
+        await storage.set_state(STORAGE_KEY, State(state="state"))
+        await storage.set_data(STORAGE_KEY, {"foo": "bar"})
+        assert await storage.update_data(STORAGE_KEY, {"baz": 1}) == {"foo": "bar", "baz": 1}
+
+        assert await storage.get_state_and_data(STORAGE_KEY) == (
+            "@:state",
+            {"foo": "bar", "baz": 1},
+        )
+        assert await backend.get_state_and_data(STORAGE_KEY) == (
+            "@:state",
+            {"foo": "bar", "baz": 1},
+        )
+        assert backend.get_state_and_data.await_count == 2
+
+    async def test_set_state_and_data_caches_record(self):
+        storage, backend = _make_storage()
+
+        await storage.set_state_and_data(STORAGE_KEY, "state", {"foo": "bar"})
+
+        assert await storage.get_state_and_data(STORAGE_KEY) == ("state", {"foo": "bar"})
+        backend.get_state_and_data.assert_not_called()
+
+    async def test_failed_write_drops_record(self):
+        storage, backend = _make_storage()
+        await storage.get_state(STORAGE_KEY)
+        backend.set_state = AsyncMock(side_effect=ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            await storage.set_state(STORAGE_KEY, "state")
+
+        assert storage.get_stats().size == 0
+
+    async def test_ttl(self):
+        storage, backend = _make_storage(ttl=10)
+
+        with patch("time.monotonic", return_value=100.0):
+            await storage.get_state(STORAGE_KEY)
+        with patch("time.monotonic", return_value=109.0):
+            await storage.get_state(STORAGE_KEY)
+        assert backend.get_state_and_data.await_count == 1
+
+        with patch("time.monotonic", return_value=110.0):
+            await storage.get_state(STORAGE_KEY)
+        assert backend.get_state_and_data.await_count == 2
+
+    async def test_lru(self):
+        storage, _ = _make_storage(max_size=2)
+        third_key = StorageKey(bot_id=1, chat_id=3, user_id=3)
+
+        await storage.get_state(STORAGE_KEY)
+        await storage.get_state(OTHER_KEY)
+        await storage.get_state(STORAGE_KEY)
+        await storage.get_state(third_key)
+
+        assert list(storage._cache) == [STORAGE_KEY, third_key]
+        assert storage.get_stats().evictions == 1
+
+    async def test_changed_while_loading(self):
+        storage, backend = _make_storage()
+        loading = asyncio.Event()
+        loaded = asyncio.Event()
+
+        async def slow_get_state_and_data(key):
+            result = await MemoryStorage.get_state_and_data(backend, key)
+            loading.set()
+            await loaded.wait()
+            return result
+
+        backend.get_state_and_data = slow_get_state_and_data
+        reader = asyncio.create_task(storage.get_state(STORAGE_KEY))
+        await loading.wait()
+        storage.invalidate(OTHER_KEY)
+        loaded.set()
+
+        # Read result is returned, but not cached as it could be stale
+        assert await reader is None
+        assert storage.get_stats().size == 0
+
+    async def test_invalidation(self):
+        bus = []
+        backend = MemoryStorage()
+        first = CachedStorage(backend, invalidator=FakeInvalidator(bus))
+        second = CachedStorage(backend, invalidator=FakeInvalidator(bus))
+
+        assert await second.get_state(STORAGE_KEY) is None
+        await first.set_state(STORAGE_KEY, "state")
+
+        assert first.invalidator.published == [STORAGE_KEY]
+        assert await second.get_state(STORAGE_KEY) == "state"
+        assert second.get_stats().invalidations == 1
+        assert first.get_stats().invalidations == 0
+
+        await first.close()
+        assert bus == [second.invalidator]
+
+    async def test_invalidate_all(self):
+        storage, _ = _make_storage()
+        await storage.get_state(STORAGE_KEY)
+        await storage.get_state(OTHER_KEY)
+
+        storage.invalidate(STORAGE_KEY)
+        assert storage.get_stats().size == 1
+
+        storage.invalidate()
+        assert storage.get_stats().size == 0
+
+    async def test_failed_invalidator_start_is_retried(self):
+        invalidator = FakeInvalidator([])
+        invalidator.start = AsyncMock(side_effect=[ConnectionError, None])
+        storage = CachedStorage(MemoryStorage(), invalidator=invalidator)
+
+        with pytest.raises(ConnectionError):
+            await storage.get_state(STORAGE_KEY)
+        await storage.get_state(STORAGE_KEY)
+        await storage.get_state(STORAGE_KEY)
+
+        assert invalidator.start.await_count == 2
+
+    async def test_failed_publish_is_logged(self, caplog):
+        invalidator = FakeInvalidator([])
+        invalidator.publish = AsyncMock(side_effect=ConnectionError)
+        storage = CachedStorage(MemoryStorage(), invalidator=invalidator)
+
+        await storage.set_state(STORAGE_KEY, "state")
+
+        assert await storage.get_state(STORAGE_KEY) == "state"
+        assert await storage.storage.get_state(STORAGE_KEY) == "state"
+        assert "Failed to publish the FSM cache invalidation" in caplog.text
@@ -1,8 +1,10 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from aiogram.fsm.storage.base import BaseEventIsolation, StorageKey
+from aiogram.fsm.storage.memory import SimpleEventIsolation
 from aiogram.fsm.storage.redis import RedisEventIsolation, RedisStorage
 
 
@@ -59,3 +61,87 @@ class TestRedisEventIsolation:
 
         # close is not called because connection should be closed from the storage
         # assert isolation.redis.close.called_once()
+
+
+class TestSimpleEventIsolation:
+    async def test_unused_locks_are_removed(self, storage_key: StorageKey):
+        isolation = SimpleEventIsolation()
+        events = []
+
+        async def handle(name: str, delay: float):
+            async with isolation.lock(key=storage_key):
+                events.append(f"{name} start")
+                await asyncio.sleep(delay)
+                events.append(f"{name} end")
+
+        first = asyncio.create_task(handle("first", 0.01))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(handle("second", 0))
+        await asyncio.sleep(0)
+        assert isolation.get_stats().locks == 1
+
+        await asyncio.gather(first, second)
+
+        assert events == ["first start", "first end", "second start", "second end"]
+        assert not isolation._locks
+
+    async def test_cancelled_waiter(self, storage_key: StorageKey):
+        isolation = SimpleEventIsolation()
+
+        async with isolation.lock(key=storage_key):
+            waiter = asyncio.create_task(isolation.lock(key=storage_key).__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            assert isolation._locks[storage_key].users == 1
+
+        assert not isolation._locks
+
+    async def test_striped(self):
+        isolation = SimpleEventIsolation(stripes=4)
+        keys = [StorageKey(bot_id=42, chat_id=chat_id, user_id=chat_id) for chat_id in range(100)]
+
+        for key in keys:
+            async with isolation.lock(key=key):
+                pass
+
+        assert isolation.get_stats().locks == 4
+        assert isolation.get_stats().acquired == 100
+        assert not isolation._locks
+
+    async def test_contention_stats(self, storage_key: StorageKey):
+        isolation = SimpleEventIsolation()
+        other_key = StorageKey(bot_id=42, chat_id=1, user_id=1)
+
+        async def handle(key: StorageKey):
+            async with isolation.lock(key=key):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(handle(storage_key) for _ in range(3)), handle(other_key))
+
+        stats = isolation.get_stats()
+        assert stats.locks == 0
+        assert stats.acquired == 4
+        assert stats.contended == 2
+        assert stats.contention_rate == 0.5
+        assert stats.wait_time >= 0.03
+        assert stats.max_wait_time >= 0.02
+
+        (hot_key,) = isolation.get_hot_keys()
+        assert hot_key.key == storage_key
+        assert hot_key.contended == 2
+        assert hot_key.wait_time == stats.wait_time
+
+    async def test_max_tracked_keys(self):
+        isolation = SimpleEventIsolation(max_tracked_keys=2)
+        for chat_id in range(3):
+            isolation._record_wait(chat_id, chat_id + 1)
+
+        assert [item.key for item in isolation.get_hot_keys()] == [2, 1]
+        assert isolation.get_hot_keys(limit=1)[0].wait_time == 3
+        assert isolation.get_stats().contended == 3
+
+        isolation = SimpleEventIsolation(max_tracked_keys=0)
+        isolation._record_wait(1, 1.0)
+        assert isolation.get_hot_keys() == []
+        assert isolation.get_stats().wait_time == 1.0
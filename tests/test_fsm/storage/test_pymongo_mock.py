@@ -6,13 +6,14 @@ from aiogram.exceptions import DataNotDictLikeError
 from aiogram.fsm.state import State
 from aiogram.fsm.storage.base import StorageKey
 from aiogram.fsm.storage.pymongo import PyMongoStorage
+from aiogram.fsm.storage.serializer import JsonSerializer
 
 STORAGE_KEY = StorageKey(bot_id=1, chat_id=1, user_id=1)
 
 
-def _make_storage() -> PyMongoStorage:
+def _make_storage(**kwargs) -> PyMongoStorage:
     client_mock = MagicMock()
-    storage = PyMongoStorage(client=client_mock)
+    storage = PyMongoStorage(client=client_mock, **kwargs)
     storage._collection = AsyncMock()
     return storage
 
@@ -126,3 +127,83 @@ class TestPyMongoStorageMock:
         result = await storage.update_data(key=STORAGE_KEY, data={"foo": "bar"})
         assert result == {}
         storage._collection.delete_one.assert_called_once()
+
+    async def test_get_state_and_data(self):
+        storage = _make_storage()
+        storage._collection.find_one.return_value = None
+        assert await storage.get_state_and_data(key=STORAGE_KEY) == (None, {})
+
+        storage._collection.find_one.return_value = {"_id": "id", "state": "s", "data": {"a": 1}}
+        assert await storage.get_state_and_data(key=STORAGE_KEY) == ("s", {"a": 1})
+        assert storage._collection.find_one.await_count == 2
+
+    async def test_set_state_and_data(self):
+        storage = _make_storage()
+        await storage.set_state_and_data(
+            key=STORAGE_KEY,
+            state=State(state="my_state"),
+            data={"a": 1},
+        )
+        storage._collection.replace_one.assert_awaited_once_with(
+            {"_id": "fsm:1:1"},
+            {"state": "@:my_state", "data": {"a": 1}},
+            upsert=True,
+        )
+
+        storage._collection.replace_one.reset_mock()
+        await storage.set_state_and_data(key=STORAGE_KEY, state="s", data={})
+        storage._collection.replace_one.assert_awaited_once_with(
+            {"_id": "fsm:1:1"},
+            {"state": "s"},
+            upsert=True,
+        )
+
+    async def test_set_state_and_data_empty_deletes_doc(self):
+        storage = _make_storage()
+        await storage.set_state_and_data(key=STORAGE_KEY, state=None, data={})
+        storage._collection.delete_one.assert_awaited_once_with({"_id": "fsm:1:1"})
+        storage._collection.replace_one.assert_not_called()
+
+    async def test_set_state_and_data_invalid_type(self):
+        storage = _make_storage()
+        with pytest.raises(DataNotDictLikeError):
+            await storage.set_state_and_data(key=STORAGE_KEY, state=None, data=())
+
+    async def test_serializer(self):
+        storage = _make_storage(serializer=JsonSerializer())
+
+        await storage.set_data(key=STORAGE_KEY, data={"foo": "bar"})
+        storage._collection.update_one.assert_awaited_once_with(
+            filter={"_id": "fsm:1:1"},
+            update={"$set": {"data": b'{"foo": "bar"}'}},
+            upsert=True,
+        )
+
+        await storage.set_state_and_data(key=STORAGE_KEY, state="s", data={"a": 1})
+        storage._collection.replace_one.assert_awaited_once_with(
+            {"_id": "fsm:1:1"},
+            {"state": "s", "data": b'{"a": 1}'},
+            upsert=True,
+        )
+
+        storage._collection.find_one.return_value = {"state": "s", "data": b'{"a": 1}'}
+        assert await storage.get_data(key=STORAGE_KEY) == {"a": 1}
+        assert await storage.get_state_and_data(key=STORAGE_KEY) == ("s", {"a": 1})
+
+        # Documents written without the serializer are still readable
+        storage._collection.find_one.return_value = {"data": {"a": 2}}
+        assert await storage.get_data(key=STORAGE_KEY) == {"a": 2}
+
+    async def test_serializer_update_data(self):
+        storage = _make_storage(serializer=JsonSerializer())
+        storage._collection.find_one.return_value = {"data": b'{"a": 1}'}
+
+        result = await storage.update_data(key=STORAGE_KEY, data={"b": 2})
+
+        assert result == {"a": 1, "b": 2}
+        storage._collection.find_one_and_update.assert_not_called()
+        storage._collection.update_one.assert_awaited_once_with(
+            filter={"_id": "fsm:1:1"},
+            update={"$set": {"data": b'{"a": 1, "b": 2}'}},
+            upsert=True,
+        )
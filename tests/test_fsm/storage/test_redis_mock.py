@@ -1,11 +1,21 @@
+import asyncio
+import dataclasses
+import datetime
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from aiogram.exceptions import DataNotDictLikeError
 from aiogram.fsm.state import State
-from aiogram.fsm.storage.base import StorageKey
-from aiogram.fsm.storage.redis import RedisEventIsolation, RedisStorage
+from aiogram.fsm.storage.base import DefaultKeyBuilder, KeyBuilder, StorageKey
+from aiogram.fsm.storage.redis import (
+    RedisCacheInvalidator,
+    RedisEventIsolation,
+    RedisHashStorage,
+    RedisStorage,
+)
+from aiogram.fsm.storage.serializer import CompressedSerializer
 
 STORAGE_KEY = StorageKey(bot_id=1, chat_id=1, user_id=1)
 
@@ -115,6 +125,264 @@ class TestRedisStorageMock:
         result = await storage.get_value(storage_key=STORAGE_KEY, dict_key="missing", default="x")
         assert result == "x"
 
+    @pytest.mark.parametrize(
+        "values,expected",
+        [
+            [[None, None], (None, {})],
+            [[b"state", b'{"foo": "bar"}'], ("state", {"foo": "bar"})],
+            [["state", '{"foo": "bar"}'], ("state", {"foo": "bar"})],
+        ],
+    )
+    async def test_get_state_and_data(self, values, expected):
+        redis_mock = AsyncMock()
+        redis_mock.mget.return_value = values
+        storage = RedisStorage(redis=redis_mock)
+
+        assert await storage.get_state_and_data(key=STORAGE_KEY) == expected
+        redis_mock.mget.assert_awaited_once_with("fsm:1:1:state", "fsm:1:1:data")
+        redis_mock.get.assert_not_called()
+
+    async def test_set_state_and_data(self):
+        redis_mock = MagicMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis_mock.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis_mock.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+        storage = RedisStorage(redis=redis_mock, state_ttl=10, data_ttl=20)
+
+        await storage.set_state_and_data(
+            key=STORAGE_KEY,
+            state=State(state="my_state"),
+            data={"foo": "bar"},
+        )
+        redis_mock.pipeline.assert_called_once_with(transaction=True)
+        pipe.set.assert_any_call("fsm:1:1:state", "@:my_state", ex=10)
+        pipe.set.assert_any_call("fsm:1:1:data", b'{"foo": "bar"}', ex=20)
+        pipe.execute.assert_awaited_once()
+
+        pipe.reset_mock()
+        await storage.set_state_and_data(key=STORAGE_KEY, state=None, data={})
+        pipe.delete.assert_any_call("fsm:1:1:state")
+        pipe.delete.assert_any_call("fsm:1:1:data")
+        pipe.set.assert_not_called()
+
+    async def test_serializer(self):
+        redis_mock = AsyncMock()
+        serializer = CompressedSerializer(codec="zlib", threshold=10)
+        storage = RedisStorage(redis=redis_mock, serializer=serializer)
+        data = {"foo": "bar" * 100}
+
+        await storage.set_data(key=STORAGE_KEY, data=data)
+        stored = redis_mock.set.call_args.args[1]
+        assert stored == serializer.dumps(data)
+        assert len(stored) < len(str(data))
+
+        redis_mock.get.return_value = stored
+        assert await storage.get_data(key=STORAGE_KEY) == data
+
+        # Uncompressed records are read as is, also when the responses are decoded to str
+        redis_mock.get.return_value = '{"foo": "bar"}'
+        assert await storage.get_data(key=STORAGE_KEY) == {"foo": "bar"}
+
+    async def test_json_dumps_returns_bytes(self):
+        orjson = pytest.importorskip("orjson")
+        redis_mock = AsyncMock()
+        storage = RedisStorage(redis=redis_mock, json_dumps=orjson.dumps, json_loads=orjson.loads)
+
+        await storage.set_data(key=STORAGE_KEY, data={"foo": "bar"})
+        redis_mock.set.assert_awaited_once_with("fsm:1:1:data", b'{"foo":"bar"}', ex=None)
+
+        redis_mock.get.return_value = b'{"foo":"bar"}'
+        assert await storage.get_data(key=STORAGE_KEY) == {"foo": "bar"}
+
+    async def test_set_state_and_data_invalid_type(self):
+        storage = RedisStorage(redis=AsyncMock())
+        with pytest.raises(DataNotDictLikeError):
+            await storage.set_state_and_data(key=STORAGE_KEY, state=None, data=())
+
+
+def _make_pipeline(redis_mock: MagicMock, results: list | None = None) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    redis_mock.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis_mock.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+def _make_hash_storage(**kwargs) -> tuple[RedisHashStorage, AsyncMock, AsyncMock]:
+    redis_mock = AsyncMock()
+    script = AsyncMock()
+    redis_mock.register_script = MagicMock(return_value=script)
+    redis_mock.pipeline = MagicMock()
+    return RedisHashStorage(redis=redis_mock, **kwargs), redis_mock, script
+
+
+class TestRedisHashStorageMock:
+    def test_from_url(self):
+        with (
+            patch("redis.asyncio.connection.ConnectionPool.from_url") as mock_pool,
+            patch("redis.asyncio.client.Redis.register_script"),
+        ):
+            storage = RedisHashStorage.from_url("redis://localhost:6379/0", ttl=10)
+            assert isinstance(storage, RedisHashStorage)
+            assert storage.ttl == 10
+            mock_pool.assert_called_once_with("redis://localhost:6379/0")
+
+    def test_create_isolation(self):
+        storage, redis_mock, _ = _make_hash_storage()
+        isolation = storage.create_isolation()
+        assert isinstance(isolation, RedisEventIsolation)
+        assert isolation.redis is redis_mock
+
+    async def test_close(self):
+        storage, redis_mock, _ = _make_hash_storage()
+        await storage.close()
+        redis_mock.aclose.assert_called_once_with(close_connection_pool=True)
+
+    async def test_set_state(self):
+        storage, redis_mock, _ = _make_hash_storage(ttl=datetime.timedelta(minutes=1))
+        pipe = _make_pipeline(redis_mock)
+
+        await storage.set_state(key=STORAGE_KEY, state=State(state="my_state"))
+        pipe.hset.assert_called_once_with("fsm:1:1", "state", "@:my_state")
+        pipe.expire.assert_called_once_with("fsm:1:1", datetime.timedelta(minutes=1))
+        pipe.execute.assert_awaited_once()
+
+        await storage.set_state(key=STORAGE_KEY, state=None)
+        redis_mock.hdel.assert_awaited_once_with("fsm:1:1", "state")
+
+    @pytest.mark.parametrize("value,expected", [[None, None], [b"state", "state"], ["s", "s"]])
+    async def test_get_state(self, value, expected):
+        storage, redis_mock, _ = _make_hash_storage()
+        redis_mock.hget.return_value = value
+        assert await storage.get_state(key=STORAGE_KEY) == expected
+        redis_mock.hget.assert_awaited_once_with("fsm:1:1", "state")
+
+    async def test_get_state_and_data(self):
+        storage, redis_mock, _ = _make_hash_storage()
+        redis_mock.hgetall.return_value = {
+            b"state": b"state",
+            b"data:foo": b'"bar"',
+            "data:baz": "[1, 2]",
+            b"unknown": b"value",
+        }
+
+        assert await storage.get_state_and_data(key=STORAGE_KEY) == (
+            "state",
+            {"foo": "bar", "baz": [1, 2]},
+        )
+        assert await storage.get_data(key=STORAGE_KEY) == {"foo": "bar", "baz": [1, 2]}
+        redis_mock.hgetall.assert_awaited_with("fsm:1:1")
+
+    async def test_get_value(self):
+        storage, redis_mock, _ = _make_hash_storage()
+        redis_mock.hget.return_value = b'{"nested": true}'
+        assert await storage.get_value(storage_key=STORAGE_KEY, dict_key="foo") == {"nested": True}
+        redis_mock.hget.assert_awaited_once_with("fsm:1:1", "data:foo")
+
+        redis_mock.hget.return_value = None
+        assert await storage.get_value(storage_key=STORAGE_KEY, dict_key="foo", default=1) == 1
+
+    @pytest.mark.parametrize(
+        "ttl,ttl_seconds",
+        [[None, 0], [30, 30], [datetime.timedelta(minutes=1), 60]],
+    )
+    async def test_set_data(self, ttl, ttl_seconds):
+        storage, _, script = _make_hash_storage(ttl=ttl)
+
+        await storage.set_data(key=STORAGE_KEY, data={"foo": "bar", "baz": 1})
+        script.assert_awaited_once_with(
+            keys=["fsm:1:1"],
+            args=[ttl_seconds, "keep", "", "data:foo", '"bar"', "data:baz", "1"],
+        )
+
+        with pytest.raises(DataNotDictLikeError):
+            await storage.set_data(key=STORAGE_KEY, data=())
+
+    async def test_set_state_and_data(self):
+        storage, _, script = _make_hash_storage()
+
+        await storage.set_state_and_data(key=STORAGE_KEY, state="state", data={"foo": "bar"})
+        script.assert_awaited_with(
+            keys=["fsm:1:1"],
+            args=[0, "set", "state", "data:foo", '"bar"'],
+        )
+
+        await storage.set_state_and_data(key=STORAGE_KEY, state=None, data={})
+        script.assert_awaited_with(keys=["fsm:1:1"], args=[0, "delete", ""])
+
+    async def test_update_data(self):
+        storage, redis_mock, _ = _make_hash_storage(ttl=10)
+        pipe = _make_pipeline(
+            redis_mock,
+            [1, True, {b"data:foo": b'"bar"', b"data:baz": b'"spam"', b"state": b"s"}],
+        )
+
+        result = await storage.update_data(key=STORAGE_KEY, data={"baz": "spam"})
+        assert result == {"foo": "bar", "baz": "spam"}
+        # Only changed keys are written
+        pipe.hset.assert_called_once_with("fsm:1:1", mapping={"data:baz": '"spam"'})
+        pipe.expire.assert_called_once_with("fsm:1:1", 10)
+        pipe.hgetall.assert_called_once_with("fsm:1:1")
+
+    async def test_update_data_empty(self):
+        storage, redis_mock, _ = _make_hash_storage()
+        redis_mock.hgetall.return_value = {b"data:foo": b'"bar"'}
+
+        assert await storage.update_data(key=STORAGE_KEY, data={}) == {"foo": "bar"}
+        redis_mock.pipeline.assert_not_called()
+
+    async def test_migrate_from_strings(self):
+        storage, redis_mock, _ = _make_hash_storage(ttl=10)
+        keys = [b"fsm:1:1:state", b"fsm:1:1:data", b"fsm:2:2:data", b"fsm:3:3:lock", b"fsm:1:1"]
+
+        async def scan_iter(match, count):
+            assert match == "fsm:*"
+            for key in keys:
+                yield key
+
+        values = {
+            ("fsm:1:1:state", "fsm:1:1:data"): [b"state", b'{"foo": "bar"}'],
+            ("fsm:2:2:state", "fsm:2:2:data"): [None, b'{"baz": 1}'],
+        }
+        redis_mock.scan_iter = scan_iter
+        # Deleted keys are not returned again
+        redis_mock.mget.side_effect = lambda *keys: values.pop(keys, [None, None])
+        pipe = _make_pipeline(redis_mock)
+
+        assert await storage.migrate_from_strings(batch_size=1) == 2
+
+        pipe.hset.assert_any_call("fsm:1:1", mapping={"state": "state", "data:foo": '"bar"'})
+        pipe.hset.assert_any_call("fsm:2:2", mapping={"data:baz": "1"})
+        pipe.expire.assert_any_call("fsm:1:1", 10)
+        pipe.delete.assert_any_call("fsm:1:1:state", "fsm:1:1:data")
+        pipe.delete.assert_any_call("fsm:2:2:state", "fsm:2:2:data")
+
+    async def test_migrate_skips_migrated(self):
+        storage, redis_mock, _ = _make_hash_storage()
+
+        async def scan_iter(match, count):
+            yield b"fsm:1:1:state"
+
+        redis_mock.scan_iter = scan_iter
+        redis_mock.mget.return_value = [None, None]
+
+        assert await storage.migrate_from_strings(delete=False) == 0
+        redis_mock.pipeline.assert_not_called()
+
+    async def test_migrate_custom_key_builder(self):
+        storage, _, _ = _make_hash_storage(key_builder=MagicMock(spec=KeyBuilder))
+        with pytest.raises(TypeError):
+            await storage.migrate_from_strings()
+
+    async def test_custom_key_builder(self):
+        storage, redis_mock, _ = _make_hash_storage(
+            key_builder=DefaultKeyBuilder(prefix="custom", with_bot_id=True),
+        )
+        redis_mock.hget.return_value = None
+        await storage.get_state(key=STORAGE_KEY)
+        redis_mock.hget.assert_awaited_once_with("custom:1:1:1", "state")
+
 
 class TestRedisEventIsolationLockMock:
     async def test_lock(self):
@@ -127,3 +395,96 @@ class TestRedisEventIsolationLockMock:
             pass
 
         redis_mock.lock.assert_called_once()
+
+
+class FakePubSub:
+    def __init__(self, rounds: list[list | Exception]) -> None:
+        self.rounds = rounds
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        messages = self.rounds.pop(0) if self.rounds else []
+        if isinstance(messages, Exception):
+            raise messages
+        for message in messages:
+            yield message
+        if not self.rounds:
+            # Wait for the next messages forever
+            await asyncio.Event().wait()
+
+
+class TestRedisCacheInvalidatorMock:
+    async def test_publish(self):
+        redis_mock = AsyncMock()
+        invalidator = RedisCacheInvalidator(redis=redis_mock, channel="channel")
+
+        await invalidator.publish(STORAGE_KEY)
+
+        channel, payload = redis_mock.publish.call_args.args
+        assert channel == "channel"
+        assert json.loads(payload) == {
+            "node": invalidator.node_id,
+            "key": {
+                "bot_id": 1,
+                "chat_id": 1,
+                "user_id": 1,
+                "thread_id": None,
+                "business_connection_id": None,
+                "destiny": "default",
+            },
+        }
+
+    async def test_listen(self):
+        redis_mock = MagicMock()
+        invalidator = RedisCacheInvalidator(redis=redis_mock, reconnect_delay=0)
+        other_key = StorageKey(bot_id=1, chat_id=2, user_id=3, destiny="scenes")
+
+        def message(node: str, key: StorageKey) -> dict:
+            payload = {"node": node, "key": dataclasses.asdict(key)}
+            return {"type": "message", "data": json.dumps(payload).encode()}
+
+        pubsub = FakePubSub(
+            [
+                [message("other", STORAGE_KEY), message(invalidator.node_id, other_key)],
+                ConnectionError("Connection lost"),
+                [message("other", other_key)],
+            ]
+        )
+        # The first resubscription fails
+        pubsub.subscribe.side_effect = [None, ConnectionError("Connection refused"), None]
+        redis_mock.pubsub.return_value = pubsub
+        received = []
+
+        await invalidator.start(received.append)
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await invalidator.close()
+
+        redis_mock.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+        assert pubsub.subscribe.await_count == 3
+        pubsub.subscribe.assert_awaited_with("fsm:invalidate")
+        # Notifications of this process are ignored, the cache is dropped on the connection error
+        # and again after the subscription is restored
+        assert received == [STORAGE_KEY, None, None, other_key]
+        pubsub.aclose.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not json",
+            b"\xff",
+            b"[]",
+            b"{}",
+            json.dumps({"node": "other"}).encode(),
+            json.dumps({"node": "other", "key": {"unknown": 1}}).encode(),
+        ],
+    )
+    def test_handle_malformed_message(self, payload, caplog):
+        invalidator = RedisCacheInvalidator(redis=MagicMock())
+        received = []
+
+        invalidator._handle(payload, received.append)
+
+        assert received == []
+        assert "Ignoring malformed FSM cache invalidation message" in caplog.text
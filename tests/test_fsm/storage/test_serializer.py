@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from aiogram.fsm.storage.serializer import (
+    CompressedSerializer,
+    JsonSerializer,
+    MsgPackSerializer,
+    OrJsonSerializer,
+)
+
+DATA = {"cart": [{"id": i, "title": f"Product {i}", "price": 9.99} for i in range(50)]}
+
+
+class TestJsonSerializer:
+    def test_roundtrip(self):
+        serializer = JsonSerializer()
+        value = serializer.dumps(DATA)
+
+        assert value == json.dumps(DATA).encode()
+        assert serializer.loads(value) == DATA
+
+    def test_custom_functions(self):
+        serializer = JsonSerializer(
+            loads=lambda value: {"loaded": value},
+            dumps=lambda data: "dumped",
+        )
+
+        assert serializer.dumps(DATA) == b"dumped"
+        assert serializer.loads(b"value") == {"loaded": "value"}
+
+    def test_dumps_returns_bytes(self):
+        serializer = JsonSerializer(dumps=lambda data: b'{"a": 1}')
+
+        assert serializer.dumps({"a": 1}) == b'{"a": 1}'
+
+
+class TestOrJsonSerializer:
+    def test_roundtrip(self):
+        pytest.importorskip("orjson")
+        serializer = OrJsonSerializer()
+        value = serializer.dumps(DATA)
+
+        assert serializer.loads(value) == DATA
+        assert JsonSerializer().loads(value) == DATA
+
+    def test_option(self):
+        orjson = pytest.importorskip("orjson")
+        serializer = OrJsonSerializer(option=orjson.OPT_NON_STR_KEYS)
+
+        assert serializer.loads(serializer.dumps({"key": {1: "value"}})) == {"key": {"1": "value"}}
+
+
+class TestMsgPackSerializer:
+    def test_roundtrip(self):
+        pytest.importorskip("msgpack")
+        serializer = MsgPackSerializer()
+        data = {**DATA, "raw": b"\x00\x01", "ids": {1: "one"}}
+        value = serializer.dumps(data)
+
+        assert len(value) < len(json.dumps(DATA))
+        assert serializer.loads(value) == data
+
+
+class TestCompressedSerializer:
+    @pytest.mark.parametrize(
+        "codec,package",
+        [
+            ["zlib", None],
+            ["zstd", "zstandard"],
+            ["lz4", "lz4"],
+        ],
+    )
+    def test_roundtrip(self, codec, package):
+        if package:
+            pytest.importorskip(package)
+        serializer = CompressedSerializer(codec=codec, threshold=100)
+        value = serializer.dumps(DATA)
+
+        assert len(value) < len(json.dumps(DATA)) / 2
+        assert serializer.loads(value) == DATA
+
+        # Values smaller than the threshold are not compressed
+        assert serializer.dumps({"a": 1}) == b'{"a": 1}'
+        assert serializer.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_incompressible(self):
+        serializer = CompressedSerializer(codec="zlib", threshold=1)
+
+        assert serializer.dumps({"a": 1}) == b'{"a": 1}'
+
+    def test_other_serializer(self):
+        pytest.importorskip("orjson")
+        serializer = CompressedSerializer(OrJsonSerializer(), codec="zlib", level=9)
+
+        assert serializer.loads(serializer.dumps(DATA)) == DATA
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown compression codec"):
+            CompressedSerializer(codec="brotli")  # type: ignore[arg-type]
@@ -8,7 +8,14 @@ from aiogram.fsm.storage.base import BaseStorage, StorageKey
 
 @pytest.mark.parametrize(
     "storage",
-    ["memory_storage", "redis_storage", "mongo_storage", "pymongo_storage"],
+    [
+        "memory_storage",
+        "cached_storage",
+        "redis_storage",
+        "redis_hash_storage",
+        "mongo_storage",
+        "pymongo_storage",
+    ],
     indirect=True,
 )
 class TestStorages:
@@ -80,3 +87,23 @@ class TestStorages:
             "foo": "bar",
             "baz": "test",
         }
+
+    async def test_state_and_data(self, storage: BaseStorage, storage_key: StorageKey):
+        assert await storage.get_state_and_data(key=storage_key) == (None, {})
+
+        await storage.set_state_and_data(key=storage_key, state="state", data={"foo": "bar"})
+        assert await storage.get_state_and_data(key=storage_key) == ("state", {"foo": "bar"})
+        assert await storage.get_state(key=storage_key) == "state"
+        assert await storage.get_data(key=storage_key) == {"foo": "bar"}
+
+        await storage.set_state_and_data(key=storage_key, state=None, data={"foo": "baz"})
+        assert await storage.get_state_and_data(key=storage_key) == (None, {"foo": "baz"})
+
+        await storage.set_state_and_data(key=storage_key, state="state", data={})
+        assert await storage.get_state_and_data(key=storage_key) == ("state", {})
+
+        await storage.set_state_and_data(key=storage_key, state=None, data={})
+        assert await storage.get_state_and_data(key=storage_key) == (None, {})
+
+        with pytest.raises(DataNotDictLikeError):
+            await storage.set_state_and_data(key=storage_key, state=None, data=())
@@ -1,6 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 
-from aiogram.fsm.context import FSMContext
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.context import FSMContext, TransactionalFSMContext
+from aiogram.fsm.state import State
 from aiogram.fsm.storage.base import StorageKey
 from aiogram.fsm.storage.memory import MemoryStorage
 from tests.mocked_bot import MockedBot
@@ -53,3 +57,84 @@ class TestFSMContext:
         assert await state.get_data() == {}
 
         assert await state2.get_state() == "experiments"
+
+
+class TestTransactionalFSMContext:
+    async def test_load_once_and_commit(self, state: FSMContext):
+        storage = state.storage
+        context = TransactionalFSMContext(storage=storage, key=state.key)
+
+        with (
+            patch.object(storage, "get_state_and_data", wraps=storage.get_state_and_data) as load,
+            patch.object(storage, "set_state_and_data", wraps=storage.set_state_and_data) as save,
+        ):
+            assert await context.get_state() == "test"
+            assert await context.get_data() == {"foo": "bar"}
+            assert await context.get_value("foo") == "bar"
+            assert await context.update_data(key="value") == {"foo": "bar", "key": "value"}
+            await context.set_state(State(state="next"))
+
+            assert await context.get_state() == "@:next"
+            assert await context.get_value("key") == "value"
+            assert context.has_changes
+            # Nothing is written before commit
+            assert await state.get_state() == "test"
+            assert await state.get_data() == {"foo": "bar"}
+
+            await context.commit()
+            assert not context.has_changes
+
+        load.assert_awaited_once()
+        save.assert_awaited_once()
+        assert await state.get_state() == "@:next"
+        assert await state.get_data() == {"foo": "bar", "key": "value"}
+
+    async def test_commit_changed_parts(self, state: FSMContext):
+        storage = state.storage
+        context = TransactionalFSMContext(storage=storage, key=state.key)
+
+        with patch.object(storage, "get_state_and_data") as load:
+            await context.commit()
+            await context.set_state("next")
+            assert await context.get_state() == "next"
+            await context.commit()
+        # State is replaced without loading
+        load.assert_not_called()
+        assert await state.get_state() == "next"
+        assert await state.get_data() == {"foo": "bar"}
+
+        await context.set_data({"key": "value"})
+        await context.commit()
+        assert await state.get_state() == "next"
+        assert await state.get_data() == {"key": "value"}
+
+    async def test_changes_kept_on_load(self, state: FSMContext):
+        context = TransactionalFSMContext(storage=state.storage, key=state.key)
+
+        await context.set_data({"key": "value"})
+        assert await context.get_state() == "test"
+        assert await context.get_data() == {"key": "value"}
+
+    async def test_returned_data_is_copy(self, state: FSMContext):
+        context = TransactionalFSMContext(storage=state.storage, key=state.key)
+
+        data = await context.get_data()
+        data["foo"] = "changed"
+        assert await context.get_data() == {"foo": "bar"}
+        assert not context.has_changes
+
+    async def test_clear(self, state: FSMContext):
+        context = TransactionalFSMContext(storage=state.storage, key=state.key)
+
+        await context.clear()
+        assert await context.get_state() is None
+        assert await context.get_data() == {}
+        await context.commit()
+
+        assert await state.get_state() is None
+        assert await state.get_data() == {}
+
+    async def test_set_data_invalid_type(self, state: FSMContext):
+        context = TransactionalFSMContext(storage=state.storage, key=state.key)
+        with pytest.raises(DataNotDictLikeError):
+            await context.set_data(())  # type: ignore[arg-type]
@@ -1,6 +1,13 @@
+from unittest.mock import patch
+
+import pytest
+
+from aiogram.dispatcher.middlewares.user_context import EVENT_CONTEXT_KEY, EventContext
+from aiogram.fsm.context import FSMContext, TransactionalFSMContext
 from aiogram.fsm.middleware import FSMContextMiddleware
 from aiogram.fsm.storage.memory import DisabledEventIsolation, MemoryStorage
 from aiogram.fsm.strategy import FSMStrategy
+from aiogram.types import Chat, User
 from tests.mocked_bot import MockedBot
 
 CHANNEL_ID = -1001234567890
@@ -88,3 +95,98 @@ class TestFSMContextMiddleware:
         )
 
         assert context is None
+
+
+class TestTransactionalMode:
+    @staticmethod
+    def create_data(bot: MockedBot) -> dict:
+        return {
+            "bot": bot,
+            EVENT_CONTEXT_KEY: EventContext(
+                chat=Chat(id=42, type="private"),
+                user=User(id=42, is_bot=False, first_name="Test"),
+            ),
+        }
+
+    async def test_commit_after_handler(self):
+        bot = MockedBot()
+        storage = MemoryStorage()
+        middleware = FSMContextMiddleware(
+            storage=storage,
+            events_isolation=DisabledEventIsolation(),
+            transactional=True,
+        )
+
+        async def handler(event, data):
+            state: FSMContext = data["state"]
+            assert isinstance(state, TransactionalFSMContext)
+            assert data["raw_state"] is None
+            await state.set_state("next")
+            await state.update_data(foo="bar")
+            assert await storage.get_state(state.key) is None
+            return "result"
+
+        with patch.object(storage, "get_state_and_data", wraps=storage.get_state_and_data) as load:
+            assert await middleware(handler, None, self.create_data(bot)) == "result"
+        load.assert_awaited_once()
+
+        context = middleware.get_context(bot=bot, chat_id=42, user_id=42)
+        assert not isinstance(context, TransactionalFSMContext)
+        assert await context.get_state() == "next"
+        assert await context.get_data() == {"foo": "bar"}
+
+    async def test_commit_on_error(self):
+        bot = MockedBot()
+        middleware = FSMContextMiddleware(
+            storage=MemoryStorage(),
+            events_isolation=DisabledEventIsolation(),
+            transactional=True,
+        )
+
+        async def handler(event, data):
+            await data["state"].set_state("next")
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            await middleware(handler, None, self.create_data(bot))
+
+        context = middleware.get_context(bot=bot, chat_id=42, user_id=42)
+        assert await context.get_state() == "next"
+
+    async def test_commit_error_on_handler_error(self, caplog):
+        bot = MockedBot()
+        storage = MemoryStorage()
+        middleware = FSMContextMiddleware(
+            storage=storage,
+            events_isolation=DisabledEventIsolation(),
+            transactional=True,
+        )
+
+        async def handler(event, data):
+            await data["state"].set_state("next")
+            raise ValueError
+
+        with (
+            patch.object(storage, "set_state", side_effect=ConnectionError),
+            pytest.raises(ValueError),
+        ):
+            await middleware(handler, None, self.create_data(bot))
+        assert "Failed to commit the FSM changes" in caplog.text
+
+    async def test_commit_error(self):
+        bot = MockedBot()
+        storage = MemoryStorage()
+        middleware = FSMContextMiddleware(
+            storage=storage,
+            events_isolation=DisabledEventIsolation(),
+            transactional=True,
+        )
+
+        async def handler(event, data):
+            await data["state"].set_state("next")
+
+        with (
+            patch.object(storage, "set_state", side_effect=ConnectionError),
+            pytest.raises(ConnectionError),
+        ):
+            await middleware(handler, None, self.create_data(bot))
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from asyncio import Event
 from dataclasses import dataclass
@@ -132,6 +133,27 @@ class TestSimpleRequestHandler:
         assert result["method"] == "sendMessage"
         assert result["text"] == "PASS"
 
+    async def test_reply_into_webhook_custom_json_loads(self, bot: MockedBot, aiohttp_client):
+        app = Application()
+        dp = Dispatcher()
+        bot.session.json_loads = lambda value: json.loads(value)  # noqa: PLW0108
+
+        @dp.message(F.text == "test")
+        def handle_message(msg: Message):
+            return msg.answer(text="PASS")
+
+        handler = SimpleRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            handle_in_background=False,
+        )
+        handler.register(app, path="/webhook")
+        client: TestClient = await aiohttp_client(app)
+
+        resp = await self.make_reqest(client=client)
+        assert resp.status == 200
+        assert resp.content_type == "multipart/form-data"
+
     async def test_reply_into_webhook_unhandled(self, bot: MockedBot, aiohttp_client):
         app = Application()
         dp = Dispatcher()
@@ -195,6 +217,35 @@ class TestSimpleRequestHandler:
         result = await resp.json()
         assert not result
 
+    @pytest.mark.parametrize("handle_in_background", [True, False])
+    @pytest.mark.parametrize("custom_json_loads", [True, False])
+    @pytest.mark.parametrize("body", [b"not json", b'{"message": {}}'])
+    async def test_invalid_update(
+        self,
+        bot: MockedBot,
+        aiohttp_client,
+        handle_in_background: bool,
+        custom_json_loads: bool,
+        body: bytes,
+    ):
+        if custom_json_loads:
+            bot.session.json_loads = lambda value: json.loads(value)  # noqa: PLW0108
+        app = Application()
+        dp = Dispatcher()
+        handler = SimpleRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            handle_in_background=handle_in_background,
+        )
+        handler.register(app, path="/webhook")
+        client: TestClient = await aiohttp_client(app)
+
+        with patch.object(dp, "feed_update") as mocked_feed_update:
+            resp = await client.post("/webhook", data=body)
+        assert resp.status == 400
+        mocked_feed_update.assert_not_called()
+        assert not handler._background_feed_update_tasks
+
     async def test_verify_secret(self, bot: MockedBot, aiohttp_client):
         app = Application()
         dp = Dispatcher()